@@ -0,0 +1,41 @@
+from core.kernel import collect_timeline, stream_policy
+from core.policy import FairPolicy
+
+NICE_WEIGHTS = (
+    88761, 71755, 56483, 46273, 36291,
+    29154, 23254, 18705, 14949, 11916,
+    9548, 7620, 6100, 4904, 3906,
+    3121, 2501, 1991, 1586, 1277,
+    1024, 820, 655, 526, 423,
+    335, 272, 215, 172, 137,
+    110, 87, 70, 56, 45,
+    36, 29, 23, 18, 15,
+)
+NICE_0_WEIGHT = 1024
+TARGET_LATENCY = 24
+MIN_GRANULARITY = 3
+
+
+def cfs_weight(p):
+    nice = min(max(p.priority, -20), 19)
+    return NICE_WEIGHTS[nice + 20]
+
+
+def cfs_order(p):
+    return p.arrival_time
+
+
+def cfs_policy(target_latency=TARGET_LATENCY, min_granularity=MIN_GRANULARITY,
+               wakeup_granularity=None):
+    return FairPolicy(cfs_weight, NICE_0_WEIGHT, target_latency, min_granularity,
+                      wakeup_granularity)
+
+
+def cfs_stream(process_list, **options):
+    process_list.sort(key=cfs_order)
+
+    return stream_policy(process_list, cfs_policy(**options))
+
+
+def cfs_scheduling(process_list, **options):
+    return collect_timeline(process_list, cfs_stream(process_list, **options))
@@ -0,0 +1,80 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from algorithms.registry import ALGORITHMS, run_algorithm
+from core.metrics import compute_metrics
+from core.process_table import ProcessTable
+
+PARALLEL_THRESHOLD = 5000
+
+_worker_workload = None
+
+
+def _init_worker(workload):
+    global _worker_workload
+    _worker_workload = workload
+
+
+def _compare_one(algorithm_name, quantum, workload=None, keep_results=False):
+    if workload is None:
+        workload = _worker_workload
+    try:
+        result, timeline = run_algorithm(algorithm_name, workload.copy(), quantum)
+    except ValueError as error:
+        if keep_results:
+            return algorithm_name, None, str(error), None
+        return algorithm_name, None, str(error)
+    if keep_results:
+        return algorithm_name, compute_metrics(result), None, (result, timeline)
+    return algorithm_name, compute_metrics(result), None
+
+
+def shutdown_pool(executor, finished):
+    if finished:
+        executor.shutdown(wait=True)
+        return
+    processes = list((executor._processes or {}).values())
+    executor.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.terminate()
+    for process in processes:
+        process.join()
+
+
+def iter_comparison(workload, algorithms=None, quantum=None, max_workers=None,
+                    keep_results=False):
+    if not isinstance(workload, ProcessTable):
+        workload = ProcessTable.from_processes(workload)
+    algorithms = list(algorithms or ALGORITHMS)
+    workers = max_workers or min(len(algorithms), os.cpu_count() or 1)
+
+    if workers == 1 or len(workload) < PARALLEL_THRESHOLD:
+        for algorithm_name in algorithms:
+            yield _compare_one(algorithm_name, quantum, workload, keep_results)
+        return
+
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(workload,),
+    )
+    finished = False
+    try:
+        futures = [
+            executor.submit(_compare_one, algorithm_name, quantum, None, keep_results)
+            for algorithm_name in algorithms
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+        finished = True
+    finally:
+        shutdown_pool(executor, finished)
+
+
+def compare(workload, algorithms=None, quantum=None, max_workers=None):
+    order = {name: index for index, name in enumerate(algorithms or ALGORITHMS)}
+    rows = list(iter_comparison(workload, algorithms, quantum, max_workers))
+    rows.sort(key=lambda row: order[row[0]])
+    return rows
@@ -0,0 +1,129 @@
+import math
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+
+from algorithms.comparison import shutdown_pool
+from algorithms.registry import ALGORITHMS, QUANTUM_ALGORITHMS, stream_algorithm
+from core.metrics import STAT_FIELDS, RunningStats, stream_metrics
+from core.workloads import generate_workload
+
+TRIAL_CHUNK = 16
+EXPERIMENT_METRICS = [*STAT_FIELDS, "idle_time", "cpu_util", "completion_time"]
+TRIAL_FIELDS = ["trial", "kind", "size", "algorithm", "quantum", *EXPERIMENT_METRICS]
+EXPERIMENT_SUMMARY_FIELDS = [
+    "algorithm",
+    "metric",
+    "trials",
+    "mean",
+    "stdev",
+    "ci_low",
+    "ci_high",
+    "min",
+    "max",
+]
+
+
+def trial_workload(kind, size, seed, trial, params=None):
+    return generate_workload(kind, size, seed=f"{seed}/{trial}", **(params or {}))
+
+
+def run_trials(start, stop, kind, size, seed, params, algorithms, quantum):
+    records = []
+    for trial in range(start, stop):
+        workload = trial_workload(kind, size, seed, trial, params)
+        for algorithm_name in algorithms:
+            tq = quantum if algorithm_name in QUANTUM_ALGORITHMS else None
+            metrics = stream_metrics(stream_algorithm(algorithm_name, workload.copy(), tq))
+            records.append({
+                "trial": trial,
+                "kind": kind,
+                "size": size,
+                "algorithm": algorithm_name,
+                "quantum": tq,
+                **metrics,
+            })
+    return records
+
+
+def iter_experiment(trials, kind, size, algorithms=None, quantum=3, seed=0, params=None,
+                    max_workers=None, progress=None):
+    if trials < 1:
+        raise ValueError("Trials must be a positive integer")
+    algorithms = list(algorithms or ALGORITHMS)
+    params = dict(params or {})
+    try:
+        trial_workload(kind, 1, seed, 0, params)
+    except TypeError:
+        raise ValueError(f"Unsupported parameters for {kind} workloads: {', '.join(params)}")
+    chunks = [(start, min(start + TRIAL_CHUNK, trials)) for start in range(0, trials, TRIAL_CHUNK)]
+    workers = max_workers or min(len(chunks), os.cpu_count() or 1)
+    args = (kind, size, seed, params, algorithms, quantum)
+
+    if workers <= 1:
+        for start, stop in chunks:
+            yield from run_trials(start, stop, *args)
+            if progress is not None:
+                progress(stop, trials)
+        return
+
+    executor = ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+    finished = False
+    try:
+        pending = deque()
+        chunks = iter(chunks)
+        for start, stop in chunks:
+            pending.append((stop, executor.submit(run_trials, start, stop, *args)))
+            if len(pending) < workers * 4:
+                continue
+            stop, future = pending.popleft()
+            yield from future.result()
+            if progress is not None:
+                progress(stop, trials)
+        while pending:
+            stop, future = pending.popleft()
+            yield from future.result()
+            if progress is not None:
+                progress(stop, trials)
+        finished = True
+    finally:
+        shutdown_pool(executor, finished)
+
+
+class ExperimentSummary:
+    def __init__(self, confidence=0.95):
+        if not 0 < confidence < 1:
+            raise ValueError("Confidence must be between 0 and 1")
+        self.confidence = confidence
+        self.z = NormalDist().inv_cdf((1 + confidence) / 2)
+        self.stats = {}
+
+    def add(self, record):
+        algorithm_stats = self.stats.get(record["algorithm"])
+        if algorithm_stats is None:
+            algorithm_stats = {metric: RunningStats() for metric in EXPERIMENT_METRICS}
+            self.stats[record["algorithm"]] = algorithm_stats
+        for metric, stats in algorithm_stats.items():
+            stats.add(record[metric])
+
+    def rows(self):
+        for algorithm_name, algorithm_stats in self.stats.items():
+            for metric in EXPERIMENT_METRICS:
+                stats = algorithm_stats[metric]
+                mean = stats.mean
+                stdev = math.sqrt(stats.m2 / (stats.count - 1)) if stats.count > 1 else 0.0
+                margin = self.z * stdev / math.sqrt(stats.count) if stats.count else 0.0
+                yield {
+                    "algorithm": algorithm_name,
+                    "metric": metric,
+                    "trials": stats.count,
+                    "mean": mean,
+                    "stdev": stdev,
+                    "ci_low": mean - margin,
+                    "ci_high": mean + margin,
+                    "min": stats.min,
+                    "max": stats.max,
+                }
@@ -1,21 +1,56 @@
+from core.kernel import collect_timeline, stream_policy
+from core.policy import FifoPolicy
+from core.vectorized import np, use_numpy, column, store_column, reorder
+
+
+def fcfs_order(p):
+    return p.arrival_time
+
+
+def fcfs_policy():
+    return FifoPolicy(record_idle=True)
+
+
+def fcfs_stream(process_list):
+    process_list.sort(key=fcfs_order)
+
+    return stream_policy(process_list, fcfs_policy())
+
+
 def fcfs_scheduling(process_list):
-    process_list.sort(key=lambda x: x.arrival_time)
+    if use_numpy(len(process_list)):
+        return _fcfs_vectorized(process_list)
+
+    return collect_timeline(process_list, fcfs_stream(process_list))
 
-    current_time = 0
-    timeline = []
 
-    for process in process_list:
-        if current_time < process.arrival_time:
-            timeline.append(("IDLE", current_time, process.arrival_time))
-            current_time = process.arrival_time
+def _fcfs_vectorized(process_list):
+    reorder(process_list, np.argsort(column(process_list, "arrival_time"), kind="stable"))
 
-        process.start_time = current_time
-        process.completion_time = current_time + process.burst_time
+    arrival = column(process_list, "arrival_time")
+    burst = column(process_list, "burst_time")
 
-        process.turnaround_time = process.completion_time - process.arrival_time
-        process.waiting_time = process.turnaround_time - process.burst_time
+    busy = np.cumsum(burst)
+    completion = busy + np.maximum(np.maximum.accumulate(arrival - (busy - burst)), 0)
+    start = completion - burst
+    turnaround = completion - arrival
 
-        timeline.append((process.pid, process.start_time, process.completion_time))
-        current_time = process.completion_time
+    store_column(process_list, "start_time", start)
+    store_column(process_list, "completion_time", completion)
+    store_column(process_list, "turnaround_time", turnaround)
+    store_column(process_list, "waiting_time", turnaround - burst)
+    store_column(process_list, "remaining_time", np.zeros_like(burst))
+
+    pids = getattr(process_list, "pids", None)
+    if pids is None:
+        pids = [p.pid for p in process_list]
+
+    timeline = []
+    previous_end = 0
+    for pid, s, e in zip(pids, start.tolist(), completion.tolist()):
+        if previous_end < s:
+            timeline.append(("IDLE", previous_end, s))
+        timeline.append((pid, s, e))
+        previous_end = e
 
-    return process_list, timeline
\ No newline at end of file
+    return process_list, timeline
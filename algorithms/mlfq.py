@@ -0,0 +1,30 @@
+from core.kernel import collect_timeline, stream_policy
+from core.policy import MultilevelFeedbackPolicy
+
+MLFQ_LEVELS = 3
+BOOST_SLICES = 8
+
+
+def mlfq_quanta(quantum, levels=MLFQ_LEVELS):
+    return [quantum * 2 ** level for level in range(levels)]
+
+
+def mlfq_order(p):
+    return p.arrival_time
+
+
+def mlfq_policy(quantum, levels=MLFQ_LEVELS, quanta=None, boost_interval=None):
+    quanta = quanta or mlfq_quanta(quantum, levels)
+    if boost_interval is None:
+        boost_interval = BOOST_SLICES * quanta[-1]
+    return MultilevelFeedbackPolicy(quanta, boost_interval or None)
+
+
+def mlfq_stream(process_list, quantum, **options):
+    process_list.sort(key=mlfq_order)
+
+    return stream_policy(process_list, mlfq_policy(quantum, **options))
+
+
+def mlfq_scheduling(process_list, quantum, **options):
+    return collect_timeline(process_list, mlfq_stream(process_list, quantum, **options))
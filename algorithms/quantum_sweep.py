@@ -0,0 +1,91 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from algorithms.comparison import PARALLEL_THRESHOLD, shutdown_pool
+from algorithms.round_robin import round_robin_order, round_robin_policy
+from core.kernel import Kernel
+from core.metrics import stream_metrics
+from core.process_table import ProcessTable
+
+SWEEP_OBJECTIVES = {
+    "p99_wt": "p99 waiting time",
+    "avg_wt": "Average waiting time",
+    "p99_rt": "p99 response time",
+    "avg_rt": "Average response time",
+    "p99_tat": "p99 turnaround time",
+    "avg_tat": "Average turnaround time",
+    "context_switches": "Context switches",
+}
+SWEEP_FIELDS = [
+    "workload",
+    "quantum",
+    "avg_wt",
+    "p95_wt",
+    "p99_wt",
+    "avg_rt",
+    "p95_rt",
+    "p99_rt",
+    "avg_tat",
+    "p99_tat",
+    "context_switches",
+    "completion_time",
+    "best",
+]
+
+_worker_workload = None
+
+
+def _init_worker(workload):
+    global _worker_workload
+    _worker_workload = workload
+
+
+def sweep_quantum(quantum, workload=None):
+    if workload is None:
+        workload = _worker_workload
+    process_list = workload.copy()
+    process_list.sort(key=round_robin_order)
+    kernel = Kernel(process_list, round_robin_policy(quantum))
+    metrics = stream_metrics(kernel.stream())
+    metrics["context_switches"] = kernel.stats["context_switches"]
+    return quantum, metrics
+
+
+def iter_sweep(workload, quanta, max_workers=None):
+    if not isinstance(workload, ProcessTable):
+        workload = ProcessTable.from_processes(workload)
+    quanta = list(quanta)
+    workers = max_workers or min(len(quanta), os.cpu_count() or 1)
+
+    if workers <= 1 or len(workload) < PARALLEL_THRESHOLD:
+        for quantum in quanta:
+            yield sweep_quantum(quantum, workload)
+        return
+
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(workload,),
+    )
+    finished = False
+    try:
+        futures = [executor.submit(sweep_quantum, quantum) for quantum in quanta]
+        for future in as_completed(futures):
+            yield future.result()
+        finished = True
+    finally:
+        shutdown_pool(executor, finished)
+
+
+def sweep(workload, quanta, max_workers=None):
+    return sorted(iter_sweep(workload, quanta, max_workers), key=lambda row: row[0])
+
+
+def best_quantum(rows, objective="p99_wt"):
+    if objective not in SWEEP_OBJECTIVES:
+        raise ValueError(f"Unsupported objective: {objective}")
+    if not rows:
+        return None
+    return min(rows, key=lambda row: (row[1][objective], row[1]["context_switches"], row[0]))
@@ -0,0 +1,137 @@
+from algorithms.cfs import cfs_order, cfs_policy, cfs_scheduling, cfs_stream
+from algorithms.fcfs import fcfs_order, fcfs_policy, fcfs_scheduling, fcfs_stream
+from algorithms.round_robin import (
+    round_robin_order, round_robin_policy, round_robin_scheduling, round_robin_stream,
+)
+from algorithms.sjf_np import sjf_non_preemptive, sjf_order, sjf_policy, sjf_stream
+from algorithms.ljf_np import ljf_non_preemptive, ljf_policy, ljf_stream
+from algorithms.priority_np import priority_non_preemptive, priority_np_policy, priority_np_stream
+from algorithms.priority_p import priority_preemptive, priority_p_policy, priority_p_stream
+from algorithms.mlfq import mlfq_order, mlfq_policy, mlfq_scheduling, mlfq_stream
+from algorithms.srtf import srtf_policy, srtf_scheduling, srtf_stream
+from core.checkpoint import IncrementalSimulator
+from core.smp import SmpKernel
+
+ALGORITHMS = [
+    "FCFS",
+    "SJF (Non Preemptive)",
+    "LJF (Non Preemptive)",
+    "Round Robin",
+    "Priority (Non Preemptive)",
+    "Priority (Preemptive)",
+    "SRTF (Preemptive SJF)",
+    "MLFQ",
+    "CFS",
+]
+
+QUANTUM_ALGORITHMS = {"Round Robin", "MLFQ"}
+
+ALGORITHM_ALIASES = {
+    "fcfs": "FCFS",
+    "sjf": "SJF (Non Preemptive)",
+    "ljf": "LJF (Non Preemptive)",
+    "rr": "Round Robin",
+    "priority-np": "Priority (Non Preemptive)",
+    "priority-p": "Priority (Preemptive)",
+    "srtf": "SRTF (Preemptive SJF)",
+    "mlfq": "MLFQ",
+    "cfs": "CFS",
+}
+
+ALGORITHM_DISPATCH = {
+    "FCFS": lambda procs, tq: fcfs_scheduling(procs),
+    "SJF (Non Preemptive)": lambda procs, tq: sjf_non_preemptive(procs),
+    "LJF (Non Preemptive)": lambda procs, tq: ljf_non_preemptive(procs),
+    "Round Robin": lambda procs, tq: round_robin_scheduling(procs, tq),
+    "Priority (Non Preemptive)": lambda procs, tq: priority_non_preemptive(procs),
+    "Priority (Preemptive)": lambda procs, tq: priority_preemptive(procs),
+    "SRTF (Preemptive SJF)": lambda procs, tq: srtf_scheduling(procs),
+    "MLFQ": lambda procs, tq: mlfq_scheduling(procs, tq),
+    "CFS": lambda procs, tq: cfs_scheduling(procs),
+}
+
+ALGORITHM_STREAMS = {
+    "FCFS": lambda procs, tq: fcfs_stream(procs),
+    "SJF (Non Preemptive)": lambda procs, tq: sjf_stream(procs),
+    "LJF (Non Preemptive)": lambda procs, tq: ljf_stream(procs),
+    "Round Robin": lambda procs, tq: round_robin_stream(procs, tq),
+    "Priority (Non Preemptive)": lambda procs, tq: priority_np_stream(procs),
+    "Priority (Preemptive)": lambda procs, tq: priority_p_stream(procs),
+    "SRTF (Preemptive SJF)": lambda procs, tq: srtf_stream(procs),
+    "MLFQ": lambda procs, tq: mlfq_stream(procs, tq),
+    "CFS": lambda procs, tq: cfs_stream(procs),
+}
+
+ALGORITHM_POLICIES = {
+    "FCFS": lambda tq: (fcfs_policy(), fcfs_order),
+    "SJF (Non Preemptive)": lambda tq: (sjf_policy(), sjf_order),
+    "LJF (Non Preemptive)": lambda tq: (ljf_policy(), None),
+    "Round Robin": lambda tq: (round_robin_policy(tq), round_robin_order),
+    "Priority (Non Preemptive)": lambda tq: (priority_np_policy(), None),
+    "Priority (Preemptive)": lambda tq: (priority_p_policy(), None),
+    "SRTF (Preemptive SJF)": lambda tq: (srtf_policy(), None),
+    "MLFQ": lambda tq: (mlfq_policy(tq), mlfq_order),
+    "CFS": lambda tq: (cfs_policy(), cfs_order),
+}
+
+
+def resolve_algorithm(name):
+    if name in ALGORITHM_DISPATCH:
+        return name
+    resolved = ALGORITHM_ALIASES.get(name.strip().lower())
+    if resolved is None:
+        raise ValueError(f"Unsupported algorithm: {name}")
+    return resolved
+
+
+def _lookup(table, algorithm_name, quantum):
+    runner = table.get(algorithm_name)
+    if runner is None:
+        raise ValueError(f"Unsupported algorithm: {algorithm_name}")
+
+    if algorithm_name in QUANTUM_ALGORITHMS:
+        if quantum is None or quantum <= 0:
+            raise ValueError("Enter a valid time quantum (positive integer)")
+    else:
+        quantum = None
+
+    return runner, quantum
+
+
+def run_algorithm(algorithm_name, process_list, quantum=None):
+    runner, quantum = _lookup(ALGORITHM_DISPATCH, algorithm_name, quantum)
+    return runner(process_list, quantum)
+
+
+def stream_algorithm(algorithm_name, process_list, quantum=None):
+    runner, quantum = _lookup(ALGORITHM_STREAMS, algorithm_name, quantum)
+    return runner(process_list, quantum)
+
+
+def incremental_simulator(algorithm_name, quantum=None, interval=None):
+    factory, quantum = _lookup(ALGORITHM_POLICIES, algorithm_name, quantum)
+    policy, order = factory(quantum)
+    return IncrementalSimulator(policy, order, interval)
+
+
+def smp_kernel(algorithm_name, process_list, cpus, quantum=None, balancer="pull",
+               affinity=None, balance_interval=None):
+    factory, quantum = _lookup(ALGORITHM_POLICIES, algorithm_name, quantum)
+    if cpus < 1:
+        raise ValueError("CPU count must be a positive integer")
+    policies = []
+    order = None
+    for _ in range(cpus):
+        policy, order = factory(quantum)
+        policies.append(policy)
+    if order is not None:
+        process_list.sort(key=order)
+    return SmpKernel(process_list, policies, balancer, affinity, balance_interval)
+
+
+def run_smp(algorithm_name, process_list, cpus, quantum=None, balancer="pull",
+            affinity=None, balance_interval=None):
+    kernel = smp_kernel(
+        algorithm_name, process_list, cpus, quantum, balancer, affinity, balance_interval)
+    result, lanes = kernel.run()
+    return result, lanes, kernel.stats
@@ -1,50 +1,20 @@
-from collections import deque
+from core.kernel import collect_timeline, stream_policy
+from core.policy import FifoPolicy
 
-def round_robin_scheduling(process_list, quantum):
-    queue = deque()
-    timeline = []
-    current_time = 0
-    completed = 0
-    n = len(process_list)
-
-    process_list.sort(key=lambda x: x.arrival_time)
-
-    for p in process_list:
-        p.remaining_time = p.burst_time
-        p.start_time = -1
 
-    i = 0
+def round_robin_order(p):
+    return p.arrival_time
 
-    while completed < n:
-        while i < n and process_list[i].arrival_time <= current_time:
-            queue.append(process_list[i])
-            i += 1
 
-        if not queue:
-            current_time += 1
-            continue
+def round_robin_policy(quantum):
+    return FifoPolicy(quantum=quantum)
 
-        p = queue.popleft()
 
-        start = current_time
-        if p.start_time == -1:
-            p.start_time = start
-        execute_time = min(quantum, p.remaining_time)
-        current_time += execute_time
-        p.remaining_time -= execute_time
+def round_robin_stream(process_list, quantum):
+    process_list.sort(key=round_robin_order)
 
-        timeline.append((p.pid, start, current_time))
+    return stream_policy(process_list, round_robin_policy(quantum))
 
-        while i < n and process_list[i].arrival_time <= current_time:
-            queue.append(process_list[i])
-            i += 1
 
-        if p.remaining_time > 0:
-            queue.append(p)
-        else:
-            p.completion_time = current_time
-            p.turnaround_time = p.completion_time - p.arrival_time
-            p.waiting_time = p.turnaround_time - p.burst_time
-            completed += 1
-
-    return process_list, timeline
+def round_robin_scheduling(process_list, quantum):
+    return collect_timeline(process_list, round_robin_stream(process_list, quantum))
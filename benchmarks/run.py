@@ -0,0 +1,148 @@
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from algorithms.registry import ALGORITHM_DISPATCH, run_algorithm
+from core.vectorized import np
+from core.workloads import WORKLOAD_KINDS, generate_workload
+
+DEFAULT_SIZES = (100, 1000, 10000, 100000, 1000000)
+MIN_SECONDS = 0.05
+BASELINE_REPEAT = 5
+
+
+def time_algorithm(algorithm_name, workload, quantum, repeat):
+    best = None
+    for _ in range(repeat):
+        process_list = workload.copy()
+        started = time.perf_counter()
+        run_algorithm(algorithm_name, process_list, quantum)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def peak_memory(algorithm_name, workload, quantum):
+    process_list = workload.copy()
+    tracemalloc.start()
+    try:
+        run_algorithm(algorithm_name, process_list, quantum)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_benchmarks(sizes, kinds, algorithms, quantum=4, repeat=1, seed=0,
+                   measure_memory=True, progress=None):
+    results = []
+    for size in sizes:
+        for kind in kinds:
+            workload = generate_workload(kind, size, seed)
+            for algorithm_name in algorithms:
+                row = {
+                    "algorithm": algorithm_name,
+                    "workload": kind,
+                    "size": size,
+                    "seconds": time_algorithm(algorithm_name, workload, quantum, repeat),
+                    "peak_bytes": None,
+                }
+                if measure_memory:
+                    row["peak_bytes"] = peak_memory(algorithm_name, workload, quantum)
+                results.append(row)
+                if progress is not None:
+                    progress(row)
+    return results
+
+
+def compare_to_baseline(results, baseline, tolerance, min_seconds=MIN_SECONDS):
+    previous = {
+        (row["algorithm"], row["workload"], row["size"]): row
+        for row in baseline["results"]
+    }
+    regressions = []
+    for row in results:
+        old = previous.get((row["algorithm"], row["workload"], row["size"]))
+        if old is None or not old["seconds"]:
+            continue
+        if max(row["seconds"], old["seconds"]) < min_seconds:
+            continue
+        ratio = row["seconds"] / old["seconds"]
+        if ratio > 1 + tolerance:
+            regressions.append((row, old, ratio))
+    return regressions
+
+
+def _format_row(row):
+    memory = "-" if row["peak_bytes"] is None else f"{row['peak_bytes'] / 2 ** 20:.1f} MiB"
+    return (f"{row['algorithm']:<26} {row['workload']:<13} {row['size']:>8}  "
+            f"{row['seconds']:>10.4f}s  {memory:>11}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Time every scheduling algorithm on seeded synthetic workloads.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--workloads", nargs="+", choices=list(WORKLOAD_KINDS),
+                        default=list(WORKLOAD_KINDS))
+    parser.add_argument("--algorithms", nargs="+", choices=list(ALGORITHM_DISPATCH),
+                        default=list(ALGORITHM_DISPATCH), metavar="ALGORITHM")
+    parser.add_argument("--quantum", type=int, default=4,
+                        help="time quantum for Round Robin (default: 4)")
+    parser.add_argument("--repeat", type=int, default=None,
+                        help="timed runs per case; the fastest is kept "
+                             f"(default: 1, or {BASELINE_REPEAT} with --baseline)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", action="store_true",
+                        help="skip the tracemalloc pass that records peak memory")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--baseline", help="JSON results from an earlier run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown against the baseline (default: 0.25 = 25%%)")
+    parser.add_argument("--min-seconds", type=float, default=MIN_SECONDS,
+                        help="ignore cases faster than this in both runs when comparing "
+                             f"(default: {MIN_SECONDS})")
+    args = parser.parse_args(argv)
+    if args.repeat is None:
+        args.repeat = BASELINE_REPEAT if args.baseline else 1
+
+    results = run_benchmarks(
+        args.sizes, args.workloads, args.algorithms,
+        quantum=args.quantum, repeat=args.repeat, seed=args.seed,
+        measure_memory=not args.no_memory,
+        progress=lambda row: print(_format_row(row), flush=True),
+    )
+
+    report = {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__ if np is not None else None,
+            "quantum": args.quantum,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            json.dump(report, output_file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = compare_to_baseline(results, baseline, args.tolerance, args.min_seconds)
+        for row, old, ratio in regressions:
+            print(f"REGRESSION {row['algorithm']} / {row['workload']} / {row['size']}: "
+                  f"{old['seconds']:.4f}s -> {row['seconds']:.4f}s ({ratio:.2f}x)")
+        if regressions:
+            return 1
+        print("No regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
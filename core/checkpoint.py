@@ -0,0 +1,79 @@
+from core.kernel import CHECKPOINT, COMPLETE, SEGMENT, Kernel, _pid_index
+
+CHECKPOINTS = 64
+PROGRESS_EVERY = 4096
+
+
+def default_interval(process_list):
+    return max(1, len(process_list) // CHECKPOINTS)
+
+
+class IncrementalSimulator:
+    def __init__(self, policy, order=None, interval=None):
+        self.policy = policy
+        self.order = order
+        self.interval = interval
+        self.run_interval = interval
+        self.checkpoints = []
+        self.completed = []
+        self.timeline = []
+        self.stats = {}
+
+    def run(self, process_list, progress=None):
+        if self.order is not None:
+            process_list.sort(key=self.order)
+        self.run_interval = self.interval or default_interval(process_list)
+        self.checkpoints = []
+        self.completed = []
+        self.timeline = []
+        return self._consume(process_list, None, progress)
+
+    def find_checkpoint(self, affected_arrival):
+        for position in range(len(self.checkpoints) - 1, -1, -1):
+            checkpoint = self.checkpoints[position]
+            if checkpoint["time"] <= affected_arrival and checkpoint["horizon"] < affected_arrival:
+                return position
+        return None
+
+    def rerun(self, process_list, affected_arrival, progress=None):
+        position = self.find_checkpoint(affected_arrival)
+        if position is None:
+            return self.run(process_list, progress)
+
+        if self.order is not None:
+            process_list.sort(key=self.order)
+        checkpoint = self.checkpoints[position]
+        del self.checkpoints[position + 1:]
+        del self.completed[checkpoint["completed"]:]
+        del self.timeline[checkpoint["segments"]:]
+        return self._consume(process_list, checkpoint, progress)
+
+    def _consume(self, process_list, checkpoint, progress=None):
+        total = len(process_list)
+        kernel = Kernel(process_list, self.policy, self.run_interval)
+        for kind, record in kernel.stream(checkpoint):
+            if kind == SEGMENT:
+                self.timeline.append(record)
+            elif kind == COMPLETE:
+                self.completed.append((record.pid, record.start_time, record.completion_time))
+                if progress is not None and not len(self.completed) % PROGRESS_EVERY:
+                    progress(len(self.completed), total)
+            elif kind == CHECKPOINT:
+                record["completed"] = len(self.completed)
+                record["segments"] = len(self.timeline)
+                self.checkpoints.append(record)
+        self.stats = kernel.stats
+        if progress is not None:
+            progress(len(self.completed), total)
+
+        if checkpoint is not None:
+            index = _pid_index(process_list)
+            for pid, start_time, completion_time in self.completed[:checkpoint["completed"]]:
+                p = process_list[index[pid]]
+                p.start_time = start_time
+                p.completion_time = completion_time
+                p.turnaround_time = completion_time - p.arrival_time
+                p.waiting_time = p.turnaround_time - p.burst_time
+                p.remaining_time = 0
+
+        return process_list, list(self.timeline)
@@ -0,0 +1,64 @@
+import csv
+import json
+
+from core.metrics import STAT_FIELDS
+
+RESULT_FIELDS = [
+    "workload",
+    "algorithm",
+    "quantum",
+    "pid",
+    "arrival_time",
+    "burst_time",
+    "priority",
+    "start_time",
+    "completion_time",
+    "turnaround_time",
+    "waiting_time",
+    "response_time",
+]
+SUMMARY_FIELDS = [
+    "workload",
+    "algorithm",
+    "quantum",
+    "processes",
+    *STAT_FIELDS,
+    "idle_time",
+    "cpu_util",
+    "completion_time",
+    "cpus",
+    "migrations",
+    "core_util",
+]
+TIMELINE_FIELDS = ["workload", "algorithm", "quantum", "cpu", "pid", "start", "end"]
+
+
+class RecordWriter:
+    def __init__(self, stream, fields, fmt="csv"):
+        self.stream = stream
+        self.fields = fields
+        self.fmt = fmt
+        if fmt == "csv":
+            self._writer = csv.DictWriter(stream, fieldnames=fields, extrasaction="ignore")
+            self._writer.writeheader()
+
+    def write(self, record):
+        if self.fmt == "csv":
+            self._writer.writerow(record)
+        else:
+            self.stream.write(json.dumps({field: record.get(field) for field in self.fields}))
+            self.stream.write("\n")
+
+
+def result_record(process):
+    return {
+        "pid": process.pid,
+        "arrival_time": process.arrival_time,
+        "burst_time": process.burst_time,
+        "priority": process.priority,
+        "start_time": process.start_time,
+        "completion_time": process.completion_time,
+        "turnaround_time": process.turnaround_time,
+        "waiting_time": process.waiting_time,
+        "response_time": process.start_time - process.arrival_time,
+    }
@@ -0,0 +1,134 @@
+import csv
+import json
+import mmap
+import os
+
+from core.process_table import ProcessTable
+from core.trace_file import TRACE_EXTENSION, load_trace
+from core.validation import parse_process
+
+CHUNK_ROWS = 65536
+
+FIELD_ALIASES = {
+    "pid": "pid",
+    "process": "pid",
+    "process id": "pid",
+    "arrival": "arrival_time",
+    "arrival time": "arrival_time",
+    "arrival_time": "arrival_time",
+    "at": "arrival_time",
+    "burst": "burst_time",
+    "burst time": "burst_time",
+    "burst_time": "burst_time",
+    "bt": "burst_time",
+    "priority": "priority",
+    "pr": "priority",
+}
+FIELDS = ("pid", "arrival_time", "burst_time", "priority")
+
+
+def _text(value):
+    if isinstance(value, str):
+        return value
+    return "" if value is None else str(value)
+
+
+def _lines(mapped):
+    first = True
+    for line in iter(mapped.readline, b""):
+        if first:
+            first = False
+            if line.startswith(b"\xef\xbb\xbf"):
+                line = line[3:]
+        yield line.decode("utf-8")
+
+
+def _read_csv(path, mapped):
+    reader = csv.reader(_lines(mapped))
+    header = next(reader, None)
+    if header is None:
+        return
+    columns = [None] * len(FIELDS)
+    for position, name in enumerate(header):
+        field = FIELD_ALIASES.get(name.strip().lower())
+        if field is not None and columns[FIELDS.index(field)] is None:
+            columns[FIELDS.index(field)] = position
+
+    for row in reader:
+        if not row:
+            continue
+        yield reader.line_num, [
+            row[position] if position is not None and position < len(row) else ""
+            for position in columns
+        ]
+
+
+def _read_jsonl(path, mapped):
+    for line_no, line in enumerate(_lines(mapped), start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as error:
+            raise ValueError(f"{path}:{line_no}: invalid JSON ({error.msg})")
+        if not isinstance(record, dict):
+            raise ValueError(f"{path}:{line_no}: expected a JSON object")
+        values = [""] * len(FIELDS)
+        for key, value in record.items():
+            field = FIELD_ALIASES.get(str(key).strip().lower())
+            if field is not None:
+                values[FIELDS.index(field)] = _text(value)
+        yield line_no, values
+
+
+def iter_workload_chunks(path, chunk_rows=CHUNK_ROWS, progress=None):
+    extension = os.path.splitext(path)[1].lower()
+    reader = _read_jsonl if extension in (".jsonl", ".ndjson") else _read_csv
+
+    with open(path, "rb") as workload_file:
+        size = os.fstat(workload_file.fileno()).st_size
+        if size == 0:
+            if progress is not None:
+                progress(0, 0)
+            return
+        with mmap.mmap(workload_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            seen = set()
+            chunk = ([], [], [], [])
+            pids, arrivals, bursts, priorities = chunk
+            for line_no, (pid, at, bt, pr) in reader(path, mapped):
+                try:
+                    pid, at, bt, pr = parse_process(pid, at, bt, pr or "0")
+                except ValueError as error:
+                    raise ValueError(f"{path}:{line_no}: {error}")
+                if pid in seen:
+                    raise ValueError(f"{path}:{line_no}: PID must be unique")
+                seen.add(pid)
+                pids.append(pid)
+                arrivals.append(at)
+                bursts.append(bt)
+                priorities.append(pr)
+
+                if len(pids) >= chunk_rows:
+                    yield chunk
+                    if progress is not None:
+                        progress(mapped.tell(), size)
+                    chunk = ([], [], [], [])
+                    pids, arrivals, bursts, priorities = chunk
+
+            if pids:
+                yield chunk
+            if progress is not None:
+                progress(size, size)
+
+
+def load_workload(path, chunk_rows=CHUNK_ROWS, progress=None):
+    if os.path.splitext(path)[1].lower() == TRACE_EXTENSION:
+        table, _ = load_trace(path)
+        if progress is not None:
+            progress(1, 1)
+        return table
+
+    table = ProcessTable()
+    for chunk in iter_workload_chunks(path, chunk_rows, progress):
+        table.extend(*chunk)
+    return table
@@ -0,0 +1,319 @@
+import heapq
+from bisect import bisect_left
+from itertools import count
+
+ARRIVAL = "arrival"
+COMPLETE = "complete"
+PREEMPT = "preempt"
+DISPATCH = "dispatch"
+SEGMENT = "segment"
+CHECKPOINT = "checkpoint"
+
+_EVENT_ORDER = {ARRIVAL: 0, COMPLETE: 1, PREEMPT: 2, DISPATCH: 3}
+
+
+class EventQueue:
+    def __init__(self, process_list):
+        times = getattr(process_list, "arrival_time", None)
+        if times is None:
+            times = [p.arrival_time for p in process_list]
+        self.arrivals = sorted(range(len(times)), key=times.__getitem__)
+        self.arrival_times = [times[i] for i in self.arrivals]
+        self.next_arrival = 0
+        self.heap = []
+        self.dispatch_at = None
+        self._seq = count()
+
+    def push(self, time, kind, idx=None, token=None):
+        if kind == DISPATCH:
+            self.dispatch_at = time
+            return
+        heapq.heappush(self.heap, (time, _EVENT_ORDER[kind], next(self._seq), kind, idx, token))
+
+    def next_arrival_time(self):
+        if self.next_arrival < len(self.arrival_times):
+            return self.arrival_times[self.next_arrival]
+        return None
+
+    def peek_time(self):
+        time = self.next_arrival_time()
+        if self.heap and (time is None or self.heap[0][0] < time):
+            time = self.heap[0][0]
+        if self.dispatch_at is not None and (time is None or self.dispatch_at < time):
+            time = self.dispatch_at
+        return time
+
+    def pop(self):
+        heap = self.heap
+        dispatch_at = self.dispatch_at
+        arrival_time = self.next_arrival_time()
+        if arrival_time is not None and (not heap or arrival_time <= heap[0][0]):
+            if dispatch_at is None or arrival_time <= dispatch_at:
+                idx = self.arrivals[self.next_arrival]
+                self.next_arrival += 1
+                return arrival_time, ARRIVAL, idx, None
+        elif heap and (dispatch_at is None or heap[0][0] <= dispatch_at):
+            time, _, _, kind, idx, token = heapq.heappop(heap)
+            return time, kind, idx, token
+        if dispatch_at is None:
+            return None
+        self.dispatch_at = None
+        return dispatch_at, DISPATCH, None, None
+
+
+class Kernel:
+    def __init__(self, process_list, policy, checkpoint_interval=None):
+        self.process_list = process_list
+        self.policy = policy
+        self.checkpoint_interval = checkpoint_interval
+        self._pending = None
+        self.stats = {
+            "dispatches": 0,
+            "preemptions": 0,
+            "context_switches": 0,
+            "idle_time": 0,
+        }
+
+    def run(self):
+        return collect_timeline(self.process_list, self.stream())
+
+    def stream(self, checkpoint=None):
+        process_list = self.process_list
+        policy = self.policy
+
+        if checkpoint is None:
+            reset_runtime = getattr(process_list, "reset_runtime", None)
+            if reset_runtime is not None:
+                reset_runtime()
+            else:
+                for p in process_list:
+                    p.remaining_time = p.burst_time
+                    p.start_time = -1
+            policy.reset(process_list)
+
+            events = EventQueue(process_list)
+            active = set()
+            running = None
+            run_start = 0
+            token = 0
+            last_idx = None
+            events.push(0, DISPATCH)
+            dispatch_pending = True
+            last_now = -1
+            horizon = -1
+            completions = 0
+            next_checkpoint = 0
+        else:
+            events, active = self._restore(checkpoint)
+            index = _pid_index(process_list)
+            running = index.get(checkpoint["running"])
+            run_start = checkpoint["run_start"]
+            token = checkpoint["token"]
+            last_idx = index.get(checkpoint["last"])
+            dispatch_pending = checkpoint["dispatch_pending"]
+            last_now = checkpoint["last_now"]
+            horizon = checkpoint["horizon"]
+            completions = checkpoint["completions"]
+            next_checkpoint = checkpoint["next_checkpoint"]
+
+        interval = self.checkpoint_interval
+
+        while True:
+            if interval is not None:
+                now = events.peek_time()
+                if now is not None and now > last_now and completions >= next_checkpoint:
+                    next_checkpoint = completions + interval
+                    yield CHECKPOINT, self._snapshot(
+                        events, active, now,
+                        running=running, run_start=run_start, token=token, last=last_idx,
+                        dispatch_pending=dispatch_pending, last_now=last_now,
+                        horizon=horizon, completions=completions,
+                        next_checkpoint=next_checkpoint)
+
+            event = events.pop()
+            if event is None:
+                break
+            now, kind, idx, event_token = event
+            last_now = now
+
+            if kind == ARRIVAL:
+                active.add(idx)
+                policy.admit(idx, now)
+                if not dispatch_pending and (running is None or policy.preemptive):
+                    events.push(now, DISPATCH)
+                    dispatch_pending = True
+                continue
+
+            if kind == COMPLETE or kind == PREEMPT:
+                if event_token != token:
+                    continue
+                closed = self._charge(running, run_start, now)
+                if closed is not None:
+                    yield SEGMENT, closed
+                if kind == COMPLETE:
+                    active.discard(running)
+                    completions += 1
+                    yield COMPLETE, self._complete(running, now)
+                else:
+                    policy.requeue(running, now)
+                running = None
+                events.push(now, DISPATCH)
+                dispatch_pending = True
+                continue
+
+            dispatch_pending = False
+            preempted = None
+            if running is not None:
+                closed = self._charge(running, run_start, now)
+                if closed is not None:
+                    yield SEGMENT, closed
+                policy.requeue(running, now)
+                preempted = running
+                running = None
+
+            idx = policy.pick(now)
+            if idx is None:
+                next_time = events.next_arrival_time()
+                if next_time is not None:
+                    horizon = max(horizon, next_time)
+                    self.stats["idle_time"] += next_time - now
+                    if policy.record_idle:
+                        closed = self._extend("IDLE", now, next_time)
+                        if closed is not None:
+                            yield SEGMENT, closed
+                continue
+
+            if preempted is not None and idx != preempted:
+                self.stats["preemptions"] += 1
+            if idx != last_idx:
+                self.stats["dispatches"] += 1
+                if last_idx is not None:
+                    self.stats["context_switches"] += 1
+
+            p = process_list[idx]
+            if p.start_time == -1:
+                p.start_time = now
+
+            running = idx
+            run_start = now
+            last_idx = idx
+            token += 1
+            run_end = now + p.remaining_time
+            quantum = policy.time_slice(idx, now)
+            if quantum is not None:
+                slice_end = now + quantum
+                next_time = events.next_arrival_time()
+                if not len(policy) and policy.merge_lone_slices:
+                    if next_time is None:
+                        slice_end = run_end
+                    else:
+                        horizon = max(horizon, next_time)
+                        slices = -(-(next_time - now) // quantum)
+                        slice_end = now + slices * quantum
+                run_end = min(run_end, slice_end)
+            kind = COMPLETE if run_end - now == p.remaining_time else PREEMPT
+            events.push(run_end, kind, idx, token)
+
+        if self._pending is not None:
+            yield SEGMENT, self._pending
+            self._pending = None
+
+    def _snapshot(self, events, active, now, **state):
+        process_list = self.process_list
+        pid_of = lambda idx: None if idx is None else process_list[idx].pid
+        runtime = {}
+        for idx in active:
+            p = process_list[idx]
+            runtime[p.pid] = (p.remaining_time, p.start_time)
+        live = [
+            (time, kind, pid_of(idx))
+            for time, _, _, kind, idx, event_token in events.heap
+            if event_token == state["token"]
+        ]
+        state.update(
+            time=now,
+            running=pid_of(state["running"]),
+            last=pid_of(state["last"]),
+            runtime=runtime,
+            events=live,
+            dispatch_at=events.dispatch_at,
+            policy=self.policy.snapshot(pid_of),
+            pending=self._pending,
+            stats=dict(self.stats),
+        )
+        return state
+
+    def _restore(self, checkpoint):
+        process_list = self.process_list
+        index = _pid_index(process_list)
+
+        reset_runtime = getattr(process_list, "reset_runtime", None)
+        if reset_runtime is not None:
+            reset_runtime()
+        else:
+            for p in process_list:
+                p.remaining_time = p.burst_time
+                p.start_time = -1
+
+        active = set()
+        for pid, (remaining_time, start_time) in checkpoint["runtime"].items():
+            idx = index[pid]
+            p = process_list[idx]
+            p.remaining_time = remaining_time
+            p.start_time = start_time
+            active.add(idx)
+
+        self.policy.reset(process_list)
+        self.policy.restore(checkpoint["policy"], index)
+
+        events = EventQueue(process_list)
+        events.next_arrival = bisect_left(events.arrival_times, checkpoint["time"])
+        for time, kind, pid in checkpoint["events"]:
+            events.push(time, kind, index[pid], checkpoint["token"])
+        events.dispatch_at = checkpoint["dispatch_at"]
+
+        self.stats = dict(checkpoint["stats"])
+        self._pending = checkpoint["pending"]
+        return events, active
+
+    def _charge(self, idx, start, now):
+        if now == start:
+            return None
+        p = self.process_list[idx]
+        p.remaining_time -= now - start
+        return self._extend(p.pid, start, now)
+
+    def _extend(self, pid, start, end):
+        pending = self._pending
+        if pending is not None and pending[0] == pid and pending[2] == start:
+            self._pending = (pid, pending[1], end)
+            return None
+        self._pending = (pid, start, end)
+        return pending
+
+    def _complete(self, idx, now):
+        p = self.process_list[idx]
+        p.completion_time = now
+        p.turnaround_time = p.completion_time - p.arrival_time
+        p.waiting_time = p.turnaround_time - p.burst_time
+        return p
+
+
+def _pid_index(process_list):
+    index = getattr(process_list, "pid_index", None)
+    if index is None:
+        index = {p.pid: idx for idx, p in enumerate(process_list)}
+    return index
+
+
+def run_policy(process_list, policy):
+    return Kernel(process_list, policy).run()
+
+
+def stream_policy(process_list, policy):
+    return Kernel(process_list, policy).stream()
+
+
+def collect_timeline(process_list, stream):
+    timeline = [record for kind, record in stream if kind == SEGMENT]
+    return process_list, timeline
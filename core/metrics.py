@@ -0,0 +1,211 @@
+import math
+
+from core.kernel import COMPLETE
+from core.vectorized import np, use_numpy, column
+
+PERCENTILES = (50, 95, 99)
+SKETCH_ACCURACY = 0.01
+SERIES = ("wt", "tat", "rt")
+STATISTICS = ("avg", "max", "var") + tuple(f"p{percentile}" for percentile in PERCENTILES)
+STAT_FIELDS = [f"{statistic}_{series}" for series in SERIES for statistic in STATISTICS]
+
+
+class QuantileSketch:
+    def __init__(self, relative_accuracy=SKETCH_ACCURACY):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._inv_log_gamma = 1 / math.log(self.gamma)
+        self.buckets = {}
+        self.zeros = 0
+        self.count = 0
+
+    def add(self, value):
+        self.count += 1
+        if value <= 0:
+            self.zeros += 1
+            return
+        key = math.ceil(math.log(value) * self._inv_log_gamma)
+        self.buckets[key] = self.buckets.get(key, 0) + 1
+
+    def add_many(self, values):
+        positive = values[values > 0]
+        self.count += len(values)
+        self.zeros += len(values) - len(positive)
+        if not len(positive):
+            return
+        keys, counts = np.unique(
+            np.ceil(np.log(positive) * self._inv_log_gamma).astype(np.int64),
+            return_counts=True)
+        buckets = self.buckets
+        for key, bucket_count in zip(keys.tolist(), counts.tolist()):
+            buckets[key] = buckets.get(key, 0) + bucket_count
+
+    def merge(self, other):
+        self.count += other.count
+        self.zeros += other.zeros
+        for key, bucket_count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + bucket_count
+
+    def quantile(self, q):
+        if not self.count:
+            return 0
+        rank = max(0, math.ceil(q * self.count) - 1)
+        if rank < self.zeros:
+            return 0
+        seen = self.zeros
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if seen > rank:
+                return 2 * self.gamma ** key / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.buckets) / (self.gamma + 1)
+
+
+class RunningStats:
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = 0
+        self.max = 0
+        self.sketch = QuantileSketch()
+
+    def add(self, value):
+        if not self.count or value < self.min:
+            self.min = value
+        if not self.count or value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.sketch.add(value)
+
+    def add_many(self, values):
+        if not len(values):
+            return
+        total = int(values.sum())
+        mean = total / len(values)
+        m2 = float(((values - mean) ** 2).sum())
+        self._combine(len(values), total, mean, m2, int(values.min()), int(values.max()))
+        self.sketch.add_many(values)
+
+    def merge(self, other):
+        self._combine(other.count, other.total, other.mean, other.m2, other.min, other.max)
+        self.sketch.merge(other.sketch)
+
+    def _combine(self, count, total, mean, m2, low, high):
+        if not count:
+            return
+        if self.count:
+            delta = mean - self.mean
+            combined = self.count + count
+            self.m2 += m2 + delta * delta * self.count * count / combined
+            self.mean += delta * count / combined
+            self.min = min(self.min, low)
+            self.max = max(self.max, high)
+        else:
+            self.mean = mean
+            self.m2 = m2
+            self.min = low
+            self.max = high
+        self.count += count
+        self.total += total
+
+    @property
+    def variance(self):
+        return self.m2 / self.count if self.count else 0
+
+    def percentile(self, percentile):
+        if not self.count:
+            return 0
+        estimate = round(self.sketch.quantile(percentile / 100))
+        return min(self.max, max(self.min, estimate))
+
+    def summary(self, series):
+        summary = {
+            f"avg_{series}": self.total / self.count if self.count else 0,
+            f"max_{series}": self.max,
+            f"var_{series}": self.variance,
+        }
+        for percentile in PERCENTILES:
+            summary[f"p{percentile}_{series}"] = self.percentile(percentile)
+        return summary
+
+
+class MetricsAccumulator:
+    def __init__(self):
+        self.count = 0
+        self.waiting = RunningStats()
+        self.turnaround = RunningStats()
+        self.response = RunningStats()
+        self.total_burst = 0
+        self.completion_time = 0
+
+    def add(self, p):
+        self.count += 1
+        self.waiting.add(p.waiting_time)
+        self.turnaround.add(p.turnaround_time)
+        self.response.add(p.start_time - p.arrival_time)
+        self.total_burst += p.burst_time
+        if p.completion_time > self.completion_time:
+            self.completion_time = p.completion_time
+
+    def add_columns(self, waiting_time, turnaround_time, response_time,
+                    burst_time, completion_time):
+        self.count += len(waiting_time)
+        self.waiting.add_many(waiting_time)
+        self.turnaround.add_many(turnaround_time)
+        self.response.add_many(response_time)
+        self.total_burst += int(burst_time.sum())
+        if len(completion_time):
+            self.completion_time = max(self.completion_time, int(completion_time.max()))
+
+    def merge(self, other):
+        self.count += other.count
+        self.waiting.merge(other.waiting)
+        self.turnaround.merge(other.turnaround)
+        self.response.merge(other.response)
+        self.total_burst += other.total_burst
+        self.completion_time = max(self.completion_time, other.completion_time)
+
+    def summary(self):
+        summary = {}
+        for series, stats in zip(SERIES, (self.waiting, self.turnaround, self.response)):
+            summary.update(stats.summary(series))
+        if not self.count:
+            summary.update(idle_time=0, cpu_util=0, completion_time=0, total_burst=0)
+            return summary
+        completion_time = self.completion_time
+        summary.update(
+            idle_time=max(0, completion_time - self.total_burst),
+            cpu_util=(self.total_burst / completion_time * 100) if completion_time else 0,
+            completion_time=completion_time,
+            total_burst=self.total_burst,
+        )
+        return summary
+
+
+def compute_metrics(process_list):
+    accumulator = MetricsAccumulator()
+    if use_numpy(len(process_list)):
+        accumulator.add_columns(
+            column(process_list, "waiting_time"),
+            column(process_list, "turnaround_time"),
+            column(process_list, "start_time") - column(process_list, "arrival_time"),
+            column(process_list, "burst_time"),
+            column(process_list, "completion_time"),
+        )
+    else:
+        for p in process_list:
+            accumulator.add(p)
+    return accumulator.summary()
+
+
+def stream_metrics(stream):
+    accumulator = MetricsAccumulator()
+    for kind, record in stream:
+        if kind == COMPLETE:
+            accumulator.add(record)
+    return accumulator.summary()
@@ -0,0 +1,369 @@
+import heapq
+from array import array
+from collections import deque
+
+
+class SchedulingPolicy:
+    preemptive = False
+    record_idle = False
+    merge_lone_slices = True
+    quantum = None
+
+    def reset(self, process_list):
+        self.process_list = process_list
+
+    def admit(self, idx, now):
+        raise NotImplementedError
+
+    def requeue(self, idx, now):
+        self.admit(idx, now)
+
+    def pick(self, now):
+        raise NotImplementedError
+
+    def time_slice(self, idx, now):
+        return self.quantum
+
+    def steal(self, now):
+        raise NotImplementedError
+
+    def detach(self, idx):
+        return None
+
+    def attach(self, idx, state, now):
+        self.admit(idx, now)
+
+    def snapshot(self, pid_of):
+        raise NotImplementedError
+
+    def restore(self, state, index):
+        raise NotImplementedError
+
+    def __len__(self):
+        raise NotImplementedError
+
+
+class FifoPolicy(SchedulingPolicy):
+    def __init__(self, quantum=None, record_idle=False):
+        self.quantum = quantum
+        self.record_idle = record_idle
+
+    def reset(self, process_list):
+        super().reset(process_list)
+        self.queue = deque()
+
+    def admit(self, idx, now):
+        self.queue.append(idx)
+
+    def pick(self, now):
+        return self.queue.popleft() if self.queue else None
+
+    def steal(self, now):
+        return self.queue.pop() if self.queue else None
+
+    def snapshot(self, pid_of):
+        return [pid_of(idx) for idx in self.queue]
+
+    def restore(self, state, index):
+        self.queue = deque(index[pid] for pid in state)
+
+    def __len__(self):
+        return len(self.queue)
+
+
+class KeyedPolicy(SchedulingPolicy):
+    def __init__(self, key, preemptive=False, record_idle=False):
+        self.key = key
+        self.preemptive = preemptive
+        self.record_idle = record_idle
+
+    def reset(self, process_list):
+        super().reset(process_list)
+        self.heap = []
+
+    def admit(self, idx, now):
+        heapq.heappush(self.heap, (self.key(self.process_list[idx]), idx))
+
+    def pick(self, now):
+        return heapq.heappop(self.heap)[1] if self.heap else None
+
+    def steal(self, now):
+        return self.heap.pop()[1] if self.heap else None
+
+    def snapshot(self, pid_of):
+        return [(key, pid_of(idx)) for key, idx in self.heap]
+
+    def restore(self, state, index):
+        self.heap = [(key, index[pid]) for key, pid in state]
+        heapq.heapify(self.heap)
+
+    def __len__(self):
+        return len(self.heap)
+
+
+class MultilevelFeedbackPolicy(SchedulingPolicy):
+    preemptive = True
+    merge_lone_slices = False
+
+    def __init__(self, quanta, boost_interval=None):
+        if not quanta or min(quanta) <= 0:
+            raise ValueError("Every MLFQ level needs a positive time quantum")
+        self.quanta = list(quanta)
+        self.quantum = self.quanta[0]
+        self.boost_interval = boost_interval
+
+    def reset(self, process_list):
+        super().reset(process_list)
+        size = len(process_list)
+        self.queues = [deque() for _ in self.quanta]
+        self.bitmap = 0
+        self.levels = array("B", bytes(size))
+        self.used = array("q", bytes(8 * size))
+        self.running = None
+        self.running_since = 0
+        self.next_boost = self.boost_interval
+
+    def admit(self, idx, now):
+        level = self.levels[idx]
+        self.queues[level].append(idx)
+        self.bitmap |= 1 << level
+
+    def requeue(self, idx, now):
+        level = self.levels[idx]
+        used = self.used[idx]
+        if idx == self.running:
+            used += now - self.running_since
+            self.running = None
+        if used < self.quanta[level]:
+            self.used[idx] = used
+            self.queues[level].appendleft(idx)
+        else:
+            if level + 1 < len(self.quanta):
+                level += 1
+                self.levels[idx] = level
+            self.used[idx] = 0
+            self.queues[level].append(idx)
+        self.bitmap |= 1 << level
+
+    def pick(self, now):
+        if self.next_boost is not None and now >= self.next_boost:
+            self._boost(now)
+        bitmap = self.bitmap
+        if not bitmap:
+            return None
+        level = (bitmap & -bitmap).bit_length() - 1
+        queue = self.queues[level]
+        idx = queue.popleft()
+        if not queue:
+            self.bitmap = bitmap & ~(1 << level)
+        self.running = idx
+        self.running_since = now
+        return idx
+
+    def time_slice(self, idx, now):
+        return self.quanta[self.levels[idx]] - self.used[idx]
+
+    def steal(self, now):
+        bitmap = self.bitmap
+        if not bitmap:
+            return None
+        level = bitmap.bit_length() - 1
+        queue = self.queues[level]
+        idx = queue.pop()
+        if not queue:
+            self.bitmap = bitmap & ~(1 << level)
+        return idx
+
+    def detach(self, idx):
+        return self.levels[idx], self.used[idx]
+
+    def attach(self, idx, state, now):
+        self.levels[idx], self.used[idx] = state
+        self.admit(idx, now)
+
+    def _boost(self, now):
+        interval = self.boost_interval
+        self.next_boost = (now // interval + 1) * interval
+        top = self.queues[0]
+        levels, used = self.levels, self.used
+        for queue in self.queues[1:]:
+            for idx in queue:
+                levels[idx] = 0
+                used[idx] = 0
+            top.extend(queue)
+            queue.clear()
+        self.bitmap = 1 if top else 0
+
+    def snapshot(self, pid_of):
+        return {
+            "queues": [[(pid_of(idx), self.used[idx]) for idx in queue] for queue in self.queues],
+            "running": None if self.running is None else (
+                pid_of(self.running), self.levels[self.running], self.used[self.running]),
+            "running_since": self.running_since,
+            "next_boost": self.next_boost,
+        }
+
+    def restore(self, state, index):
+        for level, entries in enumerate(state["queues"]):
+            for pid, used in entries:
+                idx = index[pid]
+                self.levels[idx] = level
+                self.used[idx] = used
+                self.queues[level].append(idx)
+            if entries:
+                self.bitmap |= 1 << level
+        if state["running"] is not None:
+            pid, level, used = state["running"]
+            self.running = index[pid]
+            self.levels[self.running] = level
+            self.used[self.running] = used
+        self.running_since = state["running_since"]
+        self.next_boost = state["next_boost"]
+
+    def __len__(self):
+        return sum(len(queue) for queue in self.queues)
+
+
+class FairPolicy(SchedulingPolicy):
+    preemptive = True
+
+    def __init__(self, weight, reference_weight, target_latency, min_granularity,
+                 wakeup_granularity=None):
+        if min_granularity <= 0 or target_latency < min_granularity:
+            raise ValueError("Minimum granularity must be positive and at most the target latency")
+        self.weight = weight
+        self.reference_weight = reference_weight
+        self.target_latency = target_latency
+        self.min_granularity = min_granularity
+        self.wakeup_granularity = min_granularity if wakeup_granularity is None else wakeup_granularity
+
+    def reset(self, process_list):
+        super().reset(process_list)
+        self.heap = []
+        self.vruntime = array("d", bytes(8 * len(process_list)))
+        self.load = 0
+        self.min_vruntime = 0.0
+        self.running = None
+        self.running_weight = 0
+        self.running_since = 0
+        self.slice = 0
+        self.ran = 0
+        self.current = None
+
+    def admit(self, idx, now):
+        if self.running is not None:
+            elapsed = now - self.running_since
+            self._advance(self.vruntime[self.running] + elapsed * self.reference_weight / self.running_weight)
+        vruntime = max(self.vruntime[idx], self.min_vruntime)
+        self.vruntime[idx] = vruntime
+        weight = self.weight(self.process_list[idx])
+        heapq.heappush(self.heap, (vruntime, idx, weight))
+        self.load += weight
+
+    def requeue(self, idx, now):
+        if idx == self.running:
+            weight = self.running_weight
+            elapsed = now - self.running_since
+        else:
+            weight = self.weight(self.process_list[idx])
+            elapsed = self.slice = self.ran = 0
+        self.running = None
+        self.vruntime[idx] += elapsed * self.reference_weight / weight
+        self._advance(self.vruntime[idx])
+        if elapsed < self.slice:
+            self.current = (idx, weight, self.slice - elapsed, self.ran + elapsed)
+            return
+        heapq.heappush(self.heap, (self.vruntime[idx], idx, weight))
+        self.load += weight
+
+    def pick(self, now):
+        heap = self.heap
+        current = self.current
+        if current is not None:
+            self.current = None
+            idx, weight, remaining, ran = current
+            period = max(self.target_latency, (len(heap) + 1) * self.min_granularity)
+            share = max(self.min_granularity, int(period * weight / (self.load + weight)))
+            remaining = min(remaining, share - ran)
+            if remaining > 0 and (
+                    not heap or self.vruntime[idx] - heap[0][0] <= self.wakeup_granularity):
+                self._run(idx, weight, remaining, now)
+                self.ran = ran
+                return idx
+            heapq.heappush(heap, (self.vruntime[idx], idx, weight))
+            self.load += weight
+        if not heap:
+            return None
+
+        vruntime, idx, weight = heapq.heappop(heap)
+        if vruntime > self.min_vruntime:
+            self.min_vruntime = vruntime
+        period = max(self.target_latency, (len(heap) + 1) * self.min_granularity)
+        share = int(period * weight / self.load)
+        self.load -= weight
+        self._run(idx, weight, max(self.min_granularity, share), now)
+        self.ran = 0
+        return idx
+
+    def time_slice(self, idx, now):
+        return self.slice
+
+    def steal(self, now):
+        if not self.heap:
+            return None
+        _, idx, weight = self.heap.pop()
+        self.load -= weight
+        return idx
+
+    def detach(self, idx):
+        return self.vruntime[idx] - self.min_vruntime
+
+    def attach(self, idx, lag, now):
+        vruntime = self.min_vruntime + lag
+        self.vruntime[idx] = vruntime
+        weight = self.weight(self.process_list[idx])
+        heapq.heappush(self.heap, (vruntime, idx, weight))
+        self.load += weight
+
+    def _advance(self, vruntime):
+        if self.heap:
+            vruntime = min(vruntime, self.heap[0][0])
+        if vruntime > self.min_vruntime:
+            self.min_vruntime = vruntime
+
+    def _run(self, idx, weight, time_slice, now):
+        self.running = idx
+        self.running_weight = weight
+        self.running_since = now
+        self.slice = time_slice
+
+    def snapshot(self, pid_of):
+        return {
+            "heap": [(vruntime, pid_of(idx), weight) for vruntime, idx, weight in self.heap],
+            "running": None if self.running is None else (
+                pid_of(self.running), self.vruntime[self.running], self.running_weight),
+            "running_since": self.running_since,
+            "slice": self.slice,
+            "ran": self.ran,
+            "min_vruntime": self.min_vruntime,
+        }
+
+    def restore(self, state, index):
+        self.heap = []
+        for vruntime, pid, weight in state["heap"]:
+            idx = index[pid]
+            self.vruntime[idx] = vruntime
+            self.heap.append((vruntime, idx, weight))
+            self.load += weight
+        heapq.heapify(self.heap)
+        if state["running"] is not None:
+            pid, vruntime, self.running_weight = state["running"]
+            self.running = index[pid]
+            self.vruntime[self.running] = vruntime
+        self.running_since = state["running_since"]
+        self.slice = state["slice"]
+        self.ran = state["ran"]
+        self.min_vruntime = state["min_vruntime"]
+
+    def __len__(self):
+        return len(self.heap) + (self.current is not None)
@@ -0,0 +1,258 @@
+import mmap
+import sys
+from array import array
+
+from core.process import Process
+
+INPUT_COLUMNS = ("arrival_time", "burst_time", "priority")
+RESULT_COLUMNS = (
+    "start_time",
+    "completion_time",
+    "waiting_time",
+    "turnaround_time",
+    "remaining_time",
+)
+COLUMNS = INPUT_COLUMNS + RESULT_COLUMNS
+
+
+def _column_property(name):
+    def getter(row):
+        return getattr(row.table, name)[row.index]
+
+    def setter(row, value):
+        getattr(row.table, name)[row.index] = value
+
+    return property(getter, setter)
+
+
+class ProcessRow:
+    __slots__ = ("table", "index")
+
+    def __init__(self, table, index):
+        self.table = table
+        self.index = index
+
+    @property
+    def pid(self):
+        return self.table.pids[self.index]
+
+    arrival_time = _column_property("arrival_time")
+    burst_time = _column_property("burst_time")
+    priority = _column_property("priority")
+    start_time = _column_property("start_time")
+    completion_time = _column_property("completion_time")
+    waiting_time = _column_property("waiting_time")
+    turnaround_time = _column_property("turnaround_time")
+    remaining_time = _column_property("remaining_time")
+
+    def __repr__(self):
+        return f"{self.pid}"
+
+
+class PidTable:
+    __slots__ = ("offsets", "blob")
+
+    def __init__(self, offsets, blob):
+        self.offsets = offsets
+        self.blob = blob
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("pid index out of range")
+        start = self.offsets[index]
+        end = self.offsets[index + 1]
+        return sys.intern(str(self.blob[start:end], "utf-8"))
+
+    def __iter__(self):
+        blob = self.blob
+        offsets = self.offsets
+        for index in range(len(offsets) - 1):
+            yield sys.intern(str(blob[offsets[index]:offsets[index + 1]], "utf-8"))
+
+
+def _int64_array(values):
+    if isinstance(values, memoryview):
+        column = array("q")
+        column.frombytes(values.cast("B"))
+        return column
+    return array("q", values)
+
+
+def _zeroed_column(n):
+    if not n:
+        return array("q")
+    return memoryview(mmap.mmap(-1, 8 * n)).cast("q")
+
+
+class ProcessTable:
+    def __init__(self, pids=(), arrival_time=(), burst_time=(), priority=()):
+        if isinstance(pids, PidTable):
+            self.pids = pids
+        else:
+            self.pids = [sys.intern(str(pid)) for pid in pids]
+        self.arrival_time = _int64_array(arrival_time)
+        self.burst_time = _int64_array(burst_time)
+        self.priority = _int64_array(priority) if len(priority) else array("q", bytes(8 * len(self.pids)))
+
+        n = len(self.pids)
+        if not (len(self.arrival_time) == len(self.burst_time) == len(self.priority) == n):
+            raise ValueError("All process columns must have the same length")
+
+        for name in RESULT_COLUMNS:
+            setattr(self, name, array("q", bytes(8 * n)))
+        self.remaining_time[:] = self.burst_time
+        self.rebuild_index()
+
+    @classmethod
+    def from_processes(cls, processes):
+        return cls(
+            [p.pid for p in processes],
+            [p.arrival_time for p in processes],
+            [p.burst_time for p in processes],
+            [p.priority for p in processes],
+        )
+
+    @classmethod
+    def from_buffers(cls, pids, arrival_time, burst_time, priority):
+        table = cls.__new__(cls)
+        table.pids = pids
+        table.arrival_time = arrival_time
+        table.burst_time = burst_time
+        table.priority = priority
+
+        n = len(pids)
+        if not (len(arrival_time) == len(burst_time) == len(priority) == n):
+            raise ValueError("All process columns must have the same length")
+
+        for name in RESULT_COLUMNS:
+            setattr(table, name, _zeroed_column(n))
+        table.remaining_time[:] = table.burst_time
+        table.rebuild_index()
+        return table
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state["pids"] = list(self.pids)
+        for name in COLUMNS:
+            state[name] = _int64_array(state[name])
+        state["_pid_index"] = None
+        return state
+
+    @property
+    def pid_index(self):
+        if self._pid_index is None:
+            self._pid_index = dict(zip(self.pids, range(len(self.pids))))
+        return self._pid_index
+
+    def rebuild_index(self):
+        self._pid_index = None
+
+    def _make_mutable(self):
+        if not isinstance(self.pids, list):
+            self.pids = list(self.pids)
+        for name in COLUMNS:
+            values = getattr(self, name)
+            if not isinstance(values, array):
+                setattr(self, name, _int64_array(values))
+
+    def __len__(self):
+        return len(self.pids)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self.pids)
+        if not 0 <= index < len(self.pids):
+            raise IndexError("process index out of range")
+        return ProcessRow(self, index)
+
+    def __iter__(self):
+        for index in range(len(self.pids)):
+            yield ProcessRow(self, index)
+
+    def row(self, pid):
+        return ProcessRow(self, self.pid_index[pid])
+
+    def append(self, pid, arrival_time, burst_time, priority=0):
+        self._make_mutable()
+        self.pids.append(sys.intern(str(pid)))
+        if self._pid_index is not None:
+            self._pid_index[self.pids[-1]] = len(self.pids) - 1
+        self.arrival_time.append(arrival_time)
+        self.burst_time.append(burst_time)
+        self.priority.append(priority)
+        for name in RESULT_COLUMNS:
+            getattr(self, name).append(0)
+        self.remaining_time[-1] = burst_time
+
+    def update(self, index, pid, arrival_time, burst_time, priority=0):
+        self._make_mutable()
+        old_pid = self.pids[index]
+        self.pids[index] = sys.intern(str(pid))
+        if self._pid_index is not None:
+            del self._pid_index[old_pid]
+            self._pid_index[self.pids[index]] = index
+        self.arrival_time[index] = arrival_time
+        self.burst_time[index] = burst_time
+        self.priority[index] = priority
+        self.remaining_time[index] = burst_time
+
+    def __delitem__(self, index):
+        self._make_mutable()
+        del self.pids[index]
+        for name in COLUMNS:
+            del getattr(self, name)[index]
+        self.rebuild_index()
+
+    def extend(self, pids, arrival_time, burst_time, priority):
+        self._make_mutable()
+        start = len(self.pids)
+        self.pids.extend(map(sys.intern, map(str, pids)))
+        self.arrival_time.extend(arrival_time)
+        self.burst_time.extend(burst_time)
+        self.priority.extend(priority)
+        n = len(self.pids)
+        if not (len(self.arrival_time) == len(self.burst_time) == len(self.priority) == n):
+            raise ValueError("All process columns must have the same length")
+
+        added = n - start
+        for name in RESULT_COLUMNS:
+            getattr(self, name).extend(array("q", bytes(8 * added)))
+        self.remaining_time[start:] = self.burst_time[start:]
+        if self._pid_index is not None:
+            self._pid_index.update(zip(self.pids[start:], range(start, n)))
+
+    def sort(self, key=None, reverse=False):
+        if key is None:
+            key = lambda row: row.pid
+        order = sorted(range(len(self.pids)),
+                       key=lambda i: key(ProcessRow(self, i)), reverse=reverse)
+        self.reorder(order)
+
+    def reorder(self, order):
+        self.pids = list(map(self.pids.__getitem__, order))
+        for name in COLUMNS:
+            column = getattr(self, name)
+            setattr(self, name, array("q", map(column.__getitem__, order)))
+        self.rebuild_index()
+
+    def reset_runtime(self):
+        n = len(self.pids)
+        self.remaining_time[:] = self.burst_time
+        self.start_time = array("q", [-1]) * n
+
+    def copy(self):
+        return ProcessTable(self.pids, self.arrival_time, self.burst_time, self.priority)
+
+    def to_processes(self):
+        processes = []
+        for i, pid in enumerate(self.pids):
+            p = Process(pid, self.arrival_time[i], self.burst_time[i], self.priority[i])
+            for name in RESULT_COLUMNS:
+                setattr(p, name, getattr(self, name)[i])
+            processes.append(p)
+        return processes
@@ -0,0 +1,131 @@
+import hashlib
+import os
+import pickle
+import threading
+from array import array
+from collections import OrderedDict
+
+from core.process_table import COLUMNS, INPUT_COLUMNS
+
+DEFAULT_BUDGET = 256 * 1024 * 1024
+ROW_BYTES = 8 * len(COLUMNS) + 64
+SEGMENT_BYTES = 120
+
+
+def workload_fingerprint(process_list):
+    digest = hashlib.blake2b(digest_size=20)
+    pids = getattr(process_list, "pids", None)
+    if pids is None:
+        pids = [p.pid for p in process_list]
+    digest.update(len(pids).to_bytes(8, "little"))
+    for pid in pids:
+        digest.update(str(pid).encode("utf-8"))
+        digest.update(b"\0")
+    for name in INPUT_COLUMNS:
+        values = getattr(process_list, name, None)
+        if values is None:
+            values = array("q", [getattr(p, name) for p in process_list])
+        digest.update(values)
+    return digest.hexdigest()
+
+
+def estimate_size(result, timeline):
+    return len(result) * ROW_BYTES + len(timeline) * SEGMENT_BYTES
+
+
+class ResultCache:
+    def __init__(self, max_bytes=DEFAULT_BUDGET, directory=None):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def key(self, process_list, algorithm_name, quantum=None):
+        return workload_fingerprint(process_list), algorithm_name, quantum
+
+    def get(self, key):
+        with self._lock:
+            return self._get(key)
+
+    def _get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = self._read(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._store(key, entry)
+        else:
+            self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, result, timeline):
+        value = (result, timeline)
+        with self._lock:
+            self._store(key, (value, estimate_size(result, timeline)))
+            self._write(key, value)
+
+    def run(self, key, runner):
+        value = self.get(key)
+        if value is None:
+            value = runner()
+            self.put(key, *value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self.entries.clear()
+            self.size = 0
+
+    def __contains__(self, key):
+        return key in self.entries or (
+            self.directory is not None and os.path.exists(self._path(key)))
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _store(self, key, entry):
+        previous = self.entries.pop(key, None)
+        if previous is not None:
+            self.size -= previous[1]
+        if entry[1] > self.max_bytes:
+            return
+        self.entries[key] = entry
+        self.size += entry[1]
+        while self.size > self.max_bytes:
+            _, (_, size) = self.entries.popitem(last=False)
+            self.size -= size
+
+    def _path(self, key):
+        name = hashlib.blake2b(repr(key).encode("utf-8"), digest_size=20).hexdigest()
+        return os.path.join(self.directory, f"{name}.pickle")
+
+    def _read(self, key):
+        if self.directory is None:
+            return None
+        try:
+            with open(self._path(key), "rb") as cache_file:
+                stored_key, value = pickle.load(cache_file)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+            return None
+        if stored_key != key:
+            return None
+        return value, estimate_size(*value)
+
+    def _write(self, key, value):
+        if self.directory is None:
+            return
+        path = self._path(key)
+        temp_path = f"{path}.tmp"
+        try:
+            with open(temp_path, "wb") as cache_file:
+                pickle.dump((key, value), cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, path)
+        except OSError:
+            pass
@@ -0,0 +1,382 @@
+import heapq
+import random
+from itertools import count
+
+from core.kernel import COMPLETE, DISPATCH, PREEMPT, SEGMENT, _pid_index
+from core.metrics import compute_metrics
+
+BALANCE = "balance"
+BALANCERS = ("pull", "push", "steal", "none")
+BALANCE_INTERVAL = 10
+STEAL_ATTEMPTS = 4
+
+_EVENT_ORDER = {COMPLETE: 1, PREEMPT: 2, BALANCE: 3, DISPATCH: 4}
+
+
+class LoadTree:
+    def __init__(self, size):
+        width = 1
+        while width < size:
+            width *= 2
+        self.width = width
+        self.loads = [0] * size
+        leaves = list(range(size)) + [0] * (width - size)
+        self.low = [0] * width + leaves
+        self.high = [0] * width + leaves
+        for node in range(width - 1, 0, -1):
+            self._pull(node)
+
+    def update(self, cpu, load):
+        loads = self.loads
+        if loads[cpu] == load:
+            return
+        loads[cpu] = load
+        low, high = self.low, self.high
+        node = (cpu + self.width) >> 1
+        while node:
+            left = node << 1
+            a, b = low[left], low[left + 1]
+            low[node] = a if loads[a] <= loads[b] else b
+            a, b = high[left], high[left + 1]
+            high[node] = a if loads[a] >= loads[b] else b
+            node >>= 1
+
+    def argmin(self):
+        return self.low[1]
+
+    def argmax(self):
+        return self.high[1]
+
+    def _pull(self, node):
+        loads = self.loads
+        left = node << 1
+        a, b = self.low[left], self.low[left + 1]
+        self.low[node] = a if loads[a] <= loads[b] else b
+        a, b = self.high[left], self.high[left + 1]
+        self.high[node] = a if loads[a] >= loads[b] else b
+
+
+class SmpKernel:
+    def __init__(self, process_list, policies, balancer="pull", affinity=None,
+                 balance_interval=None, seed=0):
+        if not policies:
+            raise ValueError("At least one CPU is required")
+        if balancer not in BALANCERS:
+            raise ValueError(f"Unsupported balancer: {balancer}")
+        self.process_list = process_list
+        self.policies = policies
+        self.cpus = len(policies)
+        self.balancer = balancer
+        self.affinity = affinity or {}
+        self.balance_interval = balance_interval or BALANCE_INTERVAL
+        self.rng = random.Random(seed)
+        self._pending = [None] * self.cpus
+        self.stats = {
+            "cpus": self.cpus,
+            "dispatches": 0,
+            "preemptions": 0,
+            "context_switches": 0,
+            "migrations": 0,
+            "busy_time": [0] * self.cpus,
+        }
+
+    def run(self):
+        lanes = [[] for _ in range(self.cpus)]
+        for kind, record in self.stream():
+            if kind == SEGMENT:
+                cpu, segment = record
+                lanes[cpu].append(segment)
+        return self.process_list, lanes
+
+    def stream(self):
+        process_list = self.process_list
+        policies = self.policies
+        cpus = self.cpus
+        stats = self.stats
+
+        reset_runtime = getattr(process_list, "reset_runtime", None)
+        if reset_runtime is not None:
+            reset_runtime()
+        else:
+            for p in process_list:
+                p.remaining_time = p.burst_time
+                p.start_time = -1
+        for policy in policies:
+            policy.reset(process_list)
+        self.allowed = self._allowed()
+
+        times = getattr(process_list, "arrival_time", None)
+        if times is None:
+            times = [p.arrival_time for p in process_list]
+        arrivals = sorted(range(len(times)), key=times.__getitem__)
+        arrival_times = [times[i] for i in arrivals]
+        next_arrival = 0
+        unfinished = len(arrivals)
+
+        heap = []
+        seq = count()
+        self.loads = LoadTree(cpus)
+        self.running = running = [None] * cpus
+        run_start = [0] * cpus
+        token = [0] * cpus
+        last = [None] * cpus
+        self.dispatch_pending = dispatch_pending = [False] * cpus
+        self.retry_pending = [False] * cpus
+        self._pending = [None] * cpus
+        stats["busy_time"] = [0] * cpus
+
+        def push(time, kind, cpu, idx=None, event_token=None):
+            heapq.heappush(heap, (time, _EVENT_ORDER[kind], next(seq), kind, cpu, idx, event_token))
+
+        self._push = push
+        if self.balancer == "push" and arrival_times:
+            push(arrival_times[0] + self.balance_interval, BALANCE, None)
+
+        while True:
+            if next_arrival < len(arrivals) and (not heap or arrival_times[next_arrival] <= heap[0][0]):
+                now = arrival_times[next_arrival]
+                idx = arrivals[next_arrival]
+                next_arrival += 1
+                cpu = self._place(idx)
+                policies[cpu].admit(idx, now)
+                self._refresh(cpu)
+                self._wake(cpu, now)
+                continue
+
+            if not heap:
+                break
+            now, _, _, kind, cpu, idx, event_token = heapq.heappop(heap)
+
+            if kind == BALANCE and cpu is not None:
+                self.retry_pending[cpu] = False
+                if running[cpu] is None and not dispatch_pending[cpu]:
+                    push(now, DISPATCH, cpu)
+                    dispatch_pending[cpu] = True
+                continue
+
+            if kind == BALANCE:
+                if unfinished:
+                    self._push_balance(now)
+                    next_time = now + self.balance_interval
+                    if unfinished == len(arrivals) - next_arrival and next_arrival < len(arrivals):
+                        next_time = max(next_time, arrival_times[next_arrival])
+                    push(next_time, BALANCE, None)
+                continue
+
+            policy = policies[cpu]
+            if kind == COMPLETE or kind == PREEMPT:
+                if event_token != token[cpu]:
+                    continue
+                closed = self._charge(cpu, running[cpu], run_start[cpu], now)
+                if closed is not None:
+                    yield SEGMENT, closed
+                if kind == COMPLETE:
+                    unfinished -= 1
+                    yield COMPLETE, self._complete(running[cpu], now)
+                else:
+                    policy.requeue(running[cpu], now)
+                running[cpu] = None
+                push(now, DISPATCH, cpu)
+                dispatch_pending[cpu] = True
+                self._refresh(cpu)
+                continue
+
+            dispatch_pending[cpu] = False
+            preempted = None
+            if running[cpu] is not None:
+                closed = self._charge(cpu, running[cpu], run_start[cpu], now)
+                if closed is not None:
+                    yield SEGMENT, closed
+                policy.requeue(running[cpu], now)
+                preempted = running[cpu]
+                running[cpu] = None
+
+            idx = policy.pick(now)
+            if idx is None and self.balancer == "pull":
+                idx = self._pull(cpu, now)
+            elif idx is None and self.balancer == "steal":
+                idx = self._steal(cpu, now)
+            if idx is None:
+                self._refresh(cpu)
+                if self.balancer == "pull" or self.balancer == "steal":
+                    self._retry(cpu, now)
+                continue
+
+            if preempted is not None and idx != preempted:
+                stats["preemptions"] += 1
+            if idx != last[cpu]:
+                stats["dispatches"] += 1
+                if last[cpu] is not None:
+                    stats["context_switches"] += 1
+
+            p = process_list[idx]
+            if p.start_time == -1:
+                p.start_time = now
+
+            running[cpu] = idx
+            run_start[cpu] = now
+            last[cpu] = idx
+            token[cpu] += 1
+            run_end = now + p.remaining_time
+            quantum = policy.time_slice(idx, now)
+            if quantum is not None:
+                run_end = min(run_end, now + quantum)
+            kind = COMPLETE if run_end - now == p.remaining_time else PREEMPT
+            push(run_end, kind, cpu, idx, token[cpu])
+            self._refresh(cpu)
+
+        for cpu, pending in enumerate(self._pending):
+            if pending is not None:
+                yield SEGMENT, (cpu, pending)
+        self._pending = [None] * cpus
+
+    def _allowed(self):
+        if not self.affinity:
+            return {}
+        index = _pid_index(self.process_list)
+        allowed = {}
+        for pid, cpus in self.affinity.items():
+            idx = index.get(pid)
+            if idx is None:
+                raise ValueError(f"Affinity given for unknown process {pid}")
+            mask = frozenset(cpus)
+            if not mask or min(mask) < 0 or max(mask) >= self.cpus:
+                raise ValueError(f"Affinity of {pid} must list CPUs 0 to {self.cpus - 1}")
+            allowed[idx] = mask
+        return allowed
+
+    def _place(self, idx):
+        mask = self.allowed.get(idx)
+        if mask is None:
+            return self.loads.argmin()
+        loads = self.loads.loads
+        return min(mask, key=lambda cpu: (loads[cpu], cpu))
+
+    def _refresh(self, cpu):
+        self.loads.update(cpu, len(self.policies[cpu]) + (self.running[cpu] is not None))
+
+    def _wake(self, cpu, now):
+        if self.dispatch_pending[cpu]:
+            return
+        if self.running[cpu] is None or self.policies[cpu].preemptive:
+            self._push(now, DISPATCH, cpu)
+            self.dispatch_pending[cpu] = True
+
+    def _migrate(self, source, target, now):
+        policy = self.policies[source]
+        skipped = []
+        moved = False
+        for _ in range(len(policy)):
+            idx = policy.steal(now)
+            if idx is None:
+                break
+            state = policy.detach(idx)
+            mask = self.allowed.get(idx)
+            if mask is None or target in mask:
+                self.policies[target].attach(idx, state, now)
+                moved = True
+                break
+            skipped.append((idx, state))
+        for idx, state in reversed(skipped):
+            policy.attach(idx, state, now)
+        if not moved:
+            return False
+        self.stats["migrations"] += 1
+        self._refresh(source)
+        return True
+
+    def _sources(self, cpu):
+        loads = self.loads.loads
+        for source in sorted(range(self.cpus), key=lambda other: (-loads[other], other)):
+            if source != cpu and len(self.policies[source]):
+                yield source
+
+    def _pull(self, cpu, now):
+        for source in self._sources(cpu):
+            if self._migrate(source, cpu, now):
+                return self.policies[cpu].pick(now)
+        return None
+
+    def _steal(self, cpu, now):
+        victims = []
+        for _ in range(STEAL_ATTEMPTS):
+            victim = self.rng.randrange(self.cpus)
+            if victim != cpu and len(self.policies[victim]):
+                victims.append(victim)
+                break
+        victims.extend(self._sources(cpu))
+
+        for victim in victims:
+            if self._migrate(victim, cpu, now):
+                break
+        else:
+            return None
+        for _ in range(len(self.policies[victim]) // 2):
+            if not self._migrate(victim, cpu, now):
+                break
+        return self.policies[cpu].pick(now)
+
+    def _push_balance(self, now):
+        while self._push_once(now):
+            pass
+
+    def _push_once(self, now):
+        loads = self.loads.loads
+        order = sorted(range(self.cpus), key=lambda cpu: (loads[cpu], cpu))
+        for source in reversed(order):
+            for target in order:
+                if loads[source] - loads[target] <= 1:
+                    break
+                if self._migrate(source, target, now):
+                    self._refresh(target)
+                    self._wake(target, now)
+                    return True
+        return False
+
+    def _retry(self, cpu, now):
+        if self.retry_pending[cpu]:
+            return
+        if any(len(policy) for other, policy in enumerate(self.policies) if other != cpu):
+            self._push(now + self.balance_interval, BALANCE, cpu)
+            self.retry_pending[cpu] = True
+
+    def _charge(self, cpu, idx, start, now):
+        if now == start:
+            return None
+        p = self.process_list[idx]
+        p.remaining_time -= now - start
+        self.stats["busy_time"][cpu] += now - start
+        return self._extend(cpu, p.pid, start, now)
+
+    def _extend(self, cpu, pid, start, end):
+        pending = self._pending[cpu]
+        if pending is not None and pending[0] == pid and pending[2] == start:
+            self._pending[cpu] = (pid, pending[1], end)
+            return None
+        self._pending[cpu] = (pid, start, end)
+        return None if pending is None else (cpu, pending)
+
+    def _complete(self, idx, now):
+        p = self.process_list[idx]
+        p.completion_time = now
+        p.turnaround_time = p.completion_time - p.arrival_time
+        p.waiting_time = p.turnaround_time - p.burst_time
+        return p
+
+
+def smp_summary(metrics, stats):
+    makespan = metrics["completion_time"]
+    capacity = stats["cpus"] * makespan
+    metrics.update(
+        cpus=stats["cpus"],
+        idle_time=max(0, capacity - metrics["total_burst"]),
+        cpu_util=(metrics["total_burst"] / capacity * 100) if capacity else 0,
+        core_util=[busy / makespan * 100 if makespan else 0 for busy in stats["busy_time"]],
+        migrations=stats["migrations"],
+        context_switches=stats["context_switches"],
+    )
+    return metrics
+
+
+def smp_metrics(process_list, stats):
+    return smp_summary(compute_metrics(process_list), stats)
@@ -0,0 +1,156 @@
+import mmap
+import struct
+import sys
+from array import array
+
+from core.process_table import PidTable, ProcessTable
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+TRACE_EXTENSION = ".sched"
+MAGIC = b"OSSCHED\0"
+VERSION = 1
+FLAG_TIMELINE = 1
+IDLE_PID = -1
+
+# magic, version, flags, process count, PID blob length, timeline segment count
+HEADER = struct.Struct("<8sHHxxxxqqq24x")
+
+
+def _padded(length):
+    return -(-length // 8) * 8
+
+
+def _column_bytes(values):
+    column = array("q", values)
+    if sys.byteorder == "big":
+        column.byteswap()
+    return column.tobytes()
+
+
+def save_trace(path, process_list, timeline=None):
+    pids = getattr(process_list, "pids", None)
+    if pids is None:
+        pids = [p.pid for p in process_list]
+        columns = [[getattr(p, name) for p in process_list]
+                   for name in ("arrival_time", "burst_time", "priority")]
+    else:
+        columns = [process_list.arrival_time, process_list.burst_time, process_list.priority]
+
+    encoded = [str(pid).encode("utf-8") for pid in pids]
+    offsets = array("q", [0])
+    total = 0
+    for pid in encoded:
+        total += len(pid)
+        offsets.append(total)
+    blob = b"".join(encoded)
+
+    flags = 0
+    segments = 0
+    if timeline is not None:
+        flags |= FLAG_TIMELINE
+        segments = len(timeline)
+        pid_index = {pid: index for index, pid in enumerate(pids)}
+
+    with open(path, "wb") as trace_file:
+        trace_file.write(HEADER.pack(MAGIC, VERSION, flags, len(encoded), len(blob), segments))
+        for values in columns:
+            trace_file.write(_column_bytes(values))
+        trace_file.write(_column_bytes(offsets))
+        trace_file.write(blob)
+        trace_file.write(bytes(_padded(len(blob)) - len(blob)))
+        if timeline is not None:
+            trace_file.write(_column_bytes(
+                pid_index.get(pid, IDLE_PID) for pid, _, _ in timeline))
+            trace_file.write(_column_bytes(start for _, start, _ in timeline))
+            trace_file.write(_column_bytes(end for _, _, end in timeline))
+
+
+def _int64_view(mapped, offset, count):
+    if np is not None:
+        values = np.frombuffer(mapped, dtype="<i8", count=count, offset=offset)
+        if values.dtype.isnative:
+            return memoryview(values).cast("B").cast("q")
+        return _int64_copy(mapped, offset, count)
+    if sys.byteorder == "little":
+        return memoryview(mapped)[offset:offset + 8 * count].cast("q")
+    return _int64_copy(mapped, offset, count)
+
+
+def _int64_copy(mapped, offset, count):
+    column = array("q")
+    column.frombytes(mapped[offset:offset + 8 * count])
+    column.byteswap()
+    return column
+
+
+class TraceTimeline:
+    __slots__ = ("pids", "pid_ids", "starts", "ends")
+
+    def __init__(self, pids, pid_ids, starts, ends):
+        self.pids = pids
+        self.pid_ids = pid_ids
+        self.starts = starts
+        self.ends = ends
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("timeline index out of range")
+        return self._pid(self.pid_ids[index]), self.starts[index], self.ends[index]
+
+    def __iter__(self):
+        for pid_id, start, end in zip(self.pid_ids, self.starts, self.ends):
+            yield self._pid(pid_id), start, end
+
+    def _pid(self, pid_id):
+        return "IDLE" if pid_id == IDLE_PID else self.pids[pid_id]
+
+
+def load_trace(path):
+    with open(path, "rb") as trace_file:
+        size = len(trace_file.read(HEADER.size))
+        trace_file.seek(0)
+        if size < HEADER.size:
+            raise ValueError(f"{path}: not a scheduler trace file")
+        mapped = mmap.mmap(trace_file.fileno(), 0, access=mmap.ACCESS_COPY)
+
+    magic, version, flags, count, blob_length, segments = HEADER.unpack_from(mapped)
+    if magic != MAGIC:
+        raise ValueError(f"{path}: not a scheduler trace file")
+    if version != VERSION:
+        raise ValueError(f"{path}: unsupported trace version {version}")
+
+    offset = HEADER.size
+    expected = offset + 8 * (4 * count + 1) + _padded(blob_length)
+    if flags & FLAG_TIMELINE:
+        expected += 3 * 8 * segments
+    if len(mapped) < expected:
+        raise ValueError(f"{path}: trace file is truncated")
+
+    columns = []
+    for _ in range(3):
+        columns.append(_int64_view(mapped, offset, count))
+        offset += 8 * count
+    offsets = _int64_view(mapped, offset, count + 1)
+    offset += 8 * (count + 1)
+    blob = memoryview(mapped)[offset:offset + blob_length]
+    offset += _padded(blob_length)
+
+    table = ProcessTable.from_buffers(PidTable(offsets, blob), *columns)
+
+    timeline = None
+    if flags & FLAG_TIMELINE:
+        timeline = TraceTimeline(
+            table.pids,
+            _int64_view(mapped, offset, segments),
+            _int64_view(mapped, offset + 8 * segments, segments),
+            _int64_view(mapped, offset + 16 * segments, segments))
+    return table, timeline
@@ -0,0 +1,42 @@
+def parse_int(value, field_name, allow_zero=True):
+    try:
+        n = int(value.strip())
+    except (ValueError, AttributeError):
+        raise ValueError(f"{field_name} must be an integer")
+    if n < 0:
+        raise ValueError(f"{field_name} must be non-negative")
+    if n == 0 and not allow_zero:
+        raise ValueError(f"{field_name} must be greater than zero")
+    return n
+
+
+def parse_process(pid, arrival_time, burst_time, priority="0"):
+    pid = pid.strip() if isinstance(pid, str) else ""
+    if not pid:
+        raise ValueError("PID is required")
+    return (
+        pid,
+        parse_int(arrival_time, "Arrival time"),
+        parse_int(burst_time, "Burst time", allow_zero=False),
+        parse_int(priority, "Priority"),
+    )
+
+
+def parse_quanta(value, field_name="Quanta", limit=256):
+    quanta = set()
+    for part in value.replace(" ", "").split(","):
+        if not part:
+            continue
+        bounds, _, step = part.partition(":")
+        low, dash, high = bounds.partition("-")
+        start = parse_int(low, field_name, allow_zero=False)
+        stop = parse_int(high, field_name, allow_zero=False) if dash else start
+        step = parse_int(step, f"{field_name} step", allow_zero=False) if step else 1
+        if stop < start:
+            raise ValueError(f"{field_name} range {part} runs backwards")
+        if len(quanta) + (stop - start) // step + 1 > limit:
+            raise ValueError(f"{field_name} can list at most {limit} values")
+        quanta.update(range(start, stop + 1, step))
+    if not quanta:
+        raise ValueError(f"{field_name} is required")
+    return sorted(quanta)
@@ -0,0 +1,40 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from core.process_table import COLUMNS
+
+VECTORIZE_THRESHOLD = 10000
+
+
+def use_numpy(size):
+    return np is not None and size >= VECTORIZE_THRESHOLD
+
+
+def column(process_list, name):
+    values = getattr(process_list, name, None)
+    if values is not None:
+        return np.frombuffer(values, dtype=np.int64)
+    return np.fromiter((getattr(p, name) for p in process_list),
+                       dtype=np.int64, count=len(process_list))
+
+
+def store_column(process_list, name, values):
+    target = getattr(process_list, name, None)
+    if target is not None:
+        np.frombuffer(target, dtype=np.int64)[:] = values
+        return
+    for p, value in zip(process_list, values.tolist()):
+        setattr(p, name, value)
+
+
+def reorder(process_list, order):
+    if not hasattr(process_list, "reorder"):
+        process_list[:] = [process_list[i] for i in order.tolist()]
+        return
+    for name in COLUMNS:
+        values = column(process_list, name)
+        values[:] = values[order]
+    process_list.pids = list(map(process_list.pids.__getitem__, order.tolist()))
+    process_list.rebuild_index()
@@ -0,0 +1,63 @@
+import random
+
+from core.process_table import ProcessTable
+
+
+def _table(arrivals, bursts, rng, priority_levels):
+    size = len(arrivals)
+    return ProcessTable(
+        [f"P{i + 1}" for i in range(size)],
+        arrivals,
+        bursts,
+        [rng.randrange(priority_levels) for _ in range(size)],
+    )
+
+
+def uniform_workload(size, rng, max_burst=20, load=1.0, priority_levels=10):
+    span = max(1, int(size * (max_burst + 1) / 2 / load))
+    arrivals = [rng.randrange(span) for _ in range(size)]
+    bursts = [rng.randint(1, max_burst) for _ in range(size)]
+    return _table(arrivals, bursts, rng, priority_levels)
+
+
+def bursty_workload(size, rng, max_burst=20, cluster_size=64, load=1.0, priority_levels=10):
+    arrivals = []
+    clock = 0
+    while len(arrivals) < size:
+        members = min(size - len(arrivals), max(1, int(rng.expovariate(1 / cluster_size))))
+        arrivals.extend(clock + rng.randrange(5) for _ in range(members))
+        clock += int(rng.expovariate(load / (members * (max_burst + 1) / 2))) + 1
+    bursts = [rng.randint(1, max_burst) for _ in range(size)]
+    return _table(arrivals, bursts, rng, priority_levels)
+
+
+def heavy_tailed_workload(size, rng, alpha=1.2, max_burst=10000, load=1.0, priority_levels=10):
+    bursts = [min(max_burst, int(rng.paretovariate(alpha))) for _ in range(size)]
+    span = max(1, int(sum(bursts) / load))
+    arrivals = [rng.randrange(span) for _ in range(size)]
+    return _table(arrivals, bursts, rng, priority_levels)
+
+
+def sparse_workload(size, rng, max_burst=20, mean_gap=200, priority_levels=10):
+    arrivals = []
+    clock = 0
+    for _ in range(size):
+        clock += int(rng.expovariate(1 / mean_gap))
+        arrivals.append(clock)
+    bursts = [rng.randint(1, max_burst) for _ in range(size)]
+    return _table(arrivals, bursts, rng, priority_levels)
+
+
+WORKLOAD_KINDS = {
+    "uniform": uniform_workload,
+    "bursty": bursty_workload,
+    "heavy-tailed": heavy_tailed_workload,
+    "sparse": sparse_workload,
+}
+
+
+def generate_workload(kind, size, seed=0, **params):
+    generator = WORKLOAD_KINDS.get(kind)
+    if generator is None:
+        raise ValueError(f"Unknown workload kind: {kind}")
+    return generator(size, random.Random(f"{kind}:{size}:{seed}"), **params)
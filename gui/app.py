@@ -1,16 +1,32 @@
 import csv
+import heapq
+import multiprocessing
+import operator
+import os
+import threading
 import tkinter as tk
+from array import array
 from tkinter import ttk, messagebox, filedialog, font as tkfont
 
-from core.process import Process
-from algorithms.fcfs import fcfs_scheduling
-from algorithms.round_robin import round_robin_scheduling
-from algorithms.sjf_np import sjf_non_preemptive
-from algorithms.ljf_np import ljf_non_preemptive
-from algorithms.priority_np import priority_non_preemptive
-from algorithms.priority_p import priority_preemptive
-from algorithms.srtf import srtf_scheduling
+from core.process_table import ProcessTable
+from core.checkpoint import PROGRESS_EVERY
+from core.importer import load_workload
+from core.kernel import COMPLETE, SEGMENT
+from core.metrics import STAT_FIELDS, compute_metrics
+from core.smp import BALANCERS, smp_metrics
+from core.result_cache import ResultCache, workload_fingerprint
+from core.vectorized import use_numpy
+from core.trace_file import TRACE_EXTENSION, save_trace
+from core.validation import parse_int, parse_quanta
+from algorithms import registry
+from algorithms.comparison import iter_comparison
+from algorithms.quantum_sweep import SWEEP_OBJECTIVES, best_quantum, iter_sweep
+from .derivation import DerivationView
+from .gantt import GanttRenderer
+from .sweep_chart import SweepChart
 from .theme import Palette, configure_ttk_styles, build_widget_styles
+from .virtual_table import ColumnRows, VirtualTable
+from .worker import BackgroundJob, CANCELLED, DONE, ERROR, ITEM, PROGRESS
 
 
 class SchedulerApp:
@@ -19,15 +35,7 @@ class SchedulerApp:
     UI_FONT_CANDIDATES = ("Segoe UI", "Helvetica", "Arial", "TkDefaultFont")
     MONO_FONT_CANDIDATES = ("Consolas", "Menlo", "Courier New", "TkFixedFont")
 
-    ALGORITHMS = [
-        "FCFS",
-        "SJF (Non Preemptive)",
-        "LJF (Non Preemptive)",
-        "Round Robin",
-        "Priority (Non Preemptive)",
-        "Priority (Preemptive)",
-        "SRTF (Preemptive SJF)",
-    ]
+    ALGORITHMS = registry.ALGORITHMS
     DEMO_PROCESSES = [
         ("P1", 0, 3, 2),
         ("P2", 1, 6, 1),
@@ -42,16 +50,18 @@ class SchedulerApp:
         "Priority (Non Preemptive)": "Runs the highest-priority available process next. Lower numeric priority value is treated as higher priority.",
         "Priority (Preemptive)": "Always favors the highest-priority ready process, even if it must interrupt the current one.",
         "SRTF (Preemptive SJF)": "Runs the process with the shortest remaining time. It is the preemptive version of SJF.",
+        "MLFQ": "Multilevel feedback queue. New processes start at the top level; using a full quantum demotes them to a level with double the quantum. All processes are periodically boosted back to the top.",
+        "CFS": "Completely fair scheduling. Priority is treated as a nice value that sets each process's CPU share, and the process with the least weighted runtime runs next.",
     }
 
-    ALGORITHM_DISPATCH = {
-        "FCFS": lambda procs, tq: fcfs_scheduling(procs),
-        "SJF (Non Preemptive)": lambda procs, tq: sjf_non_preemptive(procs),
-        "LJF (Non Preemptive)": lambda procs, tq: ljf_non_preemptive(procs),
-        "Round Robin": lambda procs, tq: round_robin_scheduling(procs, tq),
-        "Priority (Non Preemptive)": lambda procs, tq: priority_non_preemptive(procs),
-        "Priority (Preemptive)": lambda procs, tq: priority_preemptive(procs),
-        "SRTF (Preemptive SJF)": lambda procs, tq: srtf_scheduling(procs),
+    ALGORITHM_DISPATCH = registry.ALGORITHM_DISPATCH
+    CACHE_DIR_ENV = "OS_SCHEDULER_CACHE_DIR"
+    TAIL_PLACEHOLDER = "Waiting Time p50 / p95 / p99 / max: —    Turnaround p99: —    Response p99: —"
+    JOB_LABELS = {
+        "import": "Importing workload",
+        "simulate": "Simulating",
+        "compare": "Comparing algorithms",
+        "sweep": "Sweeping quanta",
     }
 
     PROJECT_INFO = {
@@ -109,6 +119,27 @@ class SchedulerApp:
                 ("P4", 3, 1, 4),
             ],
         },
+        "Interactive vs Batch (MLFQ)": {
+            "description": "Two long batch jobs and a stream of short interactive ones. MLFQ keeps the short jobs responsive without knowing burst times.",
+            "processes": [
+                ("P1", 0, 24, 3),
+                ("P2", 0, 20, 3),
+                ("P3", 2, 2, 1),
+                ("P4", 6, 1, 1),
+                ("P5", 10, 2, 1),
+                ("P6", 14, 1, 1),
+                ("P7", 18, 2, 1),
+            ],
+        },
+        "Weighted Shares (CFS)": {
+            "description": "Equal jobs with different priorities arriving together. CFS splits the CPU by weight, so lower priority numbers finish first without starving the rest.",
+            "processes": [
+                ("P1", 0, 12, 0),
+                ("P2", 0, 12, 2),
+                ("P3", 0, 12, 5),
+                ("P4", 4, 3, 0),
+            ],
+        },
         "Identical Arrivals": {
             "description": "All processes arrive at t=0. Pure burst-time comparison; SJF should dominate.",
             "processes": [
@@ -128,12 +159,20 @@ class SchedulerApp:
 
         self._resolve_fonts()
 
-        self.processes = []
+        self.processes = ProcessTable()
         self.selected_process_index = None
+        self.last_result = None
         self.last_result_rows = []
         self.last_comparison_rows = []
+        self.last_sweep_rows = []
         self.last_metrics = {}
         self.last_timeline = []
+        self.last_lanes = []
+        self._jobs = {}
+        self._job_progress = {}
+        self._simulation_lock = threading.Lock()
+        self.result_cache = ResultCache(directory=os.environ.get(self.CACHE_DIR_ENV) or None)
+        self._simulators = {}
 
         self._build_ui()
 
@@ -150,7 +189,7 @@ class SchedulerApp:
 
         self.refresh_process_tree()
         self.update_summary_cards()
-        self.show_gantt_chart(self.last_timeline)
+        self.show_gantt_chart(self.last_timeline, lanes=self.last_lanes)
 
         if self.algo_var.get():
             self.update_quantum_state()
@@ -163,12 +202,19 @@ class SchedulerApp:
         if self.last_comparison_rows:
             self._repopulate_comparison()
 
+        if self.last_sweep_rows:
+            self._show_sweep()
+
     def toggle_theme(self):
         new_theme = "light" if Palette.current_name() == "dark" else "dark"
         Palette.set_theme(new_theme)
 
         saved_algo = self.algo_var.get() if hasattr(self, "algo_var") else None
         saved_quantum = self.quantum_entry.get() if hasattr(self, "quantum_entry") else "3"
+        saved_quanta = self.sweep_quanta_entry.get() if hasattr(self, "sweep_quanta_entry") else None
+        saved_objective = self.sweep_objective_var.get() if hasattr(self, "sweep_objective_var") else None
+        saved_cpus = self.cpus_entry.get() if hasattr(self, "cpus_entry") else "1"
+        saved_balancer = self.balancer_var.get() if hasattr(self, "balancer_var") else None
 
         for child in self.root.winfo_children():
             child.destroy()
@@ -182,6 +228,17 @@ class SchedulerApp:
         self.quantum_entry.delete(0, tk.END)
         self.quantum_entry.insert(0, saved_quantum)
         self.update_quantum_state()
+        self.cpus_entry.delete(0, tk.END)
+        self.cpus_entry.insert(0, saved_cpus)
+        if saved_balancer:
+            self.balancer_var.set(saved_balancer)
+        if saved_quanta is not None:
+            self.sweep_quanta_entry.delete(0, tk.END)
+            self.sweep_quanta_entry.insert(0, saved_quanta)
+        if saved_objective:
+            self.sweep_objective_var.set(saved_objective)
+            if self.last_sweep_rows:
+                self._show_sweep()
 
     def show_help_dialog(self):
         dialog = tk.Toplevel(self.root)
@@ -319,34 +376,56 @@ class SchedulerApp:
         ).pack(anchor="w", pady=(2, 0))
 
     def _repopulate_results(self):
-        self.results_tree.delete(*self.results_tree.get_children())
-        for row in self.last_result_rows:
-            self.results_tree.insert(
-                "", "end", values=row,
-                tags=(self._next_row_tag(self.results_tree),))
+        self.results_tree.set_rows(self.last_result_rows)
+        if self.last_result is not None:
+            self.derivation_view.set_result(self.last_result, self.last_timeline)
         if self.last_metrics:
-            m = self.last_metrics
-            self.averages_label.configure(
-                text=f"Average Waiting Time: {m['avg_wt']:.2f}    Average Turnaround Time: {m['avg_tat']:.2f}")
-            self.performance_label.configure(
-                text=f"Response Time Avg: {m['avg_rt']:.2f}    CPU Idle Time: {m['idle_time']}    "
-                     f"CPU Utilization: {m['cpu_util']:.2f}%")
-            self.update_summary_cards(
-                f"{m['avg_wt']:.2f}", f"{m['avg_tat']:.2f}",
-                str(m['idle_time']), f"{m['cpu_util']:.2f}%")
+            self._show_metrics(self.last_metrics)
+
+    def _show_metrics(self, m):
+        self.averages_label.configure(
+            text=f"Average Waiting Time: {m['avg_wt']:.2f}    Average Turnaround Time: {m['avg_tat']:.2f}")
+        performance = (f"Response Time Avg: {m['avg_rt']:.2f}    CPU Idle Time: {m['idle_time']}    "
+                       f"CPU Utilization: {m['cpu_util']:.2f}%")
+        if m.get("cpus", 1) > 1:
+            core_util = m["core_util"]
+            performance += (f"    CPUs: {m['cpus']}    Migrations: {m['migrations']}    "
+                            f"Per-core Util min / avg / max: {min(core_util):.1f} / "
+                            f"{sum(core_util) / len(core_util):.1f} / {max(core_util):.1f}%")
+        self.performance_label.configure(text=performance)
+        self.tail_label.configure(
+            text=f"Waiting Time p50 / p95 / p99 / max: {m['p50_wt']} / {m['p95_wt']} / "
+                 f"{m['p99_wt']} / {m['max_wt']}    "
+                 f"Turnaround p99: {m['p99_tat']}    Response p99: {m['p99_rt']}")
+        self.update_summary_cards(
+            f"{m['avg_wt']:.2f}", f"{m['avg_tat']:.2f}",
+            str(m['idle_time']), f"{m['cpu_util']:.2f}%")
 
     def _repopulate_comparison(self):
         self.comparison_tree.delete(*self.comparison_tree.get_children())
-        for row in self.last_comparison_rows:
+        for algorithm_name, metrics in self.last_comparison_rows:
             self.comparison_tree.insert(
-                "", "end", values=row[:3],
+                "", "end", values=self._comparison_values(algorithm_name, metrics),
                 tags=(self._next_row_tag(self.comparison_tree),))
-        if self.last_comparison_rows:
-            best_row = min(self.last_comparison_rows, key=lambda r: (r[3], r[4], r[0]))
-            self.best_algorithm_label.configure(
-                text=f"{best_row[0]}   ·   Avg WT: {best_row[1]}   ·   Avg TAT: {best_row[2]}")
+        self._show_best_algorithm()
         self.highlight_selected_algorithm()
 
+    @staticmethod
+    def _comparison_values(algorithm_name, metrics):
+        return (algorithm_name, f"{metrics['avg_wt']:.2f}", metrics["p95_wt"],
+                metrics["p99_wt"], f"{metrics['avg_tat']:.2f}", metrics["p99_tat"])
+
+    def _show_best_algorithm(self):
+        if not self.last_comparison_rows:
+            self.best_algorithm_label.configure(text="Run comparison to see results")
+            return
+        algorithm_name, metrics = min(
+            self.last_comparison_rows,
+            key=lambda row: (row[1]["p99_wt"], row[1]["avg_wt"], row[1]["avg_tat"], row[0]))
+        self.best_algorithm_label.configure(
+            text=f"{algorithm_name}   ·   P99 WT: {metrics['p99_wt']}   ·   "
+                 f"Avg WT: {metrics['avg_wt']:.2f}   ·   Avg TAT: {metrics['avg_tat']:.2f}")
+
 
     def _apply_zoomed_state(self):
         try:
@@ -618,6 +697,11 @@ class SchedulerApp:
         table_actions = tk.Frame(table_header, bg=Palette.BG_SURFACE)
         table_actions.pack(side="right")
 
+        tk.Button(
+            table_actions, text="Import Workload",
+            command=self.import_workload,
+            **self.secondary_button_style,
+        ).pack(side="left", padx=(0, 10))
         tk.Button(
             table_actions, text="Delete Selected",
             command=self.delete_selected_process,
@@ -632,20 +716,11 @@ class SchedulerApp:
         table_frame = tk.Frame(table_outer, bg=Palette.BG_SURFACE)
         table_frame.pack(fill="both", expand=True, padx=24, pady=(0, 24))
 
-        self.tree = ttk.Treeview(
-            table_frame, columns=("PID", "AT", "BT", "PR"),
-            show="headings", style="Scheduler.Treeview")
-        for col, header in (("PID", "Process ID"), ("AT", "Arrival"),
-                            ("BT", "Burst"), ("PR", "Priority")):
-            self.tree.heading(col, text=header)
-            self.tree.column(col, width=150, anchor="center")
-
-        table_scroll = ttk.Scrollbar(table_frame, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscrollcommand=table_scroll.set)
-        self.tree.pack(side="left", fill="both", expand=True)
-        table_scroll.pack(side="right", fill="y")
-        self.tree.bind("<<TreeviewSelect>>", self.on_tree_select)
-        self._apply_tree_row_styles(self.tree)
+        self.tree = VirtualTable(
+            table_frame, ("PID", "AT", "BT", "PR"),
+            ("Process ID", "Arrival", "Burst", "Priority"),
+            widths=(150, 150, 150, 150), on_select=self.on_tree_select)
+        self.tree.pack(fill="both", expand=True)
 
         self.processes_empty_label = tk.Label(
             table_frame,
@@ -710,8 +785,31 @@ class SchedulerApp:
         self.quantum_entry.pack(fill="x", ipady=6)
         self.quantum_entry.insert(0, "3")
 
+        cpus_col = tk.Frame(algo_frame, bg=Palette.BG_SURFACE)
+        cpus_col.grid(row=0, column=2, sticky="ew", padx=(0, 16))
+        tk.Label(
+            cpus_col, text="CPUs",
+            font=(self.UI_FONT, 9, "bold"),
+            fg=Palette.TEXT_MUTED, bg=Palette.BG_SURFACE,
+        ).pack(anchor="w", pady=(0, 6))
+        self.cpus_entry = tk.Entry(cpus_col, width=6, **self.entry_style)
+        self.cpus_entry.pack(fill="x", ipady=6)
+        self.cpus_entry.insert(0, "1")
+
+        balancer_col = tk.Frame(algo_frame, bg=Palette.BG_SURFACE)
+        balancer_col.grid(row=0, column=3, sticky="ew", padx=(0, 16))
+        tk.Label(
+            balancer_col, text="Load Balancer",
+            font=(self.UI_FONT, 9, "bold"),
+            fg=Palette.TEXT_MUTED, bg=Palette.BG_SURFACE,
+        ).pack(anchor="w", pady=(0, 6))
+        self.balancer_var = tk.StringVar(value=BALANCERS[0])
+        ttk.Combobox(
+            balancer_col, textvariable=self.balancer_var, values=BALANCERS, width=8,
+            state="readonly", style="Scheduler.TCombobox").pack(fill="x")
+
         action_col = tk.Frame(algo_frame, bg=Palette.BG_SURFACE)
-        action_col.grid(row=0, column=2, sticky="e")
+        action_col.grid(row=0, column=4, sticky="e")
         tk.Label(
             action_col, text=" ",
             font=(self.UI_FONT, 9, "bold"),
@@ -731,6 +829,8 @@ class SchedulerApp:
         algo_frame.grid_columnconfigure(0, weight=3)
         algo_frame.grid_columnconfigure(1, weight=1)
         algo_frame.grid_columnconfigure(2, weight=0)
+        algo_frame.grid_columnconfigure(3, weight=0)
+        algo_frame.grid_columnconfigure(4, weight=0)
 
         help_chip = tk.Frame(
             algo_card, bg=Palette.BG_SURFACE_2,
@@ -767,6 +867,7 @@ class SchedulerApp:
             highlightthickness=1, highlightbackground=Palette.BORDER_SOFT,
         )
         self.gantt_canvas.pack(fill="x", padx=24, pady=(0, 24))
+        self.gantt_renderer = GanttRenderer(self.gantt_canvas, self.UI_FONT, self.DISPLAY_FONT)
 
         output_card = self._card(self.simulation_page)
         output_card.pack(fill="both", expand=True, pady=(0, 16))
@@ -794,20 +895,10 @@ class SchedulerApp:
         results_table_frame = tk.Frame(output_card, bg=Palette.BG_SURFACE)
         results_table_frame.pack(fill="both", expand=True, padx=24, pady=(0, 12))
 
-        self.results_tree = ttk.Treeview(
-            results_table_frame, columns=("PID", "CT", "TAT", "WT", "RT"),
-            show="headings", style="Scheduler.Treeview", height=6)
-        for col, header in (("PID", "Process"), ("CT", "Completion"),
-                            ("TAT", "Turnaround"), ("WT", "Waiting"), ("RT", "Response")):
-            self.results_tree.heading(col, text=header)
-            self.results_tree.column(col, anchor="center", width=120)
-
-        results_scroll = ttk.Scrollbar(
-            results_table_frame, orient="vertical", command=self.results_tree.yview)
-        self.results_tree.configure(yscrollcommand=results_scroll.set)
-        self.results_tree.pack(side="left", fill="both", expand=True)
-        results_scroll.pack(side="right", fill="y")
-        self._apply_tree_row_styles(self.results_tree)
+        self.results_tree = VirtualTable(
+            results_table_frame, ("PID", "CT", "TAT", "WT", "RT"),
+            ("Process", "Completion", "Turnaround", "Waiting", "Response"), height=6)
+        self.results_tree.pack(fill="both", expand=True)
 
         metric_strip = tk.Frame(output_card, bg=Palette.BG_SURFACE)
         metric_strip.pack(fill="x", padx=24, pady=(0, 8))
@@ -824,7 +915,14 @@ class SchedulerApp:
             font=(self.UI_FONT, 10),
             fg=Palette.TEXT_MUTED, bg=Palette.BG_SURFACE,
         )
-        self.performance_label.pack(anchor="w", pady=(4, 22))
+        self.performance_label.pack(anchor="w", pady=(4, 0))
+        self.tail_label = tk.Label(
+            metric_strip,
+            text=self.TAIL_PLACEHOLDER,
+            font=(self.UI_FONT, 10),
+            fg=Palette.TEXT_MUTED, bg=Palette.BG_SURFACE,
+        )
+        self.tail_label.pack(anchor="w", pady=(4, 22))
 
         solution_card = self._card(self.simulation_page)
         solution_card.pack(fill="both", expand=True, pady=(0, 16))
@@ -832,8 +930,9 @@ class SchedulerApp:
             solution_card, "Calculation Breakdown",
             "Step-by-step math showing how each metric was derived."
         )
-        self.solution_text = tk.Text(solution_card, height=8, **self.text_style)
-        self.solution_text.pack(fill="both", expand=True, padx=24, pady=(0, 24))
+        self.derivation_view = DerivationView(
+            solution_card, self.text_style, self.entry_style,
+            self.secondary_button_style, self.UI_FONT)
 
         footer_actions = tk.Frame(self.simulation_page, bg=Palette.BG_APP)
         footer_actions.pack(fill="x", pady=(0, 10))
@@ -891,12 +990,16 @@ class SchedulerApp:
         comparison_table_frame.pack(fill="both", expand=True, padx=24, pady=(0, 24))
 
         self.comparison_tree = ttk.Treeview(
-            comparison_table_frame, columns=("Algorithm", "Avg WT", "Avg TAT"),
+            comparison_table_frame,
+            columns=("Algorithm", "Avg WT", "P95 WT", "P99 WT", "Avg TAT", "P99 TAT"),
             show="headings", style="Scheduler.Treeview", height=7)
         for col, header, width in (
-            ("Algorithm", "Algorithm", 280),
-            ("Avg WT", "Avg. Waiting Time", 160),
-            ("Avg TAT", "Avg. Turnaround", 160),
+            ("Algorithm", "Algorithm", 240),
+            ("Avg WT", "Avg. Waiting Time", 140),
+            ("P95 WT", "p95 Waiting", 110),
+            ("P99 WT", "p99 Waiting", 110),
+            ("Avg TAT", "Avg. Turnaround", 140),
+            ("P99 TAT", "p99 Turnaround", 120),
         ):
             self.comparison_tree.heading(col, text=header)
             self.comparison_tree.column(col, anchor="center", width=width)
@@ -911,15 +1014,77 @@ class SchedulerApp:
             background=Palette.ROW_SELECTED, foreground=Palette.ROW_SELECTED_FG)
         self._apply_tree_row_styles(self.comparison_tree)
 
+        sweep_card = self._card(self.comparison_page)
+        sweep_card.pack(fill="x", pady=(0, 16))
+        self._section_title(
+            sweep_card, "Round Robin Quantum Sweep",
+            "Runs Round Robin once per quantum, e.g. 1-20 or 2,4,8,16-64:16, and marks the best one."
+        )
+
+        sweep_controls = tk.Frame(sweep_card, bg=Palette.BG_SURFACE)
+        sweep_controls.pack(fill="x", padx=24, pady=(0, 12))
+        tk.Label(
+            sweep_controls, text="Quanta",
+            font=(self.UI_FONT, 9, "bold"),
+            fg=Palette.TEXT_MUTED, bg=Palette.BG_SURFACE,
+        ).pack(side="left", padx=(0, 8))
+        self.sweep_quanta_entry = tk.Entry(sweep_controls, width=18, **self.entry_style)
+        self.sweep_quanta_entry.insert(0, "1-20")
+        self.sweep_quanta_entry.pack(side="left", ipady=6)
+        self.sweep_quanta_entry.bind("<Return>", lambda e: self.sweep_quanta())
+        tk.Label(
+            sweep_controls, text="Optimize",
+            font=(self.UI_FONT, 9, "bold"),
+            fg=Palette.TEXT_MUTED, bg=Palette.BG_SURFACE,
+        ).pack(side="left", padx=(18, 8))
+        self.sweep_objective_var = tk.StringVar(value=SWEEP_OBJECTIVES["p99_wt"])
+        sweep_objective = ttk.Combobox(
+            sweep_controls, textvariable=self.sweep_objective_var,
+            values=list(SWEEP_OBJECTIVES.values()),
+            state="readonly", width=24, style="Scheduler.TCombobox",
+        )
+        sweep_objective.pack(side="left")
+        sweep_objective.bind("<<ComboboxSelected>>", lambda e: self._show_sweep())
+        tk.Button(
+            sweep_controls, text="Run Sweep",
+            command=self.sweep_quanta, **self.button_style,
+        ).pack(side="left", padx=(18, 0))
+
+        self.sweep_best_label = tk.Label(
+            sweep_card, text="Best quantum: —",
+            font=(self.UI_FONT, 10, "bold"),
+            fg=Palette.TEXT_PRIMARY, bg=Palette.BG_SURFACE,
+        )
+        self.sweep_best_label.pack(anchor="w", padx=24)
+        sweep_canvas = tk.Canvas(
+            sweep_card, height=220, bg=Palette.BG_SURFACE_2, highlightthickness=0)
+        sweep_canvas.pack(fill="x", padx=24, pady=(8, 24))
+        self.sweep_chart = SweepChart(sweep_canvas, self.UI_FONT)
+
     def _build_footer(self):
         footer_frame = tk.Frame(self.main_frame, bg=Palette.BG_APP)
         footer_frame.pack(fill="x", padx=28, pady=(0, 24))
-        tk.Label(
+        self.footer_status_frame = tk.Frame(footer_frame, bg=Palette.BG_APP)
+        self.footer_status_label = tk.Label(
+            self.footer_status_frame, text="",
+            font=(self.UI_FONT, 9, "bold"),
+            fg=Palette.PRIMARY, bg=Palette.BG_APP,
+        )
+        self.footer_status_label.pack(side="left", padx=(0, 10))
+        self.footer_progress = ttk.Progressbar(
+            self.footer_status_frame, length=180, mode="determinate", maximum=100)
+        self.footer_progress.pack(side="left", padx=(0, 10))
+        tk.Button(
+            self.footer_status_frame, text="Cancel",
+            command=self.cancel_jobs, **self.secondary_button_style,
+        ).pack(side="left")
+        self.footer_caption_label = tk.Label(
             footer_frame,
             text="Operating Systems Mini Project  ·  CPU Scheduling Simulator  ·  Built with Python and Tkinter",
             font=(self.UI_FONT, 9),
             fg=Palette.TEXT_SUBTLE, bg=Palette.BG_APP,
-        ).pack(anchor="center")
+        )
+        self.footer_caption_label.pack(anchor="center")
         tk.Label(
             footer_frame,
             text="Shortcuts: Ctrl+N new process  ·  Ctrl+R / F5 simulate  ·  Ctrl+Shift+C compare  ·  Ctrl+E export  ·  Esc cancel edit",
@@ -1055,7 +1220,7 @@ class SchedulerApp:
         self.root.bind_all("<Escape>", lambda e: self.cancel_edit()
                            if self.selected_process_index is not None else None)
 
-        self.tree.bind("<Delete>", lambda e: self.delete_selected_process())
+        self.tree.view.bind("<Delete>", lambda e: self.delete_selected_process())
 
 
         for entry, field in (
@@ -1090,11 +1255,7 @@ class SchedulerApp:
             if not value:
                 self._mark_valid(entry)
                 return
-            is_duplicate = any(
-                p.pid == value and idx != self.selected_process_index
-                for idx, p in enumerate(self.processes)
-            )
-            if is_duplicate:
+            if self._is_duplicate_pid(value):
                 self._mark_invalid(entry)
             else:
                 self._mark_valid(entry)
@@ -1124,15 +1285,7 @@ class SchedulerApp:
 
     @staticmethod
     def _parse_int(value, field_name, allow_zero=True):
-        try:
-            n = int(value.strip())
-        except (ValueError, AttributeError):
-            raise ValueError(f"{field_name} must be an integer")
-        if n < 0:
-            raise ValueError(f"{field_name} must be non-negative")
-        if n == 0 and not allow_zero:
-            raise ValueError(f"{field_name} must be greater than zero")
-        return n
+        return parse_int(value, field_name, allow_zero)
 
 
     def get_selected_algorithm(self):
@@ -1167,25 +1320,24 @@ class SchedulerApp:
             messagebox.showerror("Invalid input", str(error))
             return
 
-        duplicate_pid = any(
-            existing_process.pid == pid and index != self.selected_process_index
-            for index, existing_process in enumerate(self.processes)
-        )
-        if duplicate_pid:
+        if self._is_duplicate_pid(pid):
             messagebox.showerror("Invalid input", "PID must be unique")
             return
 
-        process = Process(pid, at, bt, pr)
-
         if self.selected_process_index is None:
-            self.processes.append(process)
+            edit = self._pending_edit(at)
+            self.processes.append(pid, at, bt, pr)
         else:
-            self.processes[self.selected_process_index] = process
+            previous = self.processes[self.selected_process_index]
+            edit = self._pending_edit(previous.arrival_time, at)
+            self.processes.update(self.selected_process_index, pid, at, bt, pr)
             self.cancel_edit()
             self.clear_process_form()
             self.update_summary_cards()
             self.refresh_process_tree()
             self._reset_all_entry_borders()
+            if self.algo_var.get():
+                self.simulate(show_errors=False, navigate=False, edit=edit)
             return
 
         self.clear_process_form()
@@ -1194,18 +1346,16 @@ class SchedulerApp:
         self._reset_all_entry_borders()
 
         if self.algo_var.get():
-            self.simulate(show_errors=False, navigate=False)
+            self.simulate(show_errors=False, navigate=False, edit=edit)
+
+    def _is_duplicate_pid(self, pid):
+        index = self.processes.pid_index.get(pid)
+        return index is not None and index != self.selected_process_index
 
     def on_add_process_enter(self, event=None):
         self.add_or_update_process()
 
-    def on_tree_select(self, event=None):
-        selection = self.tree.selection()
-        if not selection:
-            return
-
-        item_id = selection[0]
-        item_index = self.tree.index(item_id)
+    def on_tree_select(self, item_index):
         process = self.processes[item_index]
 
         self.selected_process_index = item_index
@@ -1220,23 +1370,24 @@ class SchedulerApp:
 
     def cancel_edit(self):
         self.selected_process_index = None
-        self.tree.selection_remove(*self.tree.selection())
+        self.tree.clear_selection()
         self.set_edit_mode(False)
         self.clear_process_form()
 
     def delete_selected_process(self):
-        selection = self.tree.selection()
-        if not selection:
+        item_index = self.tree.selected_index
+        if item_index is None:
             messagebox.showerror("Error", "Select a process to delete")
             return
 
-        item_id = selection[0]
-        item_index = self.tree.index(item_id)
+        edit = self._pending_edit(self.processes[item_index].arrival_time)
         del self.processes[item_index]
         self.cancel_edit()
         self.refresh_process_tree()
         self.clear_simulation_outputs()
         self.update_summary_cards()
+        if self.processes and self.algo_var.get():
+            self.simulate(show_errors=False, navigate=False, edit=edit)
 
     def clear_all_processes(self):
 
@@ -1247,7 +1398,8 @@ class SchedulerApp:
                 icon="warning",
             ):
                 return
-        self.processes.clear()
+        self.cancel_jobs("simulate", "compare")
+        self.processes = ProcessTable()
         self.refresh_process_tree()
         self.cancel_edit()
         self.clear_simulation_outputs()
@@ -1276,10 +1428,10 @@ class SchedulerApp:
                 icon="question",
             ):
                 return
-        self.processes.clear()
+        self.processes = ProcessTable()
         self.cancel_edit()
         for pid, at, bt, pr in preset["processes"]:
-            self.processes.append(Process(pid, at, bt, pr))
+            self.processes.append(pid, at, bt, pr)
         self.refresh_process_tree()
         self.update_summary_cards()
         self._reset_all_entry_borders()
@@ -1287,6 +1439,112 @@ class SchedulerApp:
         self.compare_algorithms(navigate=False)
 
 
+    def import_workload(self):
+        file_path = filedialog.askopenfilename(
+            filetypes=[("Workload files", "*.csv *.jsonl *.ndjson *.sched"),
+                       ("CSV files", "*.csv"), ("JSON Lines files", "*.jsonl *.ndjson"),
+                       ("Scheduler traces", "*.sched")],
+            title="Import Workload")
+        if not file_path:
+            return
+        if self.processes:
+            if not messagebox.askyesno(
+                "Import workload?",
+                "This will replace the current workload with the imported file.\n\nContinue?",
+                icon="question",
+            ):
+                return
+
+        self._start_job(
+            "import", self._import_worker, file_path,
+            on_done=self._finish_import,
+            on_error=lambda error: messagebox.showerror("Import failed", str(error)))
+
+    @staticmethod
+    def _import_worker(job, file_path):
+        return load_workload(file_path, progress=job.progress)
+
+    def _start_job(self, kind, target, *args,
+                   on_item=None, on_done=None, on_error=None, on_cancel=None):
+        previous = self._jobs.get(kind)
+        if previous is not None:
+            previous.cancel()
+        job = BackgroundJob(target, *args).start()
+        self._jobs[kind] = job
+        self._job_progress[kind] = None
+        self._update_job_status()
+        self._poll_job(kind, job, (on_item, on_done, on_error, on_cancel))
+        return job
+
+    def _poll_job(self, kind, job, handlers):
+        if self._jobs.get(kind) is not job:
+            return
+        on_item, on_done, on_error, on_cancel = handlers
+        for update in job.drain():
+            if update[0] == PROGRESS:
+                self._job_progress[kind] = update[1:]
+                self._update_job_status()
+            elif update[0] == ITEM:
+                if on_item is not None:
+                    on_item(update[1])
+            else:
+                del self._jobs[kind]
+                self._job_progress.pop(kind, None)
+                self._update_job_status()
+                if update[0] == DONE and on_done is not None:
+                    on_done(update[1])
+                elif update[0] == ERROR and on_error is not None:
+                    on_error(update[1])
+                elif update[0] == CANCELLED and on_cancel is not None:
+                    on_cancel()
+                return
+        self.root.after(50, self._poll_job, kind, job, handlers)
+
+    def cancel_jobs(self, *kinds):
+        for kind, job in self._jobs.items():
+            if not kinds or kind in kinds:
+                job.cancel()
+        if self._jobs:
+            self.footer_status_label.configure(text="Cancelling…")
+
+    def _update_job_status(self):
+        if not self._jobs:
+            self.footer_status_frame.pack_forget()
+            return
+
+        kind = list(self._jobs)[-1]
+        label = self.JOB_LABELS.get(kind, "Working")
+        if self._jobs[kind].cancelled:
+            label = "Cancelling"
+        progress = self._job_progress.get(kind)
+        if progress is None:
+            percent = 0
+            text = f"{label}…"
+        else:
+            done, total = progress
+            percent = 100 * done / total if total else 100
+            text = f"{label}… {percent:.0f}%"
+        if len(self._jobs) > 1:
+            text += f"  (+{len(self._jobs) - 1} more)"
+
+        self.footer_status_label.configure(text=text)
+        self.footer_progress.configure(value=percent)
+        if not self.footer_status_frame.winfo_ismapped():
+            self.footer_status_frame.pack(
+                anchor="center", pady=(0, 6), before=self.footer_caption_label)
+
+    def _finish_import(self, table):
+        if not len(table):
+            messagebox.showerror("Import failed", "The file contains no processes")
+            return
+        self.processes = table
+        self.cancel_edit()
+        self.refresh_process_tree()
+        self.update_summary_cards()
+        self._reset_all_entry_borders()
+        self.simulate(show_errors=False, navigate=False)
+        self.compare_algorithms(navigate=False)
+
     def update_summary_cards(self, avg_wt="—", avg_tat="—", idle_time="—", cpu_util="—"):
         selected_algorithm = self.get_selected_algorithm()
         process_count = len(self.processes)
@@ -1306,13 +1564,9 @@ class SchedulerApp:
             self.status_dot.create_oval(1, 1, 7, 7, fill=dot_color, outline="")
 
     def refresh_process_tree(self):
-        self.tree.delete(*self.tree.get_children())
-        for process in self.processes:
-            self.tree.insert(
-                "", "end",
-                values=(process.pid, process.arrival_time,
-                        process.burst_time, process.priority),
-                tags=(self._next_row_tag(self.tree),))
+        table = self.processes
+        self.tree.set_rows(ColumnRows(
+            [table.pids, table.arrival_time, table.burst_time, table.priority]))
         if hasattr(self, "processes_empty_label"):
             if self.processes:
                 self.processes_empty_label.place_forget()
@@ -1322,20 +1576,23 @@ class SchedulerApp:
     def clear_simulation_outputs(self):
         self.gantt_canvas.delete("all")
         self.show_gantt_chart([])
-        self.solution_text.delete("1.0", tk.END)
-        self.results_tree.delete(*self.results_tree.get_children())
+        self.derivation_view.clear()
+        self.results_tree.set_rows([])
         self.averages_label.configure(
             text="Average Waiting Time: —    Average Turnaround Time: —")
         self.performance_label.configure(
             text="Response Time Avg: —    CPU Idle Time: —    CPU Utilization: —")
+        self.tail_label.configure(text=self.TAIL_PLACEHOLDER)
+        self.last_result = None
         self.last_result_rows = []
         self.last_metrics = {}
         self.last_timeline = []
+        self.last_lanes = []
         self.update_summary_cards()
 
     def update_quantum_state(self):
-        is_round_robin = self.algo_var.get() == "Round Robin"
-        self.quantum_entry.configure(state="normal" if is_round_robin else "disabled")
+        uses_quantum = self.algo_var.get() in registry.QUANTUM_ALGORITHMS
+        self.quantum_entry.configure(state="normal" if uses_quantum else "disabled")
 
     def on_algorithm_change(self, event=None):
         self.update_quantum_state()
@@ -1346,25 +1603,61 @@ class SchedulerApp:
 
         if not self.processes:
             return
-        if self.algo_var.get() == "Round Robin" and not self.quantum_entry.get().strip().isdigit():
+        if (self.algo_var.get() in registry.QUANTUM_ALGORITHMS
+                and not self.quantum_entry.get().strip().isdigit()):
             return
 
         self.simulate(show_errors=False, navigate=False)
 
 
-    def run_algorithm(self, algorithm_name, process_list):
-        runner = self.ALGORITHM_DISPATCH.get(algorithm_name)
-        if runner is None:
-            raise ValueError(f"Unsupported algorithm: {algorithm_name}")
-
-        tq = None
-        if algorithm_name == "Round Robin":
-            raw = self.quantum_entry.get().strip()
-            if not raw.isdigit() or int(raw) <= 0:
-                raise ValueError("Enter a valid time quantum (positive integer)")
-            tq = int(raw)
+    def get_quantum(self):
+        raw = self.quantum_entry.get().strip()
+        if not raw.isdigit() or int(raw) <= 0:
+            raise ValueError("Enter a valid time quantum (positive integer)")
+        return int(raw)
+
+    def run_algorithm(self, algorithm_name, process_list, tq=None, edit=None, progress=None):
+        if algorithm_name not in registry.QUANTUM_ALGORITHMS:
+            tq = None
+        key = self.result_cache.key(process_list, algorithm_name, tq)
+        return self.result_cache.run(
+            key, lambda: self._simulate_incrementally(
+                algorithm_name, process_list, tq, key[0], edit, progress))
+
+    def _simulate_incrementally(self, algorithm_name, process_list, tq, fingerprint, edit, progress):
+        if algorithm_name == "FCFS" and use_numpy(len(process_list)):
+            return registry.run_algorithm(algorithm_name, process_list, tq)
+
+        if edit is None:
+            return self._simulate_plainly(algorithm_name, process_list, tq, progress)
+
+        simulator, simulated = self._simulators.pop((algorithm_name, tq), (None, None))
+        if simulator is None:
+            simulator = registry.incremental_simulator(algorithm_name, tq)
+        if simulated == edit[0]:
+            result = simulator.rerun(process_list, edit[1], progress)
+        else:
+            result = simulator.run(process_list, progress)
+        self._simulators[(algorithm_name, tq)] = (simulator, fingerprint)
+        return result
 
-        return runner(process_list, tq)
+    @staticmethod
+    def _simulate_plainly(algorithm_name, process_list, tq, progress):
+        timeline = []
+        completed = 0
+        for kind, record in registry.stream_algorithm(algorithm_name, process_list, tq):
+            if kind == SEGMENT:
+                timeline.append(record)
+            elif kind == COMPLETE:
+                completed += 1
+                if progress is not None and not completed % PROGRESS_EVERY:
+                    progress(completed, len(process_list))
+        return process_list, timeline
+
+    def _pending_edit(self, *arrival_times):
+        if not self.processes:
+            return None
+        return workload_fingerprint(self.processes), min(arrival_times)
 
     def compare_algorithms(self, navigate=True):
         if not self.processes:
@@ -1375,36 +1668,141 @@ class SchedulerApp:
             self.notebook.select(self.comparison_tab)
         self.comparison_tree.delete(*self.comparison_tree.get_children())
         self.last_comparison_rows = []
+        self.best_algorithm_label.configure(text="Comparing algorithms…")
 
-        for algorithm_name in self.ALGORITHMS:
-            process_list = [
-                Process(p.pid, p.arrival_time, p.burst_time, p.priority)
-                for p in self.processes
-            ]
+        try:
+            quantum = self.get_quantum()
+        except ValueError:
+            quantum = None
 
-            try:
-                result, _ = self.run_algorithm(algorithm_name, process_list)
-            except ValueError as error:
-                self.comparison_tree.insert(
-                    "", "end",
-                    values=(algorithm_name, "N/A", str(error)),
-                    tags=(self._next_row_tag(self.comparison_tree),))
+        self._start_job(
+            "compare", self._comparison_worker,
+            self.processes.copy(), quantum, self.result_cache,
+            on_item=lambda row: self._add_comparison_row(*row),
+            on_done=lambda _: self._finish_comparison(),
+            on_error=lambda error: self._finish_comparison(f"Comparison failed: {error}"),
+            on_cancel=lambda: self._finish_comparison("Comparison cancelled"))
+
+    @staticmethod
+    def _comparison_worker(job, workload, quantum, cache):
+        fingerprint = workload_fingerprint(workload)
+        total = len(registry.ALGORITHMS)
+        done = 0
+        pending = []
+        for algorithm_name in registry.ALGORITHMS:
+            tq = quantum if algorithm_name in registry.QUANTUM_ALGORITHMS else None
+            cached = cache.get((fingerprint, algorithm_name, tq))
+            if cached is None:
+                pending.append(algorithm_name)
                 continue
+            job.emit((algorithm_name, compute_metrics(cached[0]), None))
+            done += 1
+            job.progress(done, total)
 
-            avg_wt = sum(p.waiting_time for p in result) / len(result)
-            avg_tat = sum(p.turnaround_time for p in result) / len(result)
-            row = (algorithm_name, f"{avg_wt:.2f}", f"{avg_tat:.2f}", avg_wt, avg_tat)
-            self.last_comparison_rows.append(row)
+        if not pending:
+            return
+        rows = iter_comparison(workload, pending, quantum=quantum, keep_results=True)
+        try:
+            for algorithm_name, metrics, error, value in rows:
+                if value is not None:
+                    tq = quantum if algorithm_name in registry.QUANTUM_ALGORITHMS else None
+                    cache.put((fingerprint, algorithm_name, tq), *value)
+                job.emit((algorithm_name, metrics, error))
+                done += 1
+                job.progress(done, total)
+        finally:
+            rows.close()
+
+    def sweep_quanta(self, navigate=True):
+        if not self.processes:
+            messagebox.showerror("Error", "No processes added")
+            return
+        try:
+            quanta = parse_quanta(self.sweep_quanta_entry.get())
+        except ValueError as error:
+            messagebox.showerror("Invalid quanta", str(error))
+            return
+
+        if navigate:
+            self.notebook.select(self.comparison_tab)
+        self.last_sweep_rows = []
+        self.sweep_best_label.configure(text="Sweeping quanta…")
+        self.sweep_chart.set_rows([])
+
+        self._start_job(
+            "sweep", self._sweep_worker,
+            self.processes.copy(), quanta,
+            on_item=self._add_sweep_row,
+            on_done=lambda _: self._show_sweep(),
+            on_error=lambda error: self.sweep_best_label.configure(text=f"Sweep failed: {error}"),
+            on_cancel=lambda: self._show_sweep("Sweep cancelled"))
+
+    @staticmethod
+    def _sweep_worker(job, workload, quanta):
+        rows = iter_sweep(workload, quanta)
+        try:
+            for done, row in enumerate(rows, 1):
+                job.emit(row)
+                job.progress(done, len(quanta))
+        finally:
+            rows.close()
+
+    def _add_sweep_row(self, row):
+        self.last_sweep_rows.append(row)
+        self.last_sweep_rows.sort(key=lambda item: item[0])
+        self.sweep_chart.set_rows(self.last_sweep_rows)
+
+    def _sweep_objective(self):
+        label = self.sweep_objective_var.get()
+        for objective, objective_label in SWEEP_OBJECTIVES.items():
+            if objective_label == label:
+                return objective
+        return "p99_wt"
+
+    def _show_sweep(self, message=None):
+        objective = self._sweep_objective()
+        best = best_quantum(self.last_sweep_rows, objective)
+        if best is None:
+            self.sweep_best_label.configure(text=message or "Best quantum: —")
+            self.sweep_chart.set_rows([])
+            return
+        quantum, metrics = best
+        value = metrics[objective]
+        value = f"{value:.2f}" if isinstance(value, float) else str(value)
+        text = f"Best quantum: {quantum}   ·   {SWEEP_OBJECTIVES[objective]}: {value}"
+        if objective != "context_switches":
+            text += f"   ·   Context switches: {metrics['context_switches']}"
+        if message is not None:
+            text = f"{message}   ·   {text}"
+        self.sweep_best_label.configure(text=text)
+        self.sweep_chart.set_rows(self.last_sweep_rows, quantum)
+
+    def _add_comparison_row(self, algorithm_name, metrics, error):
+        if error is not None:
             self.comparison_tree.insert(
-                "", "end", values=row[:3],
+                "", "end",
+                values=(algorithm_name, "N/A", error),
                 tags=(self._next_row_tag(self.comparison_tree),))
+            return
 
-        if self.last_comparison_rows:
-            best_row = min(self.last_comparison_rows, key=lambda row: (row[3], row[4], row[0]))
-            self.best_algorithm_label.configure(
-                text=f"{best_row[0]}   ·   Avg WT: {best_row[1]}   ·   Avg TAT: {best_row[2]}")
+        self.last_comparison_rows.append((algorithm_name, metrics))
+        self.comparison_tree.insert(
+            "", "end", values=self._comparison_values(algorithm_name, metrics),
+            tags=(self._next_row_tag(self.comparison_tree),))
+
+    def _finish_comparison(self, message=None):
+        order = {name: index for index, name in enumerate(self.ALGORITHMS)}
+        self.last_comparison_rows.sort(key=lambda row: order.get(row[0], len(order)))
+        items = sorted(
+            self.comparison_tree.get_children(),
+            key=lambda item: order.get(self.comparison_tree.item(item, "values")[0], len(order)))
+        for index, item in enumerate(items):
+            self.comparison_tree.move(item, "", index)
+
+        if message is not None:
+            self.best_algorithm_label.configure(text=message)
         else:
-            self.best_algorithm_label.configure(text="Run comparison to see results")
+            self._show_best_algorithm()
         self.highlight_selected_algorithm()
 
     def highlight_selected_algorithm(self):
@@ -1426,11 +1824,20 @@ class SchedulerApp:
 
         file_path = filedialog.asksaveasfilename(
             defaultextension=".csv",
-            filetypes=[("CSV files", "*.csv")],
+            filetypes=[("CSV files", "*.csv"), ("Scheduler traces", "*.sched")],
             title="Export Current Results")
         if not file_path:
             return
 
+        if file_path.lower().endswith(TRACE_EXTENSION):
+            try:
+                save_trace(file_path, self.processes, None if self.last_lanes else self.last_timeline)
+            except OSError as error:
+                messagebox.showerror("Export failed", f"Could not write file:\n{error}")
+                return
+            messagebox.showinfo("Export Complete", f"Workload and timeline saved to:\n{file_path}")
+            return
+
         try:
             with open(file_path, "w", newline="", encoding="utf-8") as csv_file:
                 writer = csv.writer(csv_file)
@@ -1439,6 +1846,8 @@ class SchedulerApp:
                 writer.writerow(["Average Turnaround Time", f"{self.last_metrics['avg_tat']:.2f}"])
                 writer.writerow(["CPU Idle Time", str(self.last_metrics["idle_time"])])
                 writer.writerow(["CPU Utilization", f"{self.last_metrics['cpu_util']:.2f}%"])
+                for field in STAT_FIELDS:
+                    writer.writerow([field, self.last_metrics[field]])
                 writer.writerow([])
                 writer.writerow(["PID", "Completion Time", "Turnaround Time",
                                  "Waiting Time", "Response Time"])
@@ -1464,9 +1873,9 @@ class SchedulerApp:
         try:
             with open(file_path, "w", newline="", encoding="utf-8") as csv_file:
                 writer = csv.writer(csv_file)
-                writer.writerow(["Algorithm", "Average Waiting Time", "Average Turnaround Time"])
-                for algorithm_name, avg_wt, avg_tat, _, _ in self.last_comparison_rows:
-                    writer.writerow([algorithm_name, avg_wt, avg_tat])
+                writer.writerow(["Algorithm", *STAT_FIELDS])
+                for algorithm_name, metrics in self.last_comparison_rows:
+                    writer.writerow([algorithm_name, *(metrics[field] for field in STAT_FIELDS)])
         except OSError as error:
             messagebox.showerror("Export failed", f"Could not write file:\n{error}")
             return
@@ -1478,87 +1887,16 @@ class SchedulerApp:
         self.update_summary_cards()
 
 
-    def show_gantt_chart(self, timeline, animate=False):
-        if hasattr(self, "_gantt_anim_job") and self._gantt_anim_job:
-            try:
-                self.root.after_cancel(self._gantt_anim_job)
-            except Exception:
-                pass
-            self._gantt_anim_job = None
-
-        self.gantt_canvas.delete("all")
-
-        if not timeline:
-            self.gantt_canvas.update_idletasks()
-            w = self.gantt_canvas.winfo_width() or 800
-            h = self.gantt_canvas.winfo_height() or 220
-            self.gantt_canvas.create_text(
-                w // 2, h // 2 - 10,
-                text="📊",
-                fill=Palette.TEXT_MUTED, font=(self.UI_FONT, 20))
-            self.gantt_canvas.create_text(
-                w // 2, h // 2 + 20,
-                text="Run a simulation to view the execution timeline",
-                fill=Palette.TEXT_MUTED, font=(self.UI_FONT, 10))
-            return
-
-        scale = 44
-        y1, y2 = 72, 136
-        colors = Palette.GANTT_COLORS
-
-        self.gantt_canvas.create_text(
-            24, 28, text="Timeline", anchor="w",
-            fill=Palette.TEXT_PRIMARY, font=(self.DISPLAY_FONT, 11, "bold"))
-        self.gantt_canvas.create_line(
-            24, y2 + 10, 980, y2 + 10,
-            fill=Palette.BORDER, width=1)
-
-        if not animate:
-            for index, (pid, start, end) in enumerate(timeline):
-                self._draw_gantt_block(index, pid, start, end, scale, y1, y2, colors)
-            self.gantt_canvas.create_text(
-                30 + timeline[-1][2] * scale, y2 + 30,
-                text=str(timeline[-1][2]),
-                fill=Palette.TEXT_SECONDARY, font=(self.UI_FONT, 10))
-            return
-
-        self._animate_gantt(timeline, 0, scale, y1, y2, colors)
-
-    def _draw_gantt_block(self, index, pid, start, end, scale, y1, y2, colors):
-        x1 = 30 + start * scale
-        x2 = 30 + end * scale
-        self.gantt_canvas.create_rectangle(
-            x1, y1, x2, y2,
-            fill=colors[index % len(colors)],
-            outline=Palette.BG_SURFACE_2, width=1)
-        self.gantt_canvas.create_text(
-            (x1 + x2) / 2, (y1 + y2) / 2,
-            text=pid, fill="#ffffff",
-            font=(self.UI_FONT, 10, "bold"))
-        self.gantt_canvas.create_text(
-            x1, y2 + 30, text=str(start),
-            fill=Palette.TEXT_SECONDARY, font=(self.UI_FONT, 10))
-
-    def _animate_gantt(self, timeline, index, scale, y1, y2, colors):
-        if index >= len(timeline):
-            self.gantt_canvas.create_text(
-                30 + timeline[-1][2] * scale, y2 + 30,
-                text=str(timeline[-1][2]),
-                fill=Palette.TEXT_SECONDARY, font=(self.UI_FONT, 10))
-            self._gantt_anim_job = None
-            return
-
-        pid, start, end = timeline[index]
-        self._draw_gantt_block(index, pid, start, end, scale, y1, y2, colors)
-
-        delay = 220 if len(timeline) <= 12 else max(80, 2000 // len(timeline))
-        self._gantt_anim_job = self.root.after(
-            delay,
-            lambda: self._animate_gantt(timeline, index + 1, scale, y1, y2, colors),
-        )
+    def show_gantt_chart(self, timeline, animate=False, lanes=None):
+        if lanes:
+            self.gantt_renderer.set_lanes(lanes)
+        else:
+            self.gantt_renderer.set_timeline(timeline)
+        if animate:
+            self.gantt_renderer.animate()
 
 
-    def simulate(self, show_errors=True, navigate=True):
+    def simulate(self, show_errors=True, navigate=True, edit=None):
         if not self.processes:
             if show_errors:
                 messagebox.showerror("Error", "No processes added")
@@ -1567,74 +1905,76 @@ class SchedulerApp:
         if navigate:
             self.notebook.select(self.simulation_tab)
 
-        process_list = [
-            Process(p.pid, p.arrival_time, p.burst_time, p.priority)
-            for p in self.processes
-        ]
-
         algo = self.algo_var.get()
-
+        tq = None
         try:
-            result, timeline = self.run_algorithm(algo, process_list)
+            if algo in registry.QUANTUM_ALGORITHMS:
+                tq = self.get_quantum()
+            cpus = self._parse_int(self.cpus_entry.get(), "CPUs", allow_zero=False)
         except ValueError as error:
             if show_errors:
                 messagebox.showerror("Error", str(error))
             return
 
-        self.show_gantt_chart(timeline, animate=navigate)
-        self.last_timeline = timeline
+        def on_error(error):
+            if show_errors:
+                messagebox.showerror("Error", str(error))
 
-        self.results_tree.delete(*self.results_tree.get_children())
-        self.solution_text.delete("1.0", tk.END)
-        self.last_result_rows = []
+        self._start_job(
+            "simulate", self._simulation_worker,
+            algo, tq, self.processes.copy(), edit,
+            cpus, self.balancer_var.get(),
+            on_done=lambda outcome: self._show_simulation(algo, *outcome, animate=navigate),
+            on_error=on_error)
+
+    def _simulation_worker(self, job, algo, tq, process_list, edit, cpus=1, balancer="pull"):
+        if cpus > 1:
+            job.check_cancelled()
+            kernel = registry.smp_kernel(algo, process_list, cpus, tq, balancer)
+            lanes = [[] for _ in range(cpus)]
+            completed = 0
+            for kind, record in kernel.stream():
+                if kind == SEGMENT:
+                    cpu, segment = record
+                    lanes[cpu].append(segment)
+                elif kind == COMPLETE:
+                    completed += 1
+                    if not completed % PROGRESS_EVERY:
+                        job.progress(completed, len(process_list))
+            job.progress(completed, len(process_list))
+            return process_list, lanes, smp_metrics(process_list, kernel.stats)
+        with self._simulation_lock:
+            job.check_cancelled()
+            result, timeline = self.run_algorithm(algo, process_list, tq, edit, job.progress)
+        return result, timeline, compute_metrics(result)
 
-        execution_order = " → ".join(pid for pid, _, _ in timeline if pid != "IDLE")
-        self.solution_text.insert(tk.END, f"Execution Order: {execution_order}\n\n")
-
-        for p in result:
-            response_time = p.start_time - p.arrival_time
-            row = (p.pid, p.completion_time, p.turnaround_time,
-                   p.waiting_time, response_time)
-            self.last_result_rows.append(row)
-            self.results_tree.insert(
-                "", "end", values=row,
-                tags=(self._next_row_tag(self.results_tree),))
-
-            self.solution_text.insert(
-                tk.END,
-                f"{p.pid}: TAT={p.completion_time}-{p.arrival_time}={p.turnaround_time}, "
-                f"WT={p.turnaround_time}-{p.burst_time}={p.waiting_time}, "
-                f"RT={p.start_time}-{p.arrival_time}={response_time}\n")
-
-        avg_wt = sum(p.waiting_time for p in result) / len(result)
-        avg_tat = sum(p.turnaround_time for p in result) / len(result)
-        avg_rt = sum(p.start_time - p.arrival_time for p in result) / len(result)
-        completion_time = max(p.completion_time for p in result)
-        total_burst_time = sum(p.burst_time for p in result)
-        idle_time = max(0, completion_time - total_burst_time)
-        cpu_utilization = (total_burst_time / completion_time * 100) if completion_time else 0
-
-        self.last_metrics = {
-            "algorithm": algo,
-            "avg_wt": avg_wt,
-            "avg_tat": avg_tat,
-            "avg_rt": avg_rt,
-            "idle_time": idle_time,
-            "cpu_util": cpu_utilization,
-        }
+    @staticmethod
+    def _result_rows(result):
+        response = array("q", map(operator.sub, result.start_time, result.arrival_time))
+        return ColumnRows([result.pids, result.completion_time, result.turnaround_time,
+                           result.waiting_time, response])
+
+    def _show_simulation(self, algo, result, timeline, metrics, animate=False):
+        lanes = []
+        if metrics.get("cpus", 1) > 1:
+            lanes = timeline
+            timeline = list(heapq.merge(*lanes, key=operator.itemgetter(1)))
+        self.show_gantt_chart(timeline, animate=animate, lanes=lanes)
+        self.last_timeline = timeline
+        self.last_lanes = lanes
 
-        self.averages_label.configure(
-            text=f"Average Waiting Time: {avg_wt:.2f}    Average Turnaround Time: {avg_tat:.2f}")
-        self.performance_label.configure(
-            text=f"Response Time Avg: {avg_rt:.2f}    CPU Idle Time: {idle_time}    "
-                 f"CPU Utilization: {cpu_utilization:.2f}%")
-        self.update_summary_cards(
-            f"{avg_wt:.2f}", f"{avg_tat:.2f}",
-            str(idle_time), f"{cpu_utilization:.2f}%")
+        self.last_result = result
+        self.last_result_rows = self._result_rows(result)
+        self.results_tree.set_rows(self.last_result_rows)
+        self.derivation_view.set_result(result, timeline)
+
+        self.last_metrics = {"algorithm": algo, **metrics}
+        self._show_metrics(self.last_metrics)
         self.highlight_selected_algorithm()
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     root = tk.Tk()
     app = SchedulerApp(root)
     root.mainloop()
\ No newline at end of file
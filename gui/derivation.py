@@ -0,0 +1,126 @@
+import tkinter as tk
+
+from .theme import Palette
+
+PAGE_LINES = 100
+ORDER_RUNS = 24
+HEADER_LINES = 2
+
+
+def execution_order(timeline, limit=ORDER_RUNS):
+    runs = []
+    for pid, _, _ in timeline:
+        if pid == "IDLE":
+            continue
+        if runs and runs[-1][0] == pid:
+            runs[-1][1] += 1
+        elif len(runs) == limit:
+            return _format_runs(runs) + " → …"
+        else:
+            runs.append([pid, 1])
+    return _format_runs(runs)
+
+
+def _format_runs(runs):
+    return " → ".join(pid if count == 1 else f"{pid} ×{count}" for pid, count in runs)
+
+
+def derivation_line(p):
+    response_time = p.start_time - p.arrival_time
+    return (
+        f"{p.pid}: TAT={p.completion_time}-{p.arrival_time}={p.turnaround_time}, "
+        f"WT={p.turnaround_time}-{p.burst_time}={p.waiting_time}, "
+        f"RT={p.start_time}-{p.arrival_time}={response_time}")
+
+
+class DerivationView:
+    def __init__(self, parent, text_style, entry_style, button_style, ui_font):
+        self.result = None
+        self.order = ""
+        self.page = 0
+
+        toolbar = tk.Frame(parent, bg=Palette.BG_SURFACE)
+        toolbar.pack(fill="x", padx=24, pady=(0, 8))
+        tk.Label(
+            toolbar, text="Find PID",
+            font=(ui_font, 10),
+            fg=Palette.TEXT_SECONDARY, bg=Palette.BG_SURFACE,
+        ).pack(side="left")
+        self.search_var = tk.StringVar()
+        search_entry = tk.Entry(toolbar, textvariable=self.search_var, width=14, **entry_style)
+        search_entry.pack(side="left", padx=8, ipady=4)
+        search_entry.bind("<Return>", lambda _event: self.find(self.search_var.get()))
+
+        small_button = dict(button_style, padx=10, pady=4)
+        self.next_button = tk.Button(
+            toolbar, text="Next ›",
+            command=lambda: self.show_page(self.page + 1), **small_button)
+        self.next_button.pack(side="right")
+        self.page_label = tk.Label(
+            toolbar, text="",
+            font=(ui_font, 9),
+            fg=Palette.TEXT_MUTED, bg=Palette.BG_SURFACE,
+        )
+        self.page_label.pack(side="right", padx=10)
+        self.prev_button = tk.Button(
+            toolbar, text="‹ Prev",
+            command=lambda: self.show_page(self.page - 1), **small_button)
+        self.prev_button.pack(side="right")
+
+        self.text = tk.Text(parent, height=8, **text_style)
+        self.text.pack(fill="both", expand=True, padx=24, pady=(0, 24))
+        self.text.tag_configure(
+            "found", background=Palette.ROW_SELECTED, foreground=Palette.ROW_SELECTED_FG)
+        self._update_controls(0, 0)
+
+    def set_result(self, result, timeline):
+        self.result = result
+        self.order = execution_order(timeline)
+        self.show_page(0)
+
+    def clear(self):
+        self.result = None
+        self.order = ""
+        self.page = 0
+        self.text.delete("1.0", tk.END)
+        self._update_controls(0, 0)
+
+    def page_count(self):
+        if self.result is None:
+            return 0
+        return max(1, -(-len(self.result) // PAGE_LINES))
+
+    def show_page(self, page, highlight=None):
+        if self.result is None:
+            return
+        self.page = max(0, min(page, self.page_count() - 1))
+        start = self.page * PAGE_LINES
+        stop = min(start + PAGE_LINES, len(self.result))
+        lines = [derivation_line(self.result[index]) for index in range(start, stop)]
+
+        text = self.text
+        text.delete("1.0", tk.END)
+        text.insert(tk.END, f"Execution Order: {self.order}\n\n" + "\n".join(lines) + "\n")
+        if highlight is not None:
+            line = HEADER_LINES + 1 + highlight - start
+            text.tag_add("found", f"{line}.0", f"{line}.end")
+            text.see(f"{line}.0")
+        self._update_controls(start, stop)
+
+    def find(self, pid):
+        pid = pid.strip()
+        if self.result is None or not pid:
+            return False
+        index = self.result.pid_index.get(pid)
+        if index is None:
+            self.page_label.configure(text=f"No process {pid}")
+            return False
+        self.show_page(index // PAGE_LINES, highlight=index)
+        return True
+
+    def _update_controls(self, start, stop):
+        total = 0 if self.result is None else len(self.result)
+        self.page_label.configure(text=f"{start + 1}–{stop} of {total}" if total else "")
+        self.prev_button.configure(state="normal" if self.page > 0 else "disabled")
+        last_page = self.page >= self.page_count() - 1
+        self.next_button.configure(state="disabled" if last_page else "normal")
@@ -0,0 +1,362 @@
+import math
+from bisect import bisect_right
+
+from .theme import Palette
+
+MARGIN = 30
+BAR_TOP = 72
+BAR_BOTTOM = 136
+DEFAULT_SCALE = 44
+MIN_BLOCK_PX = 3
+LABEL_MIN_PX = 28
+ZOOM_STEP = 1.25
+MAX_SCALE = 400
+ANIMATION_LIMIT = 60
+LANE_AREA = 256
+LANE_GAP = 2
+TICK_SPACING = 110
+
+
+class TimelineLevel:
+    __slots__ = ("starts", "ends", "pids", "weights", "mixed", "busy")
+
+    def __init__(self):
+        self.starts = []
+        self.ends = []
+        self.pids = []
+        self.weights = []
+        self.mixed = []
+        self.busy = []
+
+    def __len__(self):
+        return len(self.starts)
+
+    def add(self, start, end, pid, weight, mixed, busy):
+        self.starts.append(start)
+        self.ends.append(end)
+        self.pids.append(pid)
+        self.weights.append(weight)
+        self.mixed.append(mixed)
+        self.busy.append(busy)
+
+
+class TimelineSummary:
+    def __init__(self, timeline):
+        base = TimelineLevel()
+        for pid, start, end in timeline:
+            work = 0 if pid == "IDLE" else end - start
+            base.add(start, end, pid, work, False, work)
+        self.levels = [base]
+        while len(self.levels[-1]) > 1:
+            self.levels.append(self._merge(self.levels[-1]))
+
+    @staticmethod
+    def _merge(level):
+        merged = TimelineLevel()
+        for i in range(0, len(level) - 1, 2):
+            j = i + 1
+            heavier = i if level.weights[i] >= level.weights[j] else j
+            mixed = level.mixed[i] or level.mixed[j] or level.pids[i] != level.pids[j]
+            merged.add(level.starts[i], level.ends[j], level.pids[heavier],
+                       level.weights[heavier], mixed, level.busy[i] + level.busy[j])
+        if len(level) % 2:
+            last = len(level) - 1
+            merged.add(level.starts[last], level.ends[last], level.pids[last],
+                       level.weights[last], level.mixed[last], level.busy[last])
+        return merged
+
+    @property
+    def start(self):
+        return self.levels[0].starts[0] if self.levels[0] else 0
+
+    @property
+    def end(self):
+        return self.levels[0].ends[-1] if self.levels[0] else 0
+
+    def level_for(self, scale, span=None):
+        if span is None:
+            span = self.end - self.start
+        for level in self.levels:
+            if span * scale / len(level) >= MIN_BLOCK_PX:
+                return level
+        return self.levels[-1]
+
+
+class GanttRenderer:
+    def __init__(self, canvas, ui_font, display_font):
+        self.canvas = canvas
+        self.ui_font = ui_font
+        self.display_font = display_font
+        self.lanes = []
+        self.start = 0
+        self.end = 0
+        self.lane_height = BAR_BOTTOM - BAR_TOP
+        self.scale = DEFAULT_SCALE
+        self.offset = 0
+        self.reveal = None
+        self.animation_job = None
+        self._drag_x = None
+        self._colors = {}
+
+        canvas.bind("<Configure>", lambda _event: self.redraw())
+        canvas.bind("<Control-MouseWheel>", self._on_zoom_wheel)
+        canvas.bind("<Control-Button-4>", self._on_zoom_wheel)
+        canvas.bind("<Control-Button-5>", self._on_zoom_wheel)
+        canvas.bind("<Shift-MouseWheel>", self._on_pan_wheel)
+        canvas.bind("<Shift-Button-4>", self._on_pan_wheel)
+        canvas.bind("<Shift-Button-5>", self._on_pan_wheel)
+        canvas.bind("<ButtonPress-1>", self._on_drag_start)
+        canvas.bind("<B1-Motion>", self._on_drag)
+        canvas.bind("<Double-Button-1>", lambda _event: self.fit())
+
+    def set_timeline(self, timeline):
+        self.set_lanes([timeline] if timeline else [])
+
+    def set_lanes(self, lanes):
+        self.stop_animation()
+        self.lanes = [TimelineSummary(lane) for lane in lanes]
+        busy = [lane for lane in self.lanes if len(lane.levels[0])]
+        if not busy:
+            self.lanes = []
+        else:
+            self.start = min(lane.start for lane in busy)
+            self.end = max(lane.end for lane in busy)
+        self._colors = {}
+
+        if len(self.lanes) > 1:
+            self.lane_height = max(6, min(32, LANE_AREA // len(self.lanes)))
+            self.canvas.configure(height=self._lane_top(len(self.lanes)) + 50)
+        else:
+            self.lane_height = BAR_BOTTOM - BAR_TOP
+            self.canvas.configure(height=220)
+        self.fit()
+
+    def fit(self):
+        if not self.lanes:
+            self.redraw()
+            return
+        span = max(1, self.end - self.start)
+        self.scale = min(DEFAULT_SCALE, max(1e-9, (self._width() - 2 * MARGIN) / span))
+        self.offset = self.start
+        self.redraw()
+
+    def zoom(self, factor, anchor_x=None):
+        if not self.lanes:
+            return
+        if anchor_x is None:
+            anchor_x = self._width() / 2
+        anchor_time = self.offset + (anchor_x - MARGIN) / self.scale
+        span = max(1, self.end - self.start)
+        min_scale = min(DEFAULT_SCALE, (self._width() - 2 * MARGIN) / span)
+        self.scale = min(MAX_SCALE, max(min_scale, self.scale * factor))
+        self.offset = anchor_time - (anchor_x - MARGIN) / self.scale
+        self._clamp_offset()
+        self.redraw()
+
+    def pan(self, pixels):
+        if not self.lanes:
+            return
+        self.offset += pixels / self.scale
+        self._clamp_offset()
+        self.redraw()
+
+    def animate(self):
+        self.stop_animation()
+        if len(self.lanes) != 1 or len(self.lanes[0].levels[0]) > ANIMATION_LIMIT:
+            self.redraw()
+            return
+        self._animate_step(0)
+
+    def stop_animation(self):
+        if self.animation_job is not None:
+            self.canvas.after_cancel(self.animation_job)
+            self.animation_job = None
+        self.reveal = None
+
+    def _animate_step(self, step):
+        count = len(self.lanes[0].levels[0])
+        if step > count:
+            self.animation_job = None
+            self.reveal = None
+            self.redraw()
+            return
+        self.reveal = step
+        self.redraw()
+        delay = 220 if count <= 12 else max(80, 2000 // count)
+        self.animation_job = self.canvas.after(delay, self._animate_step, step + 1)
+
+    def redraw(self):
+        canvas = self.canvas
+        canvas.delete("all")
+        if not self.lanes:
+            self._draw_placeholder()
+            return
+
+        width = self._width()
+        single = len(self.lanes) == 1
+        axis_y = (BAR_BOTTOM if single else self._lane_top(len(self.lanes)) - LANE_GAP) + 10
+        canvas.create_text(
+            24, 28, text="Timeline" if single else f"Timeline  ·  {len(self.lanes)} CPUs", anchor="w",
+            fill=Palette.TEXT_PRIMARY, font=(self.display_font, 11, "bold"))
+        canvas.create_line(
+            24, axis_y, width - 24, axis_y,
+            fill=Palette.BORDER, width=1)
+
+        view_start = self.offset
+        view_end = self.offset + (width - 2 * MARGIN) / self.scale
+        last_label_x = None
+        for index, lane in enumerate(self.lanes):
+            top = self._lane_top(index)
+            if not single:
+                canvas.create_text(
+                    MARGIN - 6, top + self.lane_height / 2, text=str(index), anchor="e",
+                    fill=Palette.TEXT_MUTED, font=(self.ui_font, 7 if self.lane_height < 12 else 8))
+            if len(lane.levels[0]):
+                last_label_x = self._draw_lane(lane, top, view_start, view_end, single)
+
+        if single:
+            end = self.end
+            if self.reveal is None and view_start <= end <= view_end:
+                x = self._x(end)
+                if last_label_x is None or x - last_label_x >= LABEL_MIN_PX:
+                    canvas.create_text(
+                        x, axis_y + 20, text=str(end),
+                        fill=Palette.TEXT_SECONDARY, font=(self.ui_font, 10))
+        else:
+            self._draw_ticks(view_start, view_end, axis_y)
+
+        if self.scale < DEFAULT_SCALE or view_start > self.start or view_end < self.end:
+            canvas.create_text(
+                width - 24, 28, anchor="e",
+                text=f"{view_start:.0f} – {view_end:.0f}   ·   Ctrl+wheel to zoom, drag to pan, double-click to fit",
+                fill=Palette.TEXT_MUTED, font=(self.ui_font, 9))
+
+    def _draw_lane(self, lane, top, view_start, view_end, labels):
+        level = lane.levels[0] if self.reveal is not None else lane.level_for(self.scale, self.end - self.start)
+        first = bisect_right(level.ends, view_start)
+        last = len(level) if self.reveal is None else min(self.reveal, len(level))
+
+        block = None
+        last_label_x = None
+        for i in range(first, last):
+            start = level.starts[i]
+            if start >= view_end:
+                break
+            end = level.ends[i]
+            clipped_start, clipped_end = max(start, view_start), min(end, view_end)
+            busy = level.busy[i] * (clipped_end - clipped_start) / (end - start)
+            entry = (clipped_start, clipped_end,
+                     level.pids[i], level.weights[i], level.mixed[i], busy)
+            if block is None:
+                block = list(entry)
+            elif ((block[1] - block[0]) * self.scale < MIN_BLOCK_PX
+                    and (entry[0] - block[1]) * self.scale < 1):
+                block[4] = block[4] or entry[4] or block[2] != entry[2]
+                if entry[3] > block[3]:
+                    block[2], block[3] = entry[2], entry[3]
+                block[1] = entry[1]
+                block[5] += entry[5]
+            else:
+                last_label_x = self._draw_block(block, last_label_x, top, labels)
+                block = list(entry)
+        if block is not None:
+            last_label_x = self._draw_block(block, last_label_x, top, labels)
+        return last_label_x
+
+    def _draw_block(self, block, last_label_x, top, labels):
+        start, end, pid, _, mixed, busy = block
+        bottom = top + self.lane_height
+        x1 = self._x(start)
+        x2 = max(self._x(end), x1 + 1)
+        coverage = busy / (end - start) if end > start and pid != "IDLE" else 1
+        if coverage < 1:
+            mixed = True
+            top = bottom - max(2, self.lane_height * coverage)
+        self.canvas.create_rectangle(
+            x1, top, x2, bottom,
+            fill=self._color(pid),
+            stipple="gray50" if mixed else "",
+            outline=Palette.BG_SURFACE_2 if x2 - x1 >= MIN_BLOCK_PX else "",
+            width=1)
+        if not mixed and self.lane_height >= 14 and x2 - x1 >= 8 * len(pid) + 10:
+            self.canvas.create_text(
+                (x1 + x2) / 2, (top + bottom) / 2,
+                text=pid, fill="#ffffff",
+                font=(self.ui_font, 10 if self.lane_height >= 24 else 8, "bold"))
+        if not labels:
+            return last_label_x
+        if x2 - x1 >= LABEL_MIN_PX and (last_label_x is None or x1 - last_label_x >= LABEL_MIN_PX):
+            self.canvas.create_text(
+                x1, BAR_BOTTOM + 30, text=str(int(start)) if start == int(start) else f"{start:.1f}",
+                fill=Palette.TEXT_SECONDARY, font=(self.ui_font, 10))
+            return x1
+        return last_label_x
+
+    def _draw_ticks(self, view_start, view_end, axis_y):
+        raw = TICK_SPACING / self.scale
+        magnitude = 10 ** math.floor(math.log10(raw))
+        step = next(m * magnitude for m in (1, 2, 5, 10) if m * magnitude >= raw)
+        tick = math.ceil(view_start / step) * step
+        while tick <= view_end:
+            x = self._x(tick)
+            self.canvas.create_line(x, axis_y - 4, x, axis_y + 4, fill=Palette.BORDER)
+            self.canvas.create_text(
+                x, axis_y + 16, text=f"{tick:g}",
+                fill=Palette.TEXT_SECONDARY, font=(self.ui_font, 9))
+            tick += step
+
+    def _draw_placeholder(self):
+        self.canvas.update_idletasks()
+        w = self.canvas.winfo_width() or 800
+        h = self.canvas.winfo_height() or 220
+        self.canvas.create_text(
+            w // 2, h // 2 - 10,
+            text="📊",
+            fill=Palette.TEXT_MUTED, font=(self.ui_font, 20))
+        self.canvas.create_text(
+            w // 2, h // 2 + 20,
+            text="Run a simulation to view the execution timeline",
+            fill=Palette.TEXT_MUTED, font=(self.ui_font, 10))
+
+    def _color(self, pid):
+        if pid == "IDLE":
+            return Palette.TEXT_SUBTLE
+        color = self._colors.get(pid)
+        if color is None:
+            colors = Palette.GANTT_COLORS
+            color = colors[len(self._colors) % len(colors)]
+            self._colors[pid] = color
+        return color
+
+    def _lane_top(self, index):
+        return BAR_TOP + index * (self.lane_height + LANE_GAP)
+
+    def _x(self, time):
+        return MARGIN + (time - self.offset) * self.scale
+
+    def _width(self):
+        return max(self.canvas.winfo_width(), 200)
+
+    def _clamp_offset(self):
+        visible = (self._width() - 2 * MARGIN) / self.scale
+        latest = max(self.start, self.end - visible)
+        self.offset = min(max(self.offset, self.start), latest)
+
+    def _on_zoom_wheel(self, event):
+        zoom_in = event.num == 4 or getattr(event, "delta", 0) > 0
+        self.zoom(ZOOM_STEP if zoom_in else 1 / ZOOM_STEP, event.x)
+        return "break"
+
+    def _on_pan_wheel(self, event):
+        backward = event.num == 4 or getattr(event, "delta", 0) > 0
+        self.pan(-80 if backward else 80)
+        return "break"
+
+    def _on_drag_start(self, event):
+        self._drag_x = event.x
+
+    def _on_drag(self, event):
+        if self._drag_x is None:
+            return
+        self.pan(self._drag_x - event.x)
+        self._drag_x = event.x
@@ -0,0 +1,114 @@
+from .theme import Palette
+
+PANELS = (
+    ("Waiting time", (("avg_wt", "avg"), ("p99_wt", "p99"))),
+    ("Response time", (("avg_rt", "avg"), ("p99_rt", "p99"))),
+    ("Context switches", (("context_switches", None),)),
+)
+PANEL_GAP = 24
+PLOT_TOP = 44
+PLOT_BOTTOM = 36
+PLOT_LEFT = 56
+
+
+class SweepChart:
+    def __init__(self, canvas, ui_font):
+        self.canvas = canvas
+        self.ui_font = ui_font
+        self.rows = []
+        self.best = None
+        canvas.bind("<Configure>", lambda _event: self.redraw())
+
+    def set_rows(self, rows, best=None):
+        self.rows = rows
+        self.best = best
+        self.redraw()
+
+    def redraw(self):
+        canvas = self.canvas
+        canvas.delete("all")
+        width = max(canvas.winfo_width(), 300)
+        height = max(canvas.winfo_height(), 160)
+        if not self.rows:
+            canvas.create_text(
+                width // 2, height // 2,
+                text="Run a quantum sweep to plot Round Robin metrics against the quantum",
+                fill=Palette.TEXT_MUTED, font=(self.ui_font, 10))
+            return
+
+        panel_width = (width - PANEL_GAP * (len(PANELS) + 1)) / len(PANELS)
+        for index, (title, series) in enumerate(PANELS):
+            left = PANEL_GAP + index * (panel_width + PANEL_GAP)
+            self._draw_panel(left, panel_width, height, title, series)
+
+    def _draw_panel(self, left, panel_width, height, title, series):
+        canvas = self.canvas
+        quanta = [quantum for quantum, _ in self.rows]
+        low_q, high_q = quanta[0], quanta[-1]
+        high_value = max(metrics[key] for _, metrics in self.rows for key, _ in series) or 1
+
+        x0 = left + PLOT_LEFT
+        x1 = left + panel_width
+        y0 = height - PLOT_BOTTOM
+        y1 = PLOT_TOP
+
+        def x_of(quantum):
+            if high_q == low_q:
+                return (x0 + x1) / 2
+            return x0 + (quantum - low_q) / (high_q - low_q) * (x1 - x0)
+
+        def y_of(value):
+            return y0 - value / high_value * (y0 - y1)
+
+        canvas.create_text(
+            left, 16, text=title, anchor="w",
+            fill=Palette.TEXT_PRIMARY, font=(self.ui_font, 10, "bold"))
+        canvas.create_line(x0, y1, x0, y0, x1, y0, fill=Palette.BORDER)
+        canvas.create_text(
+            x0 - 6, y1, text=_short(high_value), anchor="e",
+            fill=Palette.TEXT_MUTED, font=(self.ui_font, 8))
+        canvas.create_text(
+            x0 - 6, y0, text="0", anchor="e",
+            fill=Palette.TEXT_MUTED, font=(self.ui_font, 8))
+        canvas.create_text(
+            x0, y0 + 14, text=str(low_q),
+            fill=Palette.TEXT_MUTED, font=(self.ui_font, 8))
+        if high_q != low_q:
+            canvas.create_text(
+                x1, y0 + 14, text=str(high_q),
+                fill=Palette.TEXT_MUTED, font=(self.ui_font, 8))
+        canvas.create_text(
+            (x0 + x1) / 2, y0 + 26, text="quantum",
+            fill=Palette.TEXT_SUBTLE, font=(self.ui_font, 8))
+
+        if self.best is not None:
+            x = x_of(self.best)
+            canvas.create_line(x, y1, x, y0, fill=Palette.SUCCESS, dash=(3, 3))
+
+        legend_x = x1
+        for color_index, (key, label) in enumerate(series):
+            color = Palette.GANTT_COLORS[color_index % len(Palette.GANTT_COLORS)]
+            points = []
+            for quantum, metrics in self.rows:
+                points.extend((x_of(quantum), y_of(metrics[key])))
+            if len(points) >= 4:
+                canvas.create_line(*points, fill=color, width=2)
+            if len(self.rows) <= 64:
+                for i in range(0, len(points), 2):
+                    x, y = points[i], points[i + 1]
+                    canvas.create_oval(x - 2, y - 2, x + 2, y + 2, fill=color, outline="")
+            if label is not None:
+                item = canvas.create_text(
+                    legend_x, 16, text=label, anchor="e",
+                    fill=color, font=(self.ui_font, 9, "bold"))
+                legend_x = canvas.bbox(item)[0] - 10
+
+
+def _short(value):
+    if value >= 1_000_000:
+        return f"{value / 1_000_000:.1f}M"
+    if value >= 10_000:
+        return f"{value / 1000:.0f}k"
+    if isinstance(value, float):
+        return f"{value:.1f}"
+    return str(value)
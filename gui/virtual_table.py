@@ -0,0 +1,232 @@
+import tkinter as tk
+from array import array
+from tkinter import ttk
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .theme import Palette
+
+HEADING_HEIGHT = 32
+
+
+class ColumnRows:
+    def __init__(self, columns):
+        self.columns = columns
+
+    def __len__(self):
+        return len(self.columns[0]) if self.columns else 0
+
+    def __getitem__(self, index):
+        return tuple(column[index] for column in self.columns)
+
+    def __iter__(self):
+        return zip(*self.columns)
+
+
+def _sort_order(values, reverse):
+    if np is not None and isinstance(values, (array, memoryview)):
+        order = np.argsort(np.frombuffer(values, dtype=np.int64), kind="stable")
+        return order[::-1].tolist() if reverse else order.tolist()
+    return sorted(range(len(values)), key=values.__getitem__, reverse=reverse)
+
+
+class VirtualTable(tk.Frame):
+    def __init__(self, parent, columns, headings, height=10, widths=None,
+                 on_select=None, style="Scheduler.Treeview", bg=None):
+        super().__init__(parent, bg=bg if bg is not None else Palette.BG_SURFACE)
+        self.columns = columns
+        self.on_select = on_select
+        self.rows = ColumnRows([])
+        self.order = None
+        self.sort_column = None
+        self.sort_reverse = False
+        self.first = 0
+        self.selected_index = None
+        self._headings = dict(zip(columns, headings))
+        self.row_height = int(ttk.Style().lookup(style, "rowheight") or 20)
+
+        self.view = ttk.Treeview(
+            self, columns=columns, show="headings", style=style,
+            height=height, selectmode="browse")
+        for index, column in enumerate(columns):
+            self.view.heading(column, text=self._headings[column],
+                              command=lambda c=index: self.sort_by(c))
+            width = widths[index] if widths else 120
+            self.view.column(column, anchor="center", width=width)
+        self.view.tag_configure("evenrow", background=Palette.ROW_EVEN, foreground=Palette.TEXT_PRIMARY)
+        self.view.tag_configure("oddrow", background=Palette.ROW_ODD, foreground=Palette.TEXT_PRIMARY)
+
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self.view.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.view.bind("<<TreeviewSelect>>", self._on_view_select)
+        self.view.bind("<Configure>", lambda _event: self.refresh())
+        self.view.bind("<MouseWheel>", self._on_wheel)
+        self.view.bind("<Button-4>", self._on_wheel)
+        self.view.bind("<Button-5>", self._on_wheel)
+        self.view.bind("<Up>", lambda _event: self._step_selection(-1))
+        self.view.bind("<Down>", lambda _event: self._step_selection(1))
+        self.view.bind("<Prior>", lambda _event: self.scroll(-self.page_size()))
+        self.view.bind("<Next>", lambda _event: self.scroll(self.page_size()))
+        self.view.bind("<Home>", lambda _event: self.scroll_to(0))
+        self.view.bind("<End>", lambda _event: self.scroll_to(len(self.rows)))
+
+    def __len__(self):
+        return len(self.rows)
+
+    def set_rows(self, rows):
+        self.rows = rows
+        if self.selected_index is not None and self.selected_index >= len(rows):
+            self.selected_index = None
+        if self.sort_column is None:
+            self.order = None
+        else:
+            self._apply_sort()
+        self.first = min(self.first, max(0, len(rows) - self.page_size()))
+        self.refresh()
+
+    def sort_by(self, column_index):
+        if self.sort_column == column_index:
+            self.sort_reverse = not self.sort_reverse
+        else:
+            self.sort_column = column_index
+            self.sort_reverse = False
+        self._apply_sort()
+        self.first = 0
+        self.refresh()
+
+    def _apply_sort(self):
+        columns = getattr(self.rows, "columns", None)
+        if columns is not None:
+            values = columns[self.sort_column]
+        else:
+            values = [row[self.sort_column] for row in self.rows]
+        self.order = _sort_order(values, self.sort_reverse)
+        for index, column in enumerate(self.columns):
+            marker = ""
+            if index == self.sort_column:
+                marker = " ▼" if self.sort_reverse else " ▲"
+            self.view.heading(column, text=self._headings[column] + marker)
+
+    def page_size(self):
+        rows = int(self.view.cget("height"))
+        if self.view.winfo_ismapped():
+            rows = max(rows, (self.view.winfo_height() - HEADING_HEIGHT) // self.row_height)
+        return max(1, rows)
+
+    def scroll(self, rows):
+        self.scroll_to(self.first + rows)
+        return "break"
+
+    def scroll_to(self, first):
+        self.first = max(0, min(first, len(self.rows) - self.page_size()))
+        self.refresh()
+        return "break"
+
+    def see(self, data_index):
+        position = self._position_of(data_index)
+        if position is None:
+            return
+        if position < self.first or position >= self.first + self.page_size():
+            self.scroll_to(position - self.page_size() // 2)
+
+    def select(self, data_index):
+        self.selected_index = data_index
+        self.see(data_index)
+        self.refresh()
+
+    def clear_selection(self):
+        self.selected_index = None
+        self.view.selection_remove(*self.view.selection())
+
+    def refresh(self):
+        view = self.view
+        size = self.page_size()
+        total = len(self.rows)
+        self.first = max(0, min(self.first, total - size))
+        items = view.get_children()
+        visible = min(size, total - self.first)
+
+        if len(items) > visible:
+            view.delete(*items[visible:])
+            items = items[:visible]
+        for _ in range(visible - len(items)):
+            view.insert("", "end", values=())
+        items = view.get_children()
+
+        selected_item = None
+        for offset, item in enumerate(items):
+            position = self.first + offset
+            data_index = self.order[position] if self.order is not None else position
+            view.item(item, values=self.rows[data_index],
+                      tags=("evenrow" if position % 2 == 0 else "oddrow",))
+            if data_index == self.selected_index:
+                selected_item = item
+
+        if selected_item is not None:
+            if view.selection() != (selected_item,):
+                view.selection_set(selected_item)
+        elif view.selection():
+            view.selection_remove(*view.selection())
+
+        if total:
+            self.scrollbar.set(self.first / total, min(1.0, (self.first + visible) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def _position_of(self, data_index):
+        if self.order is None:
+            return data_index if 0 <= data_index < len(self.rows) else None
+        try:
+            return self.order.index(data_index)
+        except ValueError:
+            return None
+
+    def _data_index(self, item):
+        position = self.first + self.view.index(item)
+        return self.order[position] if self.order is not None else position
+
+    def _on_view_select(self, _event=None):
+        selection = self.view.selection()
+        if not selection:
+            return
+        data_index = self._data_index(selection[0])
+        if data_index == self.selected_index:
+            return
+        self.selected_index = data_index
+        if self.on_select is not None:
+            self.on_select(data_index)
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self.scroll_to(int(float(amount) * len(self.rows)))
+        elif action == "scroll":
+            step = self.page_size() if unit == "pages" else 1
+            self.scroll(int(amount) * step)
+
+    def _on_wheel(self, event):
+        if event.num == 4 or getattr(event, "delta", 0) > 0:
+            return self.scroll(-3)
+        return self.scroll(3)
+
+    def _step_selection(self, step):
+        if not len(self.rows):
+            return "break"
+        position = None
+        if self.selected_index is not None:
+            position = self._position_of(self.selected_index)
+        position = 0 if position is None else max(0, min(len(self.rows) - 1, position + step))
+        data_index = self.order[position] if self.order is not None else position
+        self.selected_index = data_index
+        if position < self.first:
+            self.first = position
+        elif position >= self.first + self.page_size():
+            self.first = position - self.page_size() + 1
+        self.refresh()
+        if self.on_select is not None:
+            self.on_select(data_index)
+        return "break"
@@ -0,0 +1,61 @@
+import queue
+import threading
+
+PROGRESS = "progress"
+ITEM = "item"
+DONE = "done"
+ERROR = "error"
+CANCELLED = "cancelled"
+
+
+class JobCancelled(Exception):
+    pass
+
+
+class BackgroundJob:
+    def __init__(self, target, *args):
+        self.target = target
+        self.args = args
+        self.updates = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+    def check_cancelled(self):
+        if self.cancel_event.is_set():
+            raise JobCancelled()
+
+    def progress(self, done, total):
+        self.check_cancelled()
+        self.updates.put((PROGRESS, done, total))
+
+    def emit(self, item):
+        self.check_cancelled()
+        self.updates.put((ITEM, item))
+
+    def drain(self):
+        while True:
+            try:
+                yield self.updates.get_nowait()
+            except queue.Empty:
+                return
+
+    def _run(self):
+        try:
+            result = self.target(self, *self.args)
+        except JobCancelled:
+            self.updates.put((CANCELLED,))
+        except Exception as error:
+            self.updates.put((ERROR, error))
+        else:
+            self.updates.put((DONE, result))
@@ -1,19 +1,361 @@
+import argparse
+import os
+import sys
+from contextlib import ExitStack
+
+from core.export import (
+    RESULT_FIELDS, SUMMARY_FIELDS, TIMELINE_FIELDS, RecordWriter, result_record,
+)
+from core.importer import load_workload
+from core.kernel import COMPLETE, SEGMENT
+from core.metrics import MetricsAccumulator
 from core.process import Process
-from algorithms.fcfs import fcfs_scheduling
-
-def main():
-    processes = [
-        Process("P1", 0, 5),
-        Process("P2", 1, 3),
-        Process("P3", 2, 8),
-        Process("P4", 3, 6),
+from core.process_table import ProcessTable
+from core.smp import BALANCERS, smp_summary
+from core.trace_file import save_trace
+from core.validation import parse_quanta
+from core.workloads import WORKLOAD_KINDS
+from algorithms.comparison import iter_comparison
+from algorithms.experiment import (
+    EXPERIMENT_SUMMARY_FIELDS, TRIAL_FIELDS, ExperimentSummary, iter_experiment,
+)
+from algorithms.quantum_sweep import SWEEP_FIELDS, SWEEP_OBJECTIVES, best_quantum, sweep
+from algorithms.registry import (
+    ALGORITHM_ALIASES, ALGORITHMS, QUANTUM_ALGORITHMS, resolve_algorithm, run_algorithm,
+    smp_kernel, stream_algorithm,
+)
+
+DEMO_PROCESSES = [
+    ("P1", 0, 5),
+    ("P2", 1, 3),
+    ("P3", 2, 8),
+    ("P4", 3, 6),
+]
+
+
+def _demo_workload():
+    return ProcessTable.from_processes([Process(*p) for p in DEMO_PROCESSES])
+
+
+def _report_progress(path):
+    def progress(done, total):
+        percent = 100 * done / total if total else 100
+        print(f"\r{path}: {percent:.0f}%", end="\n" if done == total else "",
+              file=sys.stderr, flush=True)
+    return progress
+
+
+def _load_workloads(paths, show_progress=False):
+    if not paths:
+        return [("demo", _demo_workload())]
+    return [
+        (path, load_workload(path, progress=_report_progress(path) if show_progress else None))
+        for path in paths
     ]
 
-    scheduled_processes = fcfs_scheduling(processes)
 
-    print("PID | AT | BT | WT | TAT")
-    for p in scheduled_processes:
-        print(f"{p.pid}  | {p.arrival_time}  | {p.burst_time}  | {p.waiting_time}  | {p.turnaround_time}")
+def _open_output(stack, path):
+    if path is None:
+        return None
+    if path == "-":
+        return sys.stdout
+    return stack.enter_context(open(path, "w", newline="", encoding="utf-8"))
+
+
+def _runs(algorithm_names, quanta):
+    for algorithm_name in algorithm_names:
+        if algorithm_name in QUANTUM_ALGORITHMS:
+            for quantum in quanta:
+                yield algorithm_name, quantum
+        else:
+            yield algorithm_name, None
+
+
+def _parse_affinity(items):
+    affinity = {}
+    for item in items:
+        pid, separator, cpus = item.partition("=")
+        try:
+            if not separator or not pid:
+                raise ValueError
+            affinity[pid] = [int(cpu) for cpu in cpus.split(",")]
+        except ValueError:
+            raise ValueError(f"Affinity must look like PID=CPU[,CPU...], got {item!r}")
+    return affinity
+
+
+def simulate_workload(label, workload, algorithm_name, quantum,
+                      results=None, timeline=None, cpus=1, balancer="pull", affinity=None):
+    context = {"workload": label, "algorithm": algorithm_name, "quantum": quantum}
+    accumulator = MetricsAccumulator()
+
+    kernel = None
+    if cpus > 1 or affinity:
+        kernel = smp_kernel(algorithm_name, workload.copy(), cpus, quantum, balancer, affinity)
+        stream = kernel.stream()
+    else:
+        stream = stream_algorithm(algorithm_name, workload.copy(), quantum)
+
+    for kind, record in stream:
+        if kind == COMPLETE:
+            accumulator.add(record)
+            if results is not None:
+                results.write({**context, **result_record(record)})
+        elif kind == SEGMENT and timeline is not None:
+            cpu = 0
+            if kernel is not None:
+                cpu, record = record
+            pid, start, end = record
+            timeline.write({**context, "cpu": cpu, "pid": pid, "start": start, "end": end})
+
+    summary = accumulator.summary()
+    if kernel is not None:
+        smp_summary(summary, kernel.stats)
+        summary["core_util"] = " ".join(f"{util:.2f}" for util in summary["core_util"])
+    else:
+        summary.update(cpus=1, migrations=0, core_util=f"{summary['cpu_util']:.2f}")
+    return {**context, "processes": accumulator.count, **summary}
+
+
+def run_command(args):
+    algorithm_names = [resolve_algorithm(name) for name in args.algorithms] or ALGORITHMS
+    if args.cpus < 1:
+        raise ValueError("CPU count must be a positive integer")
+    affinity = _parse_affinity(args.affinity)
+    targets = [args.results, args.timeline, args.summary]
+    if targets.count("-") > 1:
+        raise ValueError("Only one of --results, --timeline and --summary can write to stdout")
+    workloads = _load_workloads(args.workloads, args.progress)
+
+    with ExitStack() as stack:
+        results_file = _open_output(stack, args.results)
+        timeline_file = _open_output(stack, args.timeline)
+        if args.summary is None:
+            summary_file = sys.stderr if "-" in targets else sys.stdout
+        else:
+            summary_file = _open_output(stack, args.summary)
+
+        results = RecordWriter(results_file, RESULT_FIELDS, args.format) if results_file else None
+        timeline = RecordWriter(timeline_file, TIMELINE_FIELDS, args.format) if timeline_file else None
+        summary = RecordWriter(summary_file, SUMMARY_FIELDS, args.format)
+
+        for label, workload in workloads:
+            for algorithm_name, quantum in _runs(algorithm_names, args.quantum):
+                row = simulate_workload(label, workload, algorithm_name, quantum,
+                                        results=results, timeline=timeline, cpus=args.cpus,
+                                        balancer=args.balancer, affinity=affinity)
+                summary.write(row)
+                summary_file.flush()
+    return 0
+
+
+def compare_command(args):
+    for label, workload in _load_workloads(args.workloads, args.progress):
+        print(f"Workload: {label} ({len(workload)} processes)")
+        print("Algorithm | Avg WT | P95 WT | P99 WT | Avg TAT | P99 TAT")
+        for algorithm_name, metrics, error in iter_comparison(
+                workload, quantum=args.quantum, max_workers=args.workers):
+            if error is not None:
+                print(f"{algorithm_name} | N/A | {error}")
+                continue
+            print(f"{algorithm_name} | {metrics['avg_wt']:.2f} | {metrics['p95_wt']} | "
+                  f"{metrics['p99_wt']} | {metrics['avg_tat']:.2f} | {metrics['p99_tat']}")
+    return 0
+
+
+def sweep_command(args):
+    quanta = parse_quanta(",".join(args.quanta))
+    with ExitStack() as stack:
+        output_file = _open_output(stack, args.output)
+        output = RecordWriter(output_file, SWEEP_FIELDS, args.format)
+        for label, workload in _load_workloads(args.workloads, args.progress):
+            rows = sweep(workload, quanta, max_workers=args.workers)
+            best, metrics = best_quantum(rows, args.objective)
+            for quantum, row in rows:
+                output.write({"workload": label, "quantum": quantum,
+                              "best": quantum == best, **row})
+            output_file.flush()
+            print(f"{label}: best quantum {best} "
+                  f"({args.objective} = {metrics[args.objective]})", file=sys.stderr)
+    return 0
+
+
+def _parse_params(items):
+    params = {}
+    for item in items:
+        key, separator, value = item.partition("=")
+        if not separator or not key:
+            raise ValueError(f"Workload parameter must look like KEY=VALUE: {item}")
+        try:
+            params[key] = int(value)
+        except ValueError:
+            try:
+                params[key] = float(value)
+            except ValueError:
+                raise ValueError(f"Workload parameter {key} must be a number")
+    return params
+
+
+def experiment_command(args):
+    algorithm_names = [resolve_algorithm(name) for name in args.algorithms] or ALGORITHMS
+    summary = ExperimentSummary(args.confidence)
+    records = iter_experiment(
+        args.trials, args.kind, args.size, algorithm_names,
+        quantum=args.quantum, seed=args.seed, params=_parse_params(args.param),
+        max_workers=args.workers,
+        progress=_report_progress("trials") if args.progress else None)
+
+    with ExitStack() as stack:
+        trials_file = _open_output(stack, args.trials_output)
+        summary_file = _open_output(stack, args.summary)
+        trials = RecordWriter(trials_file, TRIAL_FIELDS, args.format) if trials_file else None
+        try:
+            for record in records:
+                summary.add(record)
+                if trials is not None:
+                    trials.write(record)
+        finally:
+            records.close()
+
+        output = RecordWriter(summary_file, EXPERIMENT_SUMMARY_FIELDS, args.format)
+        for row in summary.rows():
+            output.write(row)
+    return 0
+
+
+def convert_command(args):
+    workload = load_workload(args.source, progress=_report_progress(args.source) if args.progress else None)
+    timeline = None
+    if args.timeline:
+        algorithm_name = resolve_algorithm(args.timeline)
+        _, timeline = run_algorithm(algorithm_name, workload.copy(), args.quantum)
+    save_trace(args.target, workload, timeline)
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Run the CPU scheduling simulator without the GUI.")
+    subparsers = parser.add_subparsers(dest="command")
+
+    run_parser = subparsers.add_parser(
+        "run", help="simulate workload files and stream results")
+    run_parser.add_argument("workloads", nargs="*",
+                            help="CSV or JSON Lines workload files (default: built-in sample)")
+    run_parser.add_argument("-a", "--algorithms", nargs="+", default=[], metavar="NAME",
+                            help="algorithms to run, by name or alias: "
+                                 + ", ".join(ALGORITHM_ALIASES) + " (default: all)")
+    run_parser.add_argument("-q", "--quantum", type=int, nargs="+", default=[3],
+                            help="one or more Round Robin quanta (default: 3)")
+    run_parser.add_argument("--cpus", type=int, default=1,
+                            help="number of simulated CPUs, each with its own run queue (default: 1)")
+    run_parser.add_argument("--balancer", choices=BALANCERS, default="pull",
+                            help="how idle or overloaded CPUs rebalance work (default: pull)")
+    run_parser.add_argument("--affinity", action="append", default=[], metavar="PID=CPU[,CPU]",
+                            help="pin a process to the listed CPUs (repeatable)")
+    run_parser.add_argument("--results", metavar="PATH",
+                            help="write per-process results here ('-' for stdout)")
+    run_parser.add_argument("--timeline", metavar="PATH",
+                            help="write timeline segments here ('-' for stdout)")
+    run_parser.add_argument("--summary", metavar="PATH",
+                            help="write summary metrics here (default: stdout, or stderr "
+                                 "when results or timeline go to stdout)")
+    run_parser.add_argument("--format", choices=("csv", "jsonl"), default="csv")
+    run_parser.add_argument("--progress", action="store_true",
+                            help="report import progress on stderr")
+    run_parser.set_defaults(handler=run_command)
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="compare every algorithm on each workload")
+    compare_parser.add_argument("workloads", nargs="*",
+                                help="CSV or JSON Lines workload files (default: built-in sample)")
+    compare_parser.add_argument("--quantum", type=int, default=3,
+                                help="time quantum for Round Robin (default: 3)")
+    compare_parser.add_argument("--workers", type=int, default=None,
+                                help="worker processes for the comparison (default: one per CPU)")
+    compare_parser.add_argument("--progress", action="store_true",
+                                help="report import progress on stderr")
+    compare_parser.set_defaults(handler=compare_command)
+
+    sweep_parser = subparsers.add_parser(
+        "sweep", help="run Round Robin across many quanta and report the best one")
+    sweep_parser.add_argument("workloads", nargs="*",
+                              help="CSV or JSON Lines workload files (default: built-in sample)")
+    sweep_parser.add_argument("-q", "--quanta", nargs="+", default=["1-20"], metavar="SPEC",
+                              help="quanta as values and ranges, e.g. 1-20 32 64-256:64 "
+                                   "(default: 1-20)")
+    sweep_parser.add_argument("--objective", choices=list(SWEEP_OBJECTIVES), default="p99_wt",
+                              help="metric to minimize when picking the best quantum "
+                                   "(default: p99_wt)")
+    sweep_parser.add_argument("--workers", type=int, default=None,
+                              help="worker processes for the sweep (default: one per CPU)")
+    sweep_parser.add_argument("--output", metavar="PATH", default="-",
+                              help="write one record per quantum here (default: stdout)")
+    sweep_parser.add_argument("--format", choices=("csv", "jsonl"), default="csv")
+    sweep_parser.add_argument("--progress", action="store_true",
+                              help="report import progress on stderr")
+    sweep_parser.set_defaults(handler=sweep_command)
+
+    experiment_parser = subparsers.add_parser(
+        "experiment", help="run algorithms over many seeded random workloads")
+    experiment_parser.add_argument("-n", "--trials", type=int, default=1000,
+                                   help="number of random workloads (default: 1000)")
+    experiment_parser.add_argument("--kind", choices=list(WORKLOAD_KINDS), default="uniform",
+                                   help="workload distribution (default: uniform)")
+    experiment_parser.add_argument("--size", type=int, default=100,
+                                   help="processes per workload (default: 100)")
+    experiment_parser.add_argument("--param", action="append", default=[], metavar="KEY=VALUE",
+                                   help="distribution parameter, e.g. load=0.9 or max_burst=50")
+    experiment_parser.add_argument("-a", "--algorithms", nargs="+", default=[], metavar="NAME",
+                                   help="algorithms to run, by name or alias (default: all)")
+    experiment_parser.add_argument("-q", "--quantum", type=int, default=3,
+                                   help="time quantum for Round Robin (default: 3)")
+    experiment_parser.add_argument("--seed", type=int, default=0,
+                                   help="experiment seed; trial i uses workload seed SEED/i")
+    experiment_parser.add_argument("--workers", type=int, default=None,
+                                   help="worker processes (default: one per CPU)")
+    experiment_parser.add_argument("--confidence", type=float, default=0.95,
+                                   help="confidence level of the intervals (default: 0.95)")
+    experiment_parser.add_argument("--trials-output", metavar="PATH",
+                                   help="stream one record per trial and algorithm here")
+    experiment_parser.add_argument("--summary", metavar="PATH", default="-",
+                                   help="write aggregated metrics here (default: stdout)")
+    experiment_parser.add_argument("--format", choices=("csv", "jsonl"), default="csv")
+    experiment_parser.add_argument("--progress", action="store_true",
+                                   help="report trial progress on stderr")
+    experiment_parser.set_defaults(handler=experiment_command)
+
+    convert_parser = subparsers.add_parser(
+        "convert", help="convert a workload file to the binary trace format")
+    convert_parser.add_argument("source", help="CSV, JSON Lines or trace file to read")
+    convert_parser.add_argument("target", help="trace file to write (.sched)")
+    convert_parser.add_argument("--timeline", metavar="NAME",
+                                help="also store the timeline of this algorithm")
+    convert_parser.add_argument("--quantum", type=int, default=3,
+                                help="time quantum for Round Robin (default: 3)")
+    convert_parser.add_argument("--progress", action="store_true",
+                                help="report import progress on stderr")
+    convert_parser.set_defaults(handler=convert_command)
+
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command is None:
+        args = parser.parse_args(["compare"])
+
+    try:
+        return args.handler(args)
+    except BrokenPipeError:
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 1
+    except (OSError, ValueError) as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 2
+
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,16 @@
+from algorithms.cfs import TARGET_LATENCY, cfs_scheduling
+from core.process import Process
+
+
+def test_running_task_yields_to_new_arrivals():
+    processes = [Process("A", 0, 30, 0), Process("B", 1, 30, 0), Process("C", 1, 30, 0)]
+    result, timeline = cfs_scheduling(processes)
+    assert timeline[:3] == [("A", 0, 8), ("B", 8, 16), ("C", 16, 24)]
+
+
+def test_arrivals_are_served_within_target_latency():
+    processes = [Process("A", 0, 100, 0)]
+    processes += [Process(f"P{i}", 1, 30, 0) for i in range(1, 6)]
+    result, timeline = cfs_scheduling(processes)
+    for p in result:
+        assert p.start_time - p.arrival_time <= TARGET_LATENCY, p.pid
@@ -0,0 +1,29 @@
+from algorithms.registry import run_smp
+from core.process import Process
+
+
+def pinned_workload():
+    bursts = [("A", 100), ("B", 100), ("C", 100), ("D", 100), ("E", 1),
+              ("F", 100), ("G", 1), ("H", 100), ("I", 1)]
+    return [Process(pid, 0, burst, 0) for pid, burst in bursts]
+
+
+def test_balancers_skip_pinned_tasks():
+    affinity = {"A": [0], "B": [0], "C": [0]}
+    for balancer in ("pull", "push", "steal"):
+        result, lanes, stats = run_smp(
+            "FCFS", pinned_workload(), 3, balancer=balancer, affinity=affinity)
+        assert stats["migrations"] == 1, balancer
+        assert stats["busy_time"] == [300, 200, 103], balancer
+        assert all(pid in ("A", "B", "C") for pid, _, _ in lanes[0]), balancer
+        assert ("H", 3, 103) in lanes[2] or ("H", 10, 110) in lanes[2], balancer
+
+
+def test_idle_cpu_retries_pull():
+    processes = [Process("Y", 0, 50, 0), Process("X", 0, 2, 0), Process("A", 0, 50, 0)]
+    result, lanes, stats = run_smp(
+        "Round Robin", processes, 2, 5, balancer="pull", affinity={"A": [0]},
+        balance_interval=7)
+    assert stats["migrations"] == 1
+    assert lanes[1][1][0] == "Y"
+    assert max(p.completion_time for p in result) < 100